@@ -0,0 +1,112 @@
+""" 벤치마크용 오프라인 응답 픽스처 로더
+
+benchmarks/fixtures/manifest.json 에 기록된 응답(상태 코드, 헤더, 쿠키, 본문 파일, etc)을
+biblebot.reqeust.Response 로 복원한다. 파서는 Response 에 soup, alerts 등을 캐시하므로
+반복 측정할 때는 Fixture.response() 로 매번 새 Response 를 생성할 것.
+
+manifest 항목
+    name: 픽스처 이름 ("intranet.Chapel" 등)
+    parser: 파서 클래스 경로 ("biblebot.api.intranet.Chapel")
+    method: 파싱 메서드 이름 (기본값 "parse")
+    expect: 기대하는 결과 ("resource", "error", "notice", "list")
+    status, url, headers, cookies: 응답 정보
+    body: fixtures 디렉터리 기준 본문 파일 경로
+    etc: fetch 단계에서 Response.etc 에 기록되는 값 (JSONSerializer 형식)
+    timings: 수집 당시 fetch, parse 시간(초) (biblebot.profiling 으로 저장한 픽스처에만 있음)
+"""
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+import importlib
+import json
+import os
+
+from biblebot.reqeust import Response
+from biblebot.api.base import ResourceData, ErrorData
+from biblebot.api.kbu import NoticeData
+from biblebot.api.serialize import JSONSerializer
+
+__all__ = (
+    "FIXTURE_DIR",
+    "Fixture",
+    "load_fixtures",
+)
+
+FIXTURE_DIR: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+_EXPECTED_TYPES: Dict[str, type] = {
+    "resource": ResourceData,
+    "error": ErrorData,
+    "notice": NoticeData,
+    "list": list,
+}
+
+
+@dataclass
+class Fixture:
+    name: str
+    parser: str
+    body: str
+    url: str
+    status: int = 200
+    method: str = "parse"
+    expect: str = "resource"
+    headers: Dict[str, str] = field(default_factory=dict)
+    cookies: Dict[str, str] = field(default_factory=dict)
+    etc: Dict[str, Any] = field(default_factory=dict)
+    timings: Dict[str, Optional[float]] = field(default_factory=dict)
+    raw: bytes = field(default=b"", repr=False)
+    text: str = field(default="", repr=False)
+
+    @classmethod
+    def from_entry(cls, entry: Dict[str, Any], directory: str = FIXTURE_DIR):
+        entry = dict(entry)
+        entry["etc"] = JSONSerializer.loads(json.dumps(entry.get("etc", {})))
+        fixture = cls(**entry)
+        with open(os.path.join(directory, fixture.body), "rb") as f:
+            fixture.raw = f.read()
+        try:
+            fixture.text = fixture.raw.decode("utf-8")
+        except UnicodeDecodeError:
+            # aiohttp 커넥터와 같이 디코딩할 수 없는 본문(이미지)은 빈 문자열
+            fixture.text = ""
+        return fixture
+
+    @property
+    def size(self) -> int:
+        return len(self.raw)
+
+    def response(self) -> Response:
+        """ 캐시(soup, alerts, etc)가 없는 새 Response """
+        response = Response(
+            self.status,
+            self.url,
+            "",
+            dict(self.headers),
+            self.raw,
+            self.text,
+            dict(self.cookies),
+        )
+        response.etc.update(JSONSerializer.loads(JSONSerializer.dumps(self.etc)))
+        return response
+
+    def load_parser(self) -> Callable[[Response], Any]:
+        module_name, class_name = self.parser.rsplit(".", 1)
+        parser = getattr(importlib.import_module(module_name), class_name)
+        return getattr(parser, self.method)
+
+    def check(self, result: Any) -> bool:
+        """ 파싱 결과가 manifest 의 expect 와 일치하는지 """
+        return isinstance(result, _EXPECTED_TYPES[self.expect])
+
+
+def load_fixtures(
+    directory: str = FIXTURE_DIR, name_filter: Optional[str] = None
+) -> List[Fixture]:
+    """ manifest.json 의 픽스처 목록, name_filter 가 있으면 이름에 포함된 것만 """
+    with open(os.path.join(directory, "manifest.json"), encoding="utf-8") as f:
+        manifest = json.load(f)
+    return [
+        Fixture.from_entry(entry, directory)
+        for entry in manifest
+        if not name_filter or name_filter in entry["name"]
+    ]
@@ -0,0 +1,65 @@
+""" 결과 타입 메모리 벤치마크
+
+dataclass 결과 타입(NoticeData, ResourceData 등)과 biblebot.api.compact 의 NamedTuple 타입을
+같은 개수만큼 메모리에 보관했을 때 할당되는 메모리를 tracemalloc 으로 비교한다.
+
+    $ python benchmarks/bench_compact_memory.py
+"""
+import datetime
+import gc
+import tracemalloc
+
+from biblebot.api.base import ResourceData, SemesterData
+from biblebot.api.kbu import NoticeData
+from biblebot.api.compact import compact
+
+N_NOTICES = 10_000
+N_SNAPSHOTS = 2_000
+N_ROWS = 20
+
+
+def _notices():
+    date = datetime.datetime(2020, 7, 31, 9, 0)
+    return [
+        NoticeData(f"공지 {i}", "장성희", date, "본문", f"https://www.bible.ac.kr/{i}")
+        for i in range(N_NOTICES)
+    ]
+
+
+def _snapshots():
+    return [
+        ResourceData(
+            data={
+                "head": ["강좌코드", "강좌명", "이수구분", "학점"],
+                "body": [[f"GE{i}-{r}", "경건훈련", "기초공통필수", "0"] for r in range(N_ROWS)],
+            },
+            link="https://kbuis.bible.ac.kr/GradeMng/GD095.aspx",
+            meta={"semester": SemesterData("20201", ["20201", "20192"])},
+        )
+        for i in range(N_SNAPSHOTS)
+    ]
+
+
+def measure(factory):
+    gc.collect()
+    tracemalloc.start()
+    objects = factory()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return size
+
+
+def main():
+    cases = (
+        ("NoticeData", _notices, lambda: [compact(each) for each in _notices()]),
+        ("ResourceData(table)", _snapshots, lambda: [compact(each) for each in _snapshots()]),
+    )
+    print(f"{'type':<22} {'dataclass':>12} {'compact':>12} {'ratio':>7}")
+    for name, original, compacted in cases:
+        old, new = measure(original), measure(compacted)
+        print(f"{name:<22} {old / 1024:>9.0f} KiB {new / 1024:>9.0f} KiB {new / old:>7.2f}")
+
+
+if __name__ == "__main__":
+    main()
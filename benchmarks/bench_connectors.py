@@ -0,0 +1,126 @@
+""" 커넥터 벤치마크
+
+모의 업스트림 서버(benchmarks/mock_server.py)에 같은 요청을 동시에 보내 커넥터별 처리량(req/s)과
+지연 시간 분포(p50/p90/p99)를 비교한다. 요청만 측정하며 파싱은 하지 않는다.
+
+모의 서버는 HTTP/1.1 만 지원하므로 httpx 커넥터는 HTTP/1.1 keep-alive 연결 재사용만 비교된다.
+HTTP/2 multiplexing 을 비교하려면 HTTP/2(TLS ALPN)를 지원하는 서버를 --server 로 지정할 것.
+
+    $ python benchmarks/bench_connectors.py
+    $ python benchmarks/bench_connectors.py --connector aiohttp --connector httpx --requests 2000 --concurrency 100
+    $ python benchmarks/bench_connectors.py --url https://www.bible.ac.kr/ko/life/notice/list/1 --delay 0.05
+"""
+from typing import Dict, List, Optional, Type
+import argparse
+import asyncio
+import collections
+import importlib
+import time
+
+from biblebot.reqeust import BaseRequest
+
+from bench_parsers import percentile
+from mock_server import MockUpstream, mock_connector, add_server_arguments
+
+CONNECTORS: Dict[str, str] = {
+    "aiohttp": "biblebot.reqeust.aiohttp_conn",
+    "requests": "biblebot.reqeust.requests_conn",
+    "httpx": "biblebot.reqeust.httpx_conn",
+}
+
+
+def _load(name: str) -> Optional[Type[BaseRequest]]:
+    try:
+        return importlib.import_module(CONNECTORS[name]).Request
+    except ImportError:
+        return None
+
+
+async def bench(
+    connector: Type[BaseRequest], url: str, requests: int, concurrency: int
+) -> Dict[str, float]:
+    timings: List[float] = []
+    failures: collections.Counter = collections.Counter()
+    remaining = iter(range(requests))
+
+    async def worker():
+        for _ in remaining:
+            start = time.perf_counter()
+            try:
+                await connector.get(url)
+            except Exception as e:
+                failures[type(e).__name__] += 1
+                continue
+            timings.append(time.perf_counter() - start)
+
+    # 연결 수립 비용을 제외하지 않도록 예열 없이 측정
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    close = getattr(connector, "close", None)
+    if close is not None:
+        await close()
+
+    timings.sort()
+    return {
+        "count": len(timings),
+        "rps": len(timings) / elapsed,
+        "p50": percentile(timings, 50) if timings else 0.0,
+        "p90": percentile(timings, 90) if timings else 0.0,
+        "p99": percentile(timings, 99) if timings else 0.0,
+        "failures": sum(failures.values()),
+    }
+
+
+async def run(args):
+    server: Optional[MockUpstream] = None
+    server_url = args.server
+    if server_url is None:
+        server = MockUpstream(
+            delay=args.delay,
+            slow_rate=args.slow_rate,
+            slow_delay=args.slow_delay,
+            overload_rate=args.overload_rate,
+            seed=args.seed,
+        )
+        server_url = await server.start()
+
+    print(f"{'connector':<12}{'count':>8}{'req/s':>10}{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}  failures")
+    try:
+        for name in args.connector or CONNECTORS:
+            base = _load(name)
+            if base is None:
+                print(f"{name:<12}  (패키지가 설치되지 않음)")
+                continue
+            stats = await bench(
+                mock_connector(base, server_url), args.url, args.requests, args.concurrency
+            )
+            print(
+                f"{name:<12}{stats['count']:>8}{stats['rps']:>10.1f}{stats['p50'] * 1000:>10.2f}"
+                f"{stats['p90'] * 1000:>10.2f}{stats['p99'] * 1000:>10.2f}  {stats['failures']}"
+            )
+    finally:
+        if server is not None:
+            await server.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="biblebot 커넥터 벤치마크")
+    parser.add_argument("--server", default=None, help="실행 중인 모의 서버 URL")
+    parser.add_argument(
+        "--connector", action="append", choices=tuple(CONNECTORS), help="비교할 커넥터 (반복 지정 가능)"
+    )
+    parser.add_argument(
+        "--url",
+        default="https://www.bible.ac.kr/ko/life/notice/list/1",
+        help="요청할 URL (모의 서버로 전달됨)",
+    )
+    parser.add_argument("--requests", type=int, default=1000, help="커넥터별 요청 수")
+    parser.add_argument("--concurrency", type=int, default=50, help="동시 요청 수")
+    add_server_arguments(parser)
+    args = parser.parse_args(argv)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+""" import 시간 벤치마크
+
+새 인터프리터에서 `import biblebot`, `from biblebot import IntranetAPI` 에 걸리는 시간을 반복 측정하고
+(인터프리터 시작 시간은 제외), import 직후에 무거운 모듈(bs4, aiohttp, requests, 사용하지 않는 API 모듈 등)을
+가져오지 않았는지 확인한다.
+기준을 넘거나 지연 로딩이 깨지면 0 이 아닌 종료 코드를 반환하므로 CI 에서 회귀 방지용으로 사용할 수 있다.
+
+    $ python benchmarks/bench_import.py
+    $ python benchmarks/bench_import.py --repeat 20 --budget 80
+    $ python benchmarks/bench_import.py --statement "from biblebot import IntranetAPI"
+"""
+from typing import Dict, List, Optional, Tuple
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+# `import biblebot` 만으로는 가져오면 안 되는 모듈
+LAZY_MODULES = (
+    "bs4",
+    "aiohttp",
+    "requests",
+    "multiprocessing",
+    "biblebot.reqeust.aiohttp_conn",
+    "biblebot.reqeust.requests_conn",
+    "biblebot.api.intranet",
+    "biblebot.api.lms",
+    "biblebot.api.kbu",
+    "biblebot.api.mileage",
+    "biblebot.api.library",
+)
+
+# 기본으로 측정할 import 문 -> LAZY_MODULES 중 가져와도 되는 모듈
+STATEMENTS: Dict[str, Tuple[str, ...]] = {
+    "import biblebot": (),
+    # 로그인만 하는 워커도 DOM(bs4)과 커넥터를 가져오지 않아야 함
+    "from biblebot import IntranetAPI": ("biblebot.api.intranet",),
+}
+
+_PROBE = """
+import sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"elapsed": elapsed, "modules": sorted(sys.modules)}}))
+"""
+
+
+def _root() -> str:
+    return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def measure(statement: str) -> dict:
+    """ 새 인터프리터에서 statement 실행 시간(초)과 실행 후 sys.modules """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, (_root(), env.get("PYTHONPATH"))))
+    output = subprocess.run(
+        [sys.executable, "-c", "import json\n" + _PROBE.format(statement=statement)],
+        check=True,
+        stdout=subprocess.PIPE,
+        env=env,
+    ).stdout
+    return json.loads(output)
+
+
+def run(statement: str, repeat: int, budget: Optional[float]) -> int:
+    timings: List[float] = []
+    modules: List[str] = []
+    for _ in range(repeat):
+        result = measure(statement)
+        timings.append(result["elapsed"])
+        modules = result["modules"]
+    timings.sort()
+
+    p50 = statistics.median(timings) * 1000
+    print(
+        f"{statement}: p50 {p50:.1f}ms, min {timings[0] * 1000:.1f}ms, "
+        f"max {timings[-1] * 1000:.1f}ms ({repeat}회)"
+    )
+    status = 0
+    if statement in STATEMENTS:
+        allowed = STATEMENTS[statement]
+        loaded = [name for name in LAZY_MODULES if name in modules and name not in allowed]
+        if loaded:
+            print("지연 로딩되어야 하는 모듈을 가져왔습니다: " + ", ".join(loaded), file=sys.stderr)
+            status = 1
+    if budget is not None and p50 > budget:
+        print(f"기준 시간 {budget:.1f}ms 를 넘었습니다.", file=sys.stderr)
+        status = 1
+    return status
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="biblebot import 시간 벤치마크")
+    parser.add_argument("--repeat", type=int, default=10, help="반복 횟수")
+    parser.add_argument(
+        "--statement",
+        action="append",
+        help="측정할 import 문 (반복 지정 가능, 생략하면 STATEMENTS 전체)",
+    )
+    parser.add_argument("--budget", type=float, default=None, help="import 문별 p50 기준 시간(ms), 넘으면 실패")
+    args = parser.parse_args(argv)
+
+    status = 0
+    for statement in args.statement or STATEMENTS:
+        status |= run(statement, args.repeat, args.budget)
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
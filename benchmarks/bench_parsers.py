@@ -0,0 +1,153 @@
+""" 파서 오프라인 벤치마크
+
+benchmarks/fixtures 의 녹화된 응답(로그인 성공/실패, 세션 만료, 503 과부하, 테이블, 이미지, 마일리지 XML 등)을
+네트워크 없이 파싱하여 픽스처마다 지연 시간 분포(p50/p90/p99)와 메모리 사용량을 측정한다.
+측정 시간에는 soup 생성 시간이 포함되며, 반복마다 캐시가 없는 새 Response 를 사용한다.
+
+- peak: 파싱 한 번에 tracemalloc 으로 측정한 최대 할당량
+- retained: 파싱이 끝난 뒤 Response 와 결과가 붙잡고 있는 메모리 (soup 캐시 포함)
+
+    $ python benchmarks/bench_parsers.py
+    $ python benchmarks/bench_parsers.py --filter intranet --repeat 500
+    $ python benchmarks/bench_parsers.py --features lxml --json lxml.json
+    $ python benchmarks/bench_parsers.py --json after.json --compare before.json
+    $ python benchmarks/bench_parsers.py --directory slow-responses  # biblebot.profiling 으로 수집한 응답
+"""
+from typing import Any, Dict, List
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+import warnings
+
+import bs4
+
+import biblebot
+from biblebot.reqeust import Response
+
+from _fixtures import FIXTURE_DIR, Fixture, load_fixtures
+
+try:
+    warnings.filterwarnings("ignore", category=bs4.XMLParsedAsHTMLWarning)
+except AttributeError:
+    pass
+
+
+def percentile(ordered: List[float], p: float) -> float:
+    index = min(len(ordered) - 1, max(0, round(p / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def _measure_memory(fixture: Fixture, parse) -> Dict[str, int]:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        response = fixture.response()
+        result = parse(response)
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del response, result
+    return {"peak": peak - before, "retained": retained - before}
+
+
+def bench(fixture: Fixture, repeat: int) -> Dict[str, Any]:
+    parse = fixture.load_parser()
+    result = parse(fixture.response())
+    if not fixture.check(result):
+        raise AssertionError(
+            f"{fixture.name}: {fixture.expect} 이(가) 아닌 {type(result).__name__} 을(를) 반환했습니다."
+        )
+
+    timings: List[float] = []
+    for _ in range(repeat):
+        response = fixture.response()
+        start = time.perf_counter()
+        parse(response)
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+
+    stats = {
+        "size": fixture.size,
+        "p50": percentile(timings, 50),
+        "p90": percentile(timings, 90),
+        "p99": percentile(timings, 99),
+    }
+    stats.update(_measure_memory(fixture, parse))
+    return stats
+
+
+def environment() -> Dict[str, str]:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "biblebot": biblebot.__version__,
+        "bs4": bs4.__version__,
+        "features": Response.SOUP_FEATURES,
+    }
+
+
+def _print_report(results: Dict[str, Dict[str, Any]], baseline: Dict[str, Any]):
+    previous = baseline.get("results", {})
+    print(
+        f"{'fixture':<38}{'size':>9}{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}"
+        f"{'peak KiB':>11}{'kept KiB':>11}" + ("  p50 vs base" if previous else "")
+    )
+    for name, stats in results.items():
+        line = (
+            f"{name:<38}{stats['size']:>9}"
+            f"{stats['p50'] * 1000:>10.3f}{stats['p90'] * 1000:>10.3f}{stats['p99'] * 1000:>10.3f}"
+            f"{stats['peak'] / 1024:>11.1f}{stats['retained'] / 1024:>11.1f}"
+        )
+        if name in previous:
+            line += f"  {stats['p50'] / previous[name]['p50']:>10.2f}x"
+        print(line)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="biblebot 파서 오프라인 벤치마크")
+    parser.add_argument("--repeat", type=int, default=200, help="픽스처별 반복 횟수")
+    parser.add_argument("--filter", default=None, help="이름에 포함된 픽스처만 실행")
+    parser.add_argument(
+        "--directory", default=FIXTURE_DIR, help="픽스처 디렉터리 (biblebot.profiling 으로 수집한 디렉터리 등)"
+    )
+    parser.add_argument(
+        "--features", default=None, help="BeautifulSoup 파서 (html.parser, lxml, html5lib)"
+    )
+    parser.add_argument("--json", default=None, help="결과를 저장할 JSON 파일")
+    parser.add_argument("--compare", default=None, help="비교할 기준 결과 JSON 파일")
+    args = parser.parse_args(argv)
+
+    if args.features:
+        Response.SOUP_FEATURES = args.features
+
+    baseline: Dict[str, Any] = {}
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    env = environment()
+    print(", ".join(f"{key} {value}" for key, value in env.items()))
+    if baseline:
+        print("기준: " + ", ".join(f"{k} {v}" for k, v in baseline["environment"].items()))
+
+    fixtures = load_fixtures(args.directory, args.filter)
+    if not fixtures:
+        print("실행할 픽스처가 없습니다.", file=sys.stderr)
+        return 1
+
+    results = {each.name: bench(each, args.repeat) for each in fixtures}
+    _print_report(results, baseline)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"environment": env, "results": results}, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
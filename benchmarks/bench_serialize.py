@@ -0,0 +1,89 @@
+""" 직렬화 처리량 벤치마크
+
+인트라넷 강의 테이블, 공지사항 목록, 학생 사진(bytes)을 담은 결과를 직렬화/역직렬화하여
+초당 처리 개수를 비교한다.
+
+- asdict+json: dataclasses.asdict 후 json.dumps(default=str), 원래 타입으로 복원되지 않음 (기준값)
+- JSONSerializer / MsgpackSerializer: biblebot.api.serialize
+- pickle: 참고용
+
+    $ python benchmarks/bench_serialize.py
+"""
+from dataclasses import asdict
+import datetime
+import json
+import pickle
+import timeit
+
+from biblebot.api.base import ResourceData, SemesterData
+from biblebot.api.kbu import NoticeData
+from biblebot.api.serialize import JSONSerializer, MsgpackSerializer, msgpack
+
+NUMBER = 500
+
+PAYLOADS = {
+    "course table": ResourceData(
+        data={
+            "head": ["강좌코드", "강좌명", "이수구분", "학점", "교수명", "강의시간", "선택", "비고"],
+            "body": [
+                [f"IC{i:03}-A", "빅데이터기술", "전공선택", "3", "양혜경", "(월)13:30~14:45", "", "NO"]
+                for i in range(200)
+            ],
+        },
+        link="https://kbuis.bible.ac.kr/GradeMng/GD095.aspx",
+        meta={"semester": SemesterData("20201", ["20201", "20192", "20191"])},
+    ),
+    "notices": [
+        NoticeData(
+            f"[학적] 공지 {i}", "김희", datetime.datetime(2020, 7, 30, 9), "본문" * 50, "u"
+        )
+        for i in range(100)
+    ],
+    "student photo": ResourceData(
+        data={"raw_image": bytes(range(256)) * 256},
+        link="https://kbuis.bible.ac.kr/SchoolRegMng/SR015.aspx",
+    ),
+}
+
+
+def _asdict_json(obj):
+    if isinstance(obj, list):
+        return json.dumps([asdict(each) for each in obj], default=str)
+    return json.dumps(asdict(obj), default=str)
+
+
+def _out_of_band(serializer):
+    def run(obj):
+        buffers = []
+        return serializer.loads(serializer.dumps(obj, buffers), buffers)
+
+    return run
+
+
+def main():
+    cases = {
+        "asdict+json (dumps)": _asdict_json,
+        "JSONSerializer": lambda obj: JSONSerializer.loads(JSONSerializer.dumps(obj)),
+        "JSONSerializer (oob)": _out_of_band(JSONSerializer),
+        "pickle": lambda obj: pickle.loads(pickle.dumps(obj)),
+    }
+    if msgpack is not None:
+        cases["MsgpackSerializer"] = lambda obj: MsgpackSerializer.loads(
+            MsgpackSerializer.dumps(obj)
+        )
+        cases["MsgpackSerializer (oob)"] = _out_of_band(MsgpackSerializer)
+
+    for name, payload in PAYLOADS.items():
+        assert JSONSerializer.loads(JSONSerializer.dumps(payload)) == payload
+        print(f"\n[{name}]")
+        for case, func in cases.items():
+            try:
+                seconds = timeit.timeit(lambda: func(payload), number=NUMBER)
+            except TypeError as e:
+                print(f"  {case:<26} 실패: {e}")
+                continue
+            print(f"  {case:<26} {NUMBER / seconds:>10.0f} ops/s")
+
+
+if __name__ == "__main__":
+    main()
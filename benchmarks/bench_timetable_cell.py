@@ -0,0 +1,41 @@
+""" 시간표 셀 해석 마이크로 벤치마크
+
+기존 방식(셀마다 re.match 두 번, 패턴은 re 모듈 캐시에서 조회)과
+미리 컴파일된 단일 문법(biblebot.api._patterns.match_timetable_cell)의 셀당 비용을 비교한다.
+
+    $ python benchmarks/bench_timetable_cell.py
+"""
+import re
+import timeit
+
+from biblebot.api._patterns import match_timetable_cell
+
+CELLS = (
+    "자료구조(A101)09:00~10:15",
+    "고급소프트웨어프로젝트(일립관 702)14:55 ~ 16:10",
+    "경건훈련12:00~12:30",
+    "전도훈련Ⅶ()13:30~15:20",
+)
+NUMBER = 200_000
+
+
+def legacy(td: str):
+    matching = re.match(
+        r"(.+)?\(([^(]*)?\)(\d{2}:\d{2})\s*~\s*([0-9:]{,5})", td
+    ) or re.match(r"(.+)?()(\d{2}:\d{2})\s*~\s*([0-9:]{,5})", td)
+    return matching.groups()
+
+
+def main():
+    for cell in CELLS:
+        assert legacy(cell) == match_timetable_cell(cell), cell
+
+    print(f"{'cell':<50} {'legacy':>12} {'compiled':>12}")
+    for cell in CELLS:
+        old = timeit.timeit(lambda: legacy(cell), number=NUMBER) / NUMBER
+        new = timeit.timeit(lambda: match_timetable_cell(cell), number=NUMBER) / NUMBER
+        print(f"{cell:<50} {old * 1e9:>9.0f} ns {new * 1e9:>9.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,245 @@
+""" 모의 업스트림 서버를 대상으로 하는 부하 테스트
+
+여러 가상 사용자가 동시에 HTTPClient.connector 로 로그인부터 조회(fetch + parse)까지의 시나리오를 반복하고,
+API 클래스별 처리량(ops/s)과 지연 시간 분포(p50/p90/p99/max), 실패(ErrorData, 예외) 횟수를 출력한다.
+
+--server 를 지정하지 않으면 같은 이벤트 루프에서 모의 서버(benchmarks/mock_server.py)를 실행한다.
+서버와 클라이언트가 CPU 를 나눠 쓰므로, 정확한 수치가 필요하면 서버를 별도 프로세스로 실행할 것.
+
+    $ python benchmarks/load_test.py --concurrency 50 --duration 10
+    $ python benchmarks/load_test.py --slow-rate 0.05 --slow-delay 2 --overload-rate 0.01
+    $ python benchmarks/mock_server.py --port 8080 &
+    $ python benchmarks/load_test.py --server http://127.0.0.1:8080 --connector requests
+
+--record 로 녹화한 응답을 --replay 로 재생하면 네트워크 없이 클라이언트(요청 처리, 파싱)의 CPU 처리량만 측정할 수 있다.
+
+    $ python benchmarks/load_test.py --duration 5 --record session.zip
+    $ python benchmarks/load_test.py --replay session.zip
+"""
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Type
+import argparse
+import asyncio
+import collections
+import random
+import time
+
+from biblebot.api import intranet, lms, kbu, library, mileage
+from biblebot.api.base import HTTPClient, ResourceData, ErrorData
+from biblebot.api._mileage import SearchParamData, StatementParamData
+from biblebot.reqeust import BaseRequest
+from biblebot.reqeust.replay_conn import Archive, record_connector, replay_connector
+
+from bench_parsers import percentile
+from mock_server import (
+    INVALID_PASSWORD,
+    MockUpstream,
+    mock_connector,
+    add_server_arguments,
+)
+
+# (API 이름, 지연 시간, 결과: "ok" | "error" | 예외 이름)
+Sample = Tuple[str, float, str]
+
+
+class _User:
+    """ 가상 사용자: API 호출마다 지연 시간과 결과를 기록 """
+
+    def __init__(self, samples: List[Sample], invalid_rate: float, parse_async: bool):
+        self.samples = samples
+        self.invalid_rate = invalid_rate
+        self.parse_async = parse_async
+
+    @property
+    def password(self) -> str:
+        if self.invalid_rate and random.random() < self.invalid_rate:
+            return INVALID_PASSWORD
+        return "password"
+
+    async def call(self, parser: Any, *args, **kwargs) -> Any:
+        name = f"{parser.__module__.rsplit('.', 1)[-1]}.{parser.__name__}"
+        start = time.perf_counter()
+        try:
+            response = await parser.fetch(*args, **kwargs)
+            if self.parse_async and hasattr(parser, "parse_async"):
+                result = await parser.parse_async(response)
+            else:
+                result = parser.parse(response)
+        except Exception as e:
+            self.samples.append((name, time.perf_counter() - start, type(e).__name__))
+            return None
+        outcome = "error" if isinstance(result, ErrorData) else "ok"
+        self.samples.append((name, time.perf_counter() - start, outcome))
+        return result
+
+    async def login(self, parser: Any) -> Optional[Dict[str, str]]:
+        result = await self.call(parser, "201504010", self.password)
+        if isinstance(result, ResourceData):
+            return result.data["cookies"]
+        return None
+
+
+async def _intranet(user: _User):
+    cookies = await user.login(intranet.Login)
+    if cookies is None:
+        return
+    for parser in (intranet.Chapel, intranet.Timetable, intranet.Course):
+        await user.call(parser, cookies)
+    await user.call(intranet.TotalAcceptanceStatus, cookies)
+    await user.call(intranet.StudentPhoto, cookies, "201504010")
+
+
+async def _lms(user: _User):
+    cookies = await user.login(lms.Login)
+    if cookies is None:
+        return
+    await user.call(lms.Profile, cookies)
+    await user.call(lms.CourseList, cookies)
+    await user.call(lms.Attendance, cookies, "1001")
+
+
+async def _kbu(user: _User):
+    await user.call(kbu.MainNotice, random.randint(1, 10))
+    await user.call(kbu.NoticeArticle, kbu.DOMAIN_NAME + "/ko/life/notice/view/46603")
+
+
+async def _library(user: _User):
+    cookies = await user.login(library.Login)
+    if cookies is None:
+        return
+    await user.call(library.CheckoutList, cookies)
+    detail = await user.call(library.BookDetail, "/Search/Detail/300000")
+    if detail and detail[1]:
+        await user.call(library.BookPhoto, detail[1])
+
+
+async def _mileage(user: _User):
+    cookies = await user.login(mileage.Login)
+    if cookies is None:
+        return
+    await user.call(mileage.Search, cookies, SearchParamData())
+    await user.call(mileage.Statement, cookies, StatementParamData())
+
+
+SCENARIOS: Dict[str, Callable[[_User], Awaitable[None]]] = {
+    "intranet": _intranet,
+    "lms": _lms,
+    "kbu": _kbu,
+    "library": _library,
+    "mileage": _mileage,
+}
+
+
+async def _worker(user: _User, scenarios: List[Callable], deadline: float):
+    while time.perf_counter() < deadline:
+        await random.choice(scenarios)(user)
+
+
+def _connector_class(name: str) -> Type[BaseRequest]:
+    if name == "requests":
+        from biblebot.reqeust.requests_conn import Request
+    elif name == "httpx":
+        from biblebot.reqeust.httpx_conn import Request
+    else:
+        from biblebot.reqeust.aiohttp_conn import Request
+    return Request
+
+
+def report(samples: List[Sample], elapsed: float):
+    grouped: Dict[str, List[Sample]] = collections.defaultdict(list)
+    for sample in samples:
+        grouped[sample[0]].append(sample)
+
+    print(
+        f"{'api':<30}{'count':>8}{'ops/s':>10}{'p50 ms':>10}{'p90 ms':>10}"
+        f"{'p99 ms':>10}{'max ms':>10}  failures"
+    )
+    for name in sorted(grouped):
+        each = grouped[name]
+        timings = sorted(latency for _, latency, _ in each)
+        failures = collections.Counter(outcome for _, _, outcome in each if outcome != "ok")
+        print(
+            f"{name:<30}{len(each):>8}{len(each) / elapsed:>10.1f}"
+            f"{percentile(timings, 50) * 1000:>10.1f}{percentile(timings, 90) * 1000:>10.1f}"
+            f"{percentile(timings, 99) * 1000:>10.1f}{timings[-1] * 1000:>10.1f}  "
+            + ", ".join(f"{k} {v}" for k, v in failures.items())
+        )
+    timings = sorted(latency for _, latency, _ in samples)
+    print(
+        f"\n전체 {len(samples)}건, {elapsed:.1f}초, {len(samples) / elapsed:.1f} ops/s, "
+        f"p50 {percentile(timings, 50) * 1000:.1f}ms, p99 {percentile(timings, 99) * 1000:.1f}ms"
+    )
+
+
+async def run(args) -> List[Sample]:
+    server: Optional[MockUpstream] = None
+    archive: Optional[Archive] = None
+    url = args.server
+    if url is None and args.replay is None:
+        server = MockUpstream(
+            delay=args.delay,
+            slow_rate=args.slow_rate,
+            slow_delay=args.slow_delay,
+            overload_rate=args.overload_rate,
+            seed=args.seed,
+        )
+        url = await server.start()
+
+    original = HTTPClient.connector
+    if args.replay is not None:
+        connector = replay_connector(Archive.load(args.replay))
+    else:
+        connector = mock_connector(_connector_class(args.connector), url)
+        if args.record is not None:
+            archive = Archive()
+            connector = record_connector(connector, archive)
+    HTTPClient.set(connector)
+    scenarios = [SCENARIOS[name] for name in args.scenario or SCENARIOS]
+    samples: List[Sample] = []
+    try:
+        users = [
+            _User(samples, args.invalid_rate, args.parse_async)
+            for _ in range(args.concurrency)
+        ]
+        start = time.perf_counter()
+        deadline = start + args.duration
+        await asyncio.gather(*(_worker(user, scenarios, deadline) for user in users))
+        elapsed = time.perf_counter() - start
+    finally:
+        HTTPClient.connector = original
+        close = getattr(connector, "close", None)
+        if close is not None:
+            await close()
+        if server is not None:
+            await server.close()
+        if archive is not None:
+            archive.save(args.record)
+
+    report(samples, elapsed)
+    if server is not None:
+        print("응답한 픽스처: " + ", ".join(f"{k} {v}" for k, v in sorted(server.served.items())))
+    return samples
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="biblebot 모의 서버 부하 테스트")
+    parser.add_argument("--server", default=None, help="실행 중인 모의 서버 URL")
+    parser.add_argument("--connector", choices=("aiohttp", "requests", "httpx"), default="aiohttp")
+    parser.add_argument("--concurrency", type=int, default=20, help="동시 사용자 수")
+    parser.add_argument("--duration", type=float, default=10.0, help="실행 시간(초)")
+    parser.add_argument(
+        "--scenario", action="append", choices=tuple(SCENARIOS), help="실행할 시나리오 (반복 지정 가능)"
+    )
+    parser.add_argument("--invalid-rate", type=float, default=0.0, help="로그인 실패 비율 (0~1)")
+    parser.add_argument("--parse-async", action="store_true", help="parse_async 로 파싱")
+    replay = parser.add_mutually_exclusive_group()
+    replay.add_argument("--record", default=None, help="응답을 녹화할 아카이브 파일")
+    replay.add_argument("--replay", default=None, help="녹화된 응답을 재생할 아카이브 파일 (서버 없이 실행)")
+    add_server_arguments(parser)
+    args = parser.parse_args(argv)
+    if args.seed is not None:
+        random.seed(args.seed)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,340 @@
+""" 부하 테스트용 로컬 모의(mock) 업스트림 서버
+
+학교 서버 대신 benchmarks/fixtures 의 녹화된 응답을 돌려주는 HTTP 서버 (aiohttp 필요)
+kbuis.bible.ac.kr, lms.bible.ac.kr, www.bible.ac.kr, lib.bible.ac.kr, asp.netusys.com 과
+도서 표지 이미지 서버의 API 클래스 URL 을 모두 처리한다.
+
+    https://kbuis.bible.ac.kr/GradeMng/GD095.aspx -> http://127.0.0.1:8080/kbuis.bible.ac.kr/GradeMng/GD095.aspx
+
+- 로그인: 비밀번호가 INVALID_PASSWORD 이면 로그인 실패 응답, 그렇지 않으면 세션 쿠키와 함께 성공 응답
+- 세션 만료: 사이트의 세션 쿠키 없이 요청하면 사이트별 세션 만료 응답 (302 리다이렉트, alert, <message>)
+- 과부하: overload_rate 확률로 503 응답
+- 지연: 모든 응답에 delay 초, slow_rate 확률로 slow_delay 초를 추가
+
+MockUpstream.connector() 로 기존 커넥터의 URL 을 모의 서버로 바꾸는 커넥터를 만들어 HTTPClient 에 설정한다.
+응답의 Response.url 은 원래 URL 로 유지된다.
+
+    $ python benchmarks/mock_server.py --port 8080 --slow-rate 0.05 --overload-rate 0.01
+"""
+from typing import Callable, Counter, Dict, List, Optional, Tuple, Type
+from base64 import b64decode
+from urllib.parse import urlsplit
+import argparse
+import asyncio
+import collections
+import random
+
+from aiohttp import web
+
+from biblebot.reqeust import BaseRequest, Response, HTTPRequestMethod
+
+from _fixtures import FIXTURE_DIR, Fixture, load_fixtures
+
+__all__ = (
+    "INVALID_PASSWORD",
+    "MockUpstream",
+    "mock_connector",
+)
+
+INVALID_PASSWORD: str = "invalid-password"
+
+# 호스트 -> (세션 쿠키 이름, 세션 만료 픽스처)
+_SESSIONS: Dict[str, Tuple[str, str]] = {
+    "kbuis.bible.ac.kr": ("ASP.NET_SessionId", "intranet.Course.session_expired"),
+    "lms.bible.ac.kr": ("MoodleSession", "lms.Profile.session_expired"),
+    "lib.bible.ac.kr": (".ASPXAUTH", "library.CheckoutList.session_expired"),
+    "asp.netusys.com": ("JSESSIONID", "mileage.Search.session_expired"),
+}
+
+_OVERLOAD_FIXTURE: str = "intranet.Login.overload"
+
+
+def _password(field: str, encoded: bool = False) -> Callable[[Dict[str, str]], bool]:
+    def is_invalid(form: Dict[str, str]) -> bool:
+        value = form.get(field, "")
+        if encoded:
+            value = b64decode(value.encode()).decode(errors="replace")
+        return value == INVALID_PASSWORD
+
+    return is_invalid
+
+
+def _login(success: str, failure: str, is_invalid) -> Callable:
+    return lambda form: failure if is_invalid(form) else success
+
+
+def _mileage_sheet(form: Dict[str, str]) -> str:
+    if form.get("S_CONTROLLER", "").endswith("_cst_info"):
+        return "mileage.Statement"
+    return "mileage.Search"
+
+
+class _Route:
+    def __init__(
+        self,
+        host: str,
+        path: str,
+        select: Callable[[Dict[str, str]], str],
+        *,
+        session: bool = True,
+    ):
+        self.host = host
+        self.path = path
+        self.select = select
+        # False 이면 세션 쿠키 없이 요청할 수 있는 경로 (로그인, 공개 페이지)
+        self.session = session
+
+    def match(self, host: str, path: str) -> bool:
+        if host != self.host:
+            return False
+        if self.path.endswith("/"):
+            return path.startswith(self.path)
+        return path == self.path
+
+
+def _fixed(name: str) -> Callable[[Dict[str, str]], str]:
+    return lambda form: name
+
+
+_ROUTES: List[_Route] = [
+    # 인트라넷: GET 은 로그인 폼, POST 는 로그인 결과
+    _Route(
+        "kbuis.bible.ac.kr",
+        "/ble_login3.aspx",
+        lambda form: _login(
+            "intranet.Login.success", "intranet.Login.failure", _password("Txt_2")
+        )(form)
+        if form
+        else "intranet.Login.form",
+        session=False,
+    ),
+    _Route("kbuis.bible.ac.kr", "/SchoolRegMng/SR015.aspx", _fixed("intranet.StudentPhoto")),
+    _Route("kbuis.bible.ac.kr", "/StudentMng/SM050.aspx", _fixed("intranet.Chapel")),
+    _Route("kbuis.bible.ac.kr", "/GradeMng/GD160.aspx", _fixed("intranet.Timetable")),
+    _Route("kbuis.bible.ac.kr", "/GradeMng/GD095.aspx", _fixed("intranet.Course")),
+    _Route("kbuis.bible.ac.kr", "/SchoolRegMng/SR050.aspx", _fixed("intranet.GraduationExam")),
+    _Route(
+        "kbuis.bible.ac.kr", "/GradeMng/GD010.aspx", _fixed("intranet.TotalAcceptanceStatus")
+    ),
+    _Route("kbuis.bible.ac.kr", "/SchoolRegMng/SR030.aspx", _fixed("intranet.Profile")),
+    # LMS
+    _Route(
+        "lms.bible.ac.kr",
+        "/login/index.php",
+        _login("lms.Login.success", "lms.Login.failure", _password("password")),
+        session=False,
+    ),
+    _Route("lms.bible.ac.kr", "/user/user_edit.php", _fixed("lms.Profile")),
+    _Route("lms.bible.ac.kr", "/local/ubion/user/index.php", _fixed("lms.CourseList")),
+    _Route("lms.bible.ac.kr", "/local/ubattendance/my_status.php", _fixed("lms.Attendance")),
+    # 학교 홈페이지 (로그인 없음)
+    _Route("www.bible.ac.kr", "/ko/life/notice/list/", _fixed("kbu.MainNotice")),
+    _Route("www.bible.ac.kr", "/ko/life/tuition_notice/list/", _fixed("kbu.MainNotice")),
+    _Route("www.bible.ac.kr", "/ko/illip/notice/list/", _fixed("kbu.MainNotice")),
+    _Route("www.bible.ac.kr", "/ko/life/notice/view/", _fixed("kbu.NoticeArticle")),
+    # 도서관
+    _Route(
+        "lib.bible.ac.kr",
+        "/Account/LogOn",
+        _login(
+            "library.Login.success",
+            "library.Login.failure",
+            _password("l_pass", encoded=True),
+        ),
+        session=False,
+    ),
+    _Route("lib.bible.ac.kr", "/MyLibrary", _fixed("library.CheckoutList")),
+    _Route(
+        "lib.bible.ac.kr", "/Search/Detail/", _fixed("library.BookDetail"), session=False
+    ),
+    _Route("bookthumb-phinf.pstatic.net", "/cover/", _fixed("library.BookPhoto")),
+    # 마일리지
+    _Route(
+        "asp.netusys.com",
+        "/login/login_check.jsp",
+        _login("mileage.Login.success", "mileage.Login.failure", _password("user_pwd")),
+        session=False,
+    ),
+    _Route("asp.netusys.com", "/ddd.sheetAction", _mileage_sheet),
+]
+
+_HOP_BY_HOP_HEADERS = frozenset(
+    ("date", "content-length", "transfer-encoding", "connection", "set-cookie")
+)
+
+
+class MockUpstream:
+    """ 녹화된 픽스처를 돌려주는 모의 업스트림 서버
+
+    served: 픽스처 이름별 응답 횟수
+    """
+
+    def __init__(
+        self,
+        *,
+        delay: float = 0.0,
+        slow_rate: float = 0.0,
+        slow_delay: float = 1.0,
+        overload_rate: float = 0.0,
+        seed: Optional[int] = None,
+    ):
+        self.delay = delay
+        self.slow_rate = slow_rate
+        self.slow_delay = slow_delay
+        self.overload_rate = overload_rate
+        self.served: Counter[str] = collections.Counter()
+        self.url: Optional[str] = None
+
+        self._random = random.Random(seed)
+        self._fixtures: Dict[str, Fixture] = {each.name: each for each in load_fixtures()}
+        form = Fixture.from_entry(
+            {
+                "name": "intranet.Login.form",
+                "parser": "biblebot.api.intranet.Login",
+                "body": "intranet/login_form.html",
+                "url": "https://kbuis.bible.ac.kr/ble_login3.aspx",
+                "headers": {"content-type": "text/html; charset=utf-8"},
+            },
+            FIXTURE_DIR,
+        )
+        self._fixtures[form.name] = form
+        self._runner: Optional[web.AppRunner] = None
+
+    def _find_route(self, host: str, path: str) -> Optional[_Route]:
+        for route in _ROUTES:
+            if route.match(host, path):
+                return route
+        return None
+
+    def _has_session(self, host: str, request: web.Request) -> bool:
+        session = _SESSIONS.get(host)
+        return session is None or session[0] in request.cookies
+
+    async def _handle(self, request: web.Request) -> web.StreamResponse:
+        host, _, path = request.match_info["target"].partition("/")
+        path = "/" + path
+        route = self._find_route(host, path)
+        if route is None:
+            return web.Response(status=404, text=f"등록되지 않은 경로입니다. -> {host}{path}")
+
+        form = dict(await request.post()) if request.method == "POST" else {}
+
+        delay = self.delay
+        if self.slow_rate and self._random.random() < self.slow_rate:
+            delay += self.slow_delay
+        if delay:
+            await asyncio.sleep(delay)
+
+        if self.overload_rate and self._random.random() < self.overload_rate:
+            name = _OVERLOAD_FIXTURE
+        elif route.session and not self._has_session(host, request):
+            name = _SESSIONS[host][1]
+        else:
+            name = route.select(form)
+
+        self.served[name] += 1
+        fixture = self._fixtures[name]
+        response = web.Response(
+            status=fixture.status,
+            body=fixture.raw,
+            headers={
+                key: value
+                for key, value in fixture.headers.items()
+                if key not in _HOP_BY_HOP_HEADERS
+            },
+        )
+        for key, value in fixture.cookies.items():
+            response.set_cookie(key, value)
+        return response
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_route("*", "/{target:.+}", self._handle)
+        return app
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """ 서버를 시작하고 기본 URL 을 반환 (port=0 이면 빈 포트를 사용) """
+        self._runner = web.AppRunner(self.app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://{host}:{port}"
+        return self.url
+
+    async def close(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> "MockUpstream":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    def connector(
+        self, base: Type[BaseRequest], url: Optional[str] = None
+    ) -> Type[BaseRequest]:
+        """ base 커넥터의 요청을 모의 서버(url, 기본값은 시작된 서버)로 보내는 커넥터 """
+        return mock_connector(base, url or self.url)
+
+
+def mock_connector(base: Type[BaseRequest], server_url: str) -> Type[BaseRequest]:
+    """ 요청 URL 의 scheme://host 를 server_url/host 로 바꾸는 커넥터 """
+    server_url = server_url.rstrip("/")
+
+    class MockConnector(base):
+        @classmethod
+        async def _request(cls, method: HTTPRequestMethod, url: str, **kwargs) -> Response:
+            parts = urlsplit(url)
+            target = f"{server_url}/{parts.netloc}{parts.path or '/'}"
+            if parts.query:
+                target = f"{target}?{parts.query}"
+            response = await super()._request(method, target, **kwargs)
+            response.url = url
+            return response
+
+    MockConnector.__name__ = MockConnector.__qualname__ = f"Mock{base.__name__}"
+    return MockConnector
+
+
+async def _serve(args):
+    server = MockUpstream(
+        delay=args.delay,
+        slow_rate=args.slow_rate,
+        slow_delay=args.slow_delay,
+        overload_rate=args.overload_rate,
+        seed=args.seed,
+    )
+    url = await server.start(args.host, args.port)
+    print(f"모의 서버 실행 중: {url} (Ctrl+C 로 종료)")
+    try:
+        while True:
+            await asyncio.sleep(3600)
+    finally:
+        await server.close()
+
+
+def add_server_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument("--delay", type=float, default=0.0, help="모든 응답의 지연 시간(초)")
+    parser.add_argument("--slow-rate", type=float, default=0.0, help="느린 응답 비율 (0~1)")
+    parser.add_argument("--slow-delay", type=float, default=1.0, help="느린 응답의 추가 지연(초)")
+    parser.add_argument("--overload-rate", type=float, default=0.0, help="503 응답 비율 (0~1)")
+    parser.add_argument("--seed", type=int, default=None)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="biblebot 부하 테스트용 모의 업스트림 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    add_server_arguments(parser)
+    try:
+        asyncio.run(_serve(parser.parse_args(argv)))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,8 @@
 from .__version__ import *
-from .api import *
+from .api import HTTPClient, ResourceData, ErrorData, ParseExecutor, ParseMode
 from .reqeust import *
 from .exceptions import *
+from .hooks import Hooks
 
 __all__ = (
     "__title__",
@@ -15,6 +16,9 @@ __all__ = (
     "HTTPClient",
     "ResourceData",
     "ErrorData",
+    "ParseExecutor",
+    "ParseMode",
+    "Hooks",
     "IntranetAPI",
     "LmsAPI",
     "KbuAPI",
@@ -31,5 +35,23 @@ __all__ = (
     "ClientError",
     "ServerError",
     "ParsingError",
+    "ResponseTooLargeError",
+    "ContentTypeError",
     "LibraryAPI",
 )
+
+# API 모음은 처음 사용할 때 가져옴 (biblebot.api 의 __getattr__)
+_LAZY_API = ("IntranetAPI", "LmsAPI", "KbuAPI", "MileageAPI", "MileageParam", "LibraryAPI")
+
+
+def __getattr__(name: str):
+    if name not in _LAZY_API:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from . import api
+
+    value = globals()[name] = getattr(api, name)
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_API))
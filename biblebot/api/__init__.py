@@ -1,38 +1,25 @@
+""" API 모음
+
+IntranetAPI 등의 API 모음과 IntranetLogin 등의 별칭은 처음 사용할 때 해당 모듈을 가져옴 (PEP 562)
+사용하지 않는 사이트의 모듈과 BeautifulSoup 을 가져오지 않으므로 import 시간이 짧음
+"""
+from typing import Dict, Tuple
+import importlib
+
 from .base import (
     HTTPClient,
     ResourceData,
     ErrorData,
 )
-from .intranet import Login as IntranetLogin
-from .intranet import StudentPhoto as IntranetStudentPhoto
-from .intranet import Chapel as IntranetChapel
-from .intranet import Timetable as IntranetTimetable
-from .intranet import Course as IntranetCourse
-from .intranet import TotalAcceptanceStatus as IntranetTotalAcceptanceStatus
-from .intranet import GraduationExam as IntranetGraduationExam
-from .intranet import Profile as IntranetProfile
-from .lms import Login as LmsLogin
-from .lms import Profile as LmsProfile
-from .lms import CourseList as LmsCourseList
-from .lms import Attendance as LmsAttendance
-from .kbu import MainNotice as KbuMainNotice
-from .kbu import ScholarshipNotice as KbuScholarshipNotice
-from .kbu import IllipNotice as KbuIllipNotice
-from .mileage import Login as MileageLogin
-from .mileage import Search as MileageSearch
-from .mileage import Statement as MileageStatement
-from ._mileage import SearchParamData as MileageSearchParamData
-from ._mileage import StatementParamData as MileageStatementParamData
-from .library import Login as LibraryLogin
-from .library import CheckoutList as LibraryCheckoutList
-from .library import BookDetail as LibraryBookDetail
-from .library import BookPhoto as LibraryBookPhoto
+from .executor import ParseExecutor, ParseMode
 
 
 __all__ = (
     "HTTPClient",
     "ResourceData",
     "ErrorData",
+    "ParseExecutor",
+    "ParseMode",
     "IntranetAPI",
     "LmsAPI",
     "KbuAPI",
@@ -41,44 +28,55 @@ __all__ = (
     "LibraryAPI",
 )
 
+# API 모음 이름 -> (별칭 접두사, 모듈, 클래스 이름)
+_NAMESPACES: Dict[str, Tuple[str, str, Tuple[str, ...]]] = {
+    "IntranetAPI": (
+        "Intranet",
+        ".intranet",
+        (
+            "Login",
+            "StudentPhoto",
+            "Chapel",
+            "Timetable",
+            "Course",
+            "TotalAcceptanceStatus",
+            "GraduationExam",
+            "Profile",
+        ),
+    ),
+    "LmsAPI": ("Lms", ".lms", ("Login", "Profile", "CourseList", "Attendance")),
+    "KbuAPI": ("Kbu", ".kbu", ("MainNotice", "ScholarshipNotice", "IllipNotice")),
+    "MileageAPI": ("Mileage", ".mileage", ("Login", "Search", "Statement")),
+    "MileageParam": ("Mileage", "._mileage", ("SearchParamData", "StatementParamData")),
+    "LibraryAPI": ("Library", ".library", ("Login", "CheckoutList", "BookDetail", "BookPhoto")),
+}
 
-class IntranetAPI:
-    Login = IntranetLogin
-    StudentPhoto = IntranetStudentPhoto
-    Chapel = IntranetChapel
-    Timetable = IntranetTimetable
-    Course = IntranetCourse
-    TotalAcceptanceStatus = IntranetTotalAcceptanceStatus
-    GraduationExam = IntranetGraduationExam
-    Profile = IntranetProfile
-
-
-class LmsAPI:
-    Login = LmsLogin
-    Profile = LmsProfile
-    CourseList = LmsCourseList
-    Attendance = LmsAttendance
-
-
-class KbuAPI:
-    MainNotice = KbuMainNotice
-    ScholarshipNotice = KbuScholarshipNotice
-    IllipNotice = KbuIllipNotice
+# 별칭 (IntranetLogin 등) -> API 모음 이름
+_ALIASES: Dict[str, str] = {
+    prefix + member: namespace
+    for namespace, (prefix, _, members) in _NAMESPACES.items()
+    for member in members
+}
 
 
-class MileageAPI:
-    Login = MileageLogin
-    Search = MileageSearch
-    Statement = MileageStatement
+def _load(namespace: str):
+    prefix, module_name, members = _NAMESPACES[namespace]
+    module = importlib.import_module(module_name, __name__)
+    attrs = {member: getattr(module, member) for member in members}
+    collection = type(namespace, (), {"__module__": __name__, **attrs})
+    namespace_globals = globals()
+    namespace_globals[namespace] = collection
+    for member, value in attrs.items():
+        namespace_globals[prefix + member] = value
 
 
-class MileageParam:
-    SearchParamData = MileageSearchParamData
-    StatementParamData = MileageStatementParamData
+def __getattr__(name: str):
+    namespace = name if name in _NAMESPACES else _ALIASES.get(name)
+    if namespace is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    _load(namespace)
+    return globals()[name]
 
 
-class LibraryAPI:
-    Login = LibraryLogin
-    CheckoutList = LibraryCheckoutList
-    BookDetail = LibraryBookDetail
-    BookPhoto = LibraryBookPhoto
+def __dir__():
+    return sorted(set(globals()) | set(_NAMESPACES) | set(_ALIASES))
@@ -1,9 +1,10 @@
 from dataclasses import dataclass
-from typing import List, Tuple, Dict
+from typing import List, Tuple, Dict, Iterable
 
 __all__ = (
     "translate_mileage_req",
     "translate_statement_type",
+    "translate_statement_types",
     "SearchParamData",
     "StatementParamData",
 )
@@ -81,6 +82,14 @@ def translate_statement_type(statement_type: str) -> str:
     return _STATEMENT_TYPES.get(statement_type, statement_type)
 
 
+def translate_statement_types(rows: Iterable[List[str]], index: int) -> None:
+    """ 여러 행의 index 열(CHG_FG)을 한 번에 변환 (행을 직접 변경) """
+    get = _STATEMENT_TYPES.get
+    for row in rows:
+        value = row[index]
+        row[index] = get(value, value)
+
+
 @dataclass
 class SearchParamData:
     birth_day: str = "01"
@@ -0,0 +1,58 @@
+""" 파서에서 사용하는 미리 컴파일된 정규식
+
+파싱할 때마다(셀마다) 정규식을 컴파일하지 않도록 모듈 로드 시 한 번만 컴파일함
+"""
+from typing import Optional, Tuple
+import re
+
+__all__ = (
+    "DIGITS",
+    "KOREAN_NAME",
+    "STUDENT_ID",
+    "MAJOR_NAME",
+    "LMS_COURSE_ID",
+    "BRACKETED",
+    "LMS_LOGIN_ERROR_CODE",
+    "LIBRARY_ERROR_CODE",
+    "HTTP_URL",
+    "TIMETABLE_CELL",
+    "match_timetable_cell",
+)
+
+DIGITS = re.compile(r"\d+")
+
+# 프로필 검증
+KOREAN_NAME = re.compile(r"^[가-힣]{2,}$")
+STUDENT_ID = re.compile(r"^[a-zA-Z]{,1}\d{3,9}$")
+MAJOR_NAME = re.compile(r"^[가-힣]{3,17}$")
+
+# LMS
+LMS_COURSE_ID = re.compile(r"[?&]id=(\d+)")
+BRACKETED = re.compile(r"\[.*?\]")
+LMS_LOGIN_ERROR_CODE = re.compile(r"errorcode=(\d+)")
+
+# 도서관
+LIBRARY_ERROR_CODE = re.compile(r"ErrorCode=(\d+)")
+HTTP_URL = re.compile(r"https?://")
+
+# 인트라넷 시간표 셀: "강의명(강의실)09:00~10:15" 또는 "강의명09:00~10:15"
+# 강의실이 있는 형태를 먼저 시도하고(paren 그룹이 매칭됨), 실패하면 강의실이 없는 형태로 매칭
+TIMETABLE_CELL = re.compile(
+    r"(?:(?P<name>.+)?\((?P<room>[^(]*)?\)(?P<paren>)|(?P<bare>.+)?)"
+    r"(?P<start>\d{2}:\d{2})\s*~\s*(?P<end>[0-9:]{,5})"
+)
+
+
+def match_timetable_cell(
+    text: str,
+) -> Optional[Tuple[Optional[str], Optional[str], str, str]]:
+    """ 시간표 셀 텍스트를 (강의명, 강의실, 시작시간, 종료시간)으로 해석, 해석할 수 없으면 None
+
+    강의실이 없는 셀의 강의실은 "" 로 반환함
+    """
+    matching = TIMETABLE_CELL.match(text)
+    if not matching:
+        return None
+    if matching.group("paren") is not None:
+        return matching.group("name", "room", "start", "end")
+    return matching.group("bare"), "", matching.group("start"), matching.group("end")
@@ -1,9 +1,17 @@
 from abc import ABCMeta, abstractmethod
 from dataclasses import dataclass, field
-from typing import Dict, Any, Union, Optional, Type, Sequence
+from typing import Dict, Any, Union, Optional, Type, Sequence, Callable, Tuple, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from functools import wraps
+import importlib
 
 from ..reqeust import Response, BaseRequest
+from ..reqeust.base import DEFAULT_REQUEST_TIMEOUT, deadline, body_limits
+from ..registry import SubclassRegistry
+from ..hooks import Hooks, EventType, api_context, api_name
+from ..profiling import Profiler
+from .executor import ParseExecutor, ParseMode
 
 
 __all__ = (
@@ -17,21 +25,139 @@ __all__ = (
     "IGeneralFetcher",
     "ISemesterFetcher",
     "ParserPrecondition",
+    "ParseMode",
 )
 
 
-class HTTPClient:
-    connector: Optional[Type[BaseRequest]] = None
+# HTTPClient.use 로 지정한 컨텍스트 로컬 커넥터 (asyncio 태스크, 스레드별)
+_connector_override: "ContextVar[Optional[Type[BaseRequest]]]" = ContextVar(
+    "biblebot_connector", default=None
+)
+
+
+class _HTTPClientMeta(type):
+    @property
+    def connector(cls) -> Optional[Type[BaseRequest]]:
+        """ 현재 컨텍스트의 커넥터, 지정하지 않았으면 처음 사용할 때 set_auto 로 선택 """
+        connector = _connector_override.get()
+        if connector is not None:
+            return connector
+        if cls._connector is None:
+            cls.set_auto()
+        return cls._connector
+
+    @connector.setter
+    def connector(cls, connector: Optional[Type[BaseRequest]]):
+        cls._connector = connector
+
+
+class HTTPClient(metaclass=_HTTPClientMeta):
+    """ 요청에 사용할 커넥터 설정
+
+    커넥터 선택 순서
+    1. HTTPClient.use 로 지정한 컨텍스트 로컬 커넥터
+    2. HTTPClient.route 로 사이트("mileage") 또는 API 클래스("mileage.Search")에 지정한 커넥터 (fetch 안에서만)
+    3. HTTPClient.set 으로 지정한 커넥터
+    4. HTTPClient.set_auto: 등록된 커넥터 중 우선순위가 가장 높고 패키지가 설치된 커넥터
+
+    커넥터는 클래스 또는 register 로 등록한 이름으로 지정할 수 있음
+    """
+
+    _connector: Optional[Type[BaseRequest]] = None
+    # 이름 -> (우선순위, 커넥터 클래스 또는 처음 사용할 때 가져올 "모듈.클래스" 경로)
+    registry: Dict[str, Tuple[int, Union[str, Type[BaseRequest]]]] = {
+        "requests": (20, "biblebot.reqeust.requests_conn.Request"),
+        "aiohttp": (10, "biblebot.reqeust.aiohttp_conn.Request"),
+        "httpx": (5, "biblebot.reqeust.httpx_conn.Request"),
+    }
+    # 사이트 또는 API 클래스 이름 -> 커넥터 이름
+    routes: Dict[str, str] = {}
+
+    @classmethod
+    def register(
+        cls,
+        name: str,
+        connector: Union[str, Type[BaseRequest], None] = None,
+        *,
+        priority: int = 0,
+    ):
+        """ 커넥터를 이름으로 등록, 데코레이터로도 사용 가능
+
+        @HTTPClient.register("mileage-pool")
+        class MileageRequest(Request): ...
+        """
+
+        def decorator(klass: Union[str, Type[BaseRequest]]):
+            cls.registry[name] = (priority, klass)
+            return klass
+
+        return decorator if connector is None else decorator(connector)
+
+    @classmethod
+    def get(cls, name: str) -> Type[BaseRequest]:
+        """ 이름으로 등록된 커넥터 (경로로 등록된 경우 이 때 가져옴, 패키지가 없으면 ImportError) """
+        try:
+            priority, connector = cls.registry[name]
+        except KeyError:
+            raise KeyError(f"등록되지 않은 커넥터입니다. -> {name}") from None
+        if isinstance(connector, str):
+            module_name, _, class_name = connector.rpartition(".")
+            connector = getattr(importlib.import_module(module_name), class_name)
+            cls.registry[name] = (priority, connector)
+        return connector
+
+    @classmethod
+    def _resolve(cls, connector: Union[str, Type[BaseRequest]]) -> Type[BaseRequest]:
+        return cls.get(connector) if isinstance(connector, str) else connector
 
     @classmethod
     def set_auto(cls):
-        http: Type[BaseRequest]
-        for http in BaseRequest.__subclasses__():
-            cls.connector = http
+        """ 등록된 커넥터 중 우선순위가 가장 높고 사용할 수 있는 커넥터를 선택 (import 순서와 무관)
+
+        같은 우선순위는 먼저 등록된 커넥터가 우선
+        """
+        ordered = sorted(cls.registry, key=lambda name: -cls.registry[name][0])
+        for name in ordered:
+            try:
+                cls._connector = cls.get(name)
+            except ImportError:
+                continue
+            return
 
     @classmethod
-    def set(cls, connector: Type[BaseRequest]):
-        cls.connector = connector
+    def set(cls, connector: Union[str, Type[BaseRequest]]):
+        cls._connector = cls._resolve(connector)
+
+    @classmethod
+    @contextmanager
+    def use(cls, connector: Union[str, Type[BaseRequest]]) -> Iterator[Type[BaseRequest]]:
+        """ 블록 안에서만 connector 를 사용 (다른 asyncio 태스크, 스레드에는 영향 없음) """
+        connector = cls._resolve(connector)
+        token = _connector_override.set(connector)
+        try:
+            yield connector
+        finally:
+            _connector_override.reset(token)
+
+    @classmethod
+    def route(cls, target: str, connector: Optional[str]):
+        """ 사이트 또는 API 클래스의 fetch 가 사용할 커넥터 이름 지정 (None 이면 해제)
+
+        HTTPClient.route("mileage", "mileage-pool")
+        """
+        if connector is None:
+            cls.routes.pop(target, None)
+        else:
+            cls.get(connector)
+            cls.routes[target] = connector
+
+    @classmethod
+    def _routed(cls, parser: type) -> Optional[str]:
+        if _connector_override.get() is not None:
+            return None
+        name = api_name(parser)
+        routes = cls.routes
+        return routes.get(name) or routes.get(name.partition(".")[0])
 
 
 @dataclass
@@ -56,8 +182,96 @@ class SemesterData:
 
 APIResponseType = Union[ResourceData, ErrorData]
 
+# parse 안에서 다른 parse 메서드를 호출하는 경우 바깥쪽 호출만 계측
+_parsing: "ContextVar[bool]" = ContextVar("biblebot_parsing", default=False)
+
+
+def _instrument_fetch(func: Callable) -> Callable:
+    async def instrumented(cls, *args, **kwargs):
+        if not Hooks.handlers:
+            return await func(cls, *args, **kwargs)
+        with api_context(api_name(cls)):
+            if Profiler.directory is None:
+                return await func(cls, *args, **kwargs)
+            return await Profiler.fetch(func, cls, *args, **kwargs)
+
+    @wraps(func)
+    async def fetch(cls, *args, **kwargs):
+        # 여러 요청으로 이루어진 fetch(로그인, 학기 선택 등)도 전체 시간이 timeout 을 넘지 않도록 마감 시각을 공유
+        # 응답 본문 제한은 API 클래스별 설정 (IParser.MAX_BODY_SIZE, CONTENT_TYPES)
+        with deadline(kwargs.get("timeout") or DEFAULT_REQUEST_TIMEOUT), body_limits(
+            cls.MAX_BODY_SIZE, cls.CONTENT_TYPES
+        ):
+            if HTTPClient.routes:
+                connector = HTTPClient._routed(cls)
+                if connector is not None:
+                    with HTTPClient.use(connector):
+                        return await instrumented(cls, *args, **kwargs)
+            return await instrumented(cls, *args, **kwargs)
+
+    return fetch
+
+
+def _instrument_parse(func: Callable) -> Callable:
+    @wraps(func)
+    def parse(cls, response: Response, *args, **kwargs):
+        if not Hooks.handlers or _parsing.get():
+            return func(cls, response, *args, **kwargs)
+        token = _parsing.set(True)
+        try:
+            with api_context(api_name(cls)), Hooks.measure(
+                EventType.PARSE,
+                method=func.__name__,
+                mode=None,
+                size=len(response.raw),
+                result=None,
+                error=None,
+            ) as attrs:
+                if Profiler.directory is None:
+                    result = func(cls, response, *args, **kwargs)
+                else:
+                    result = Profiler.parse(func, cls, response, *args, **kwargs)
+                attrs["result"] = type(result).__name__
+            return result
+        finally:
+            _parsing.reset(token)
+
+    return parse
+
 
 class IParser(metaclass=ABCMeta):
+    # parse_async 실행 위치: len(response.raw) 가 임계값 미만이면 SMALL, 이상이면 LARGE 모드
+    PARSE_SIZE_THRESHOLD: int = 128 * 1024
+    SMALL_PARSE_MODE: ParseMode = ParseMode.THREAD
+    LARGE_PARSE_MODE: ParseMode = ParseMode.PROCESS
+    # fetch 응답 본문의 최대 크기(bytes), 넘으면 수신을 중단하고 ResponseTooLargeError (None 이면 제한 없음)
+    MAX_BODY_SIZE: Optional[int] = 16 * 1024 * 1024
+    # fetch 응답에 허용하는 content-type 접두사, 다르면 본문을 받지 않고 ContentTypeError (None 이면 모두 허용)
+    # 기본값은 텍스트 형식만 허용하므로 HTML 파서는 이미지 등의 바이너리 본문을 디코딩하지 않고 거부함
+    CONTENT_TYPES: Optional[Tuple[str, ...]] = (
+        "text/",
+        "application/xml",
+        "application/xhtml+xml",
+        "application/json",
+        "application/javascript",
+    )
+
+    def __init_subclass__(cls, **kwargs):
+        """ 파생 클래스의 fetch, parse* 메서드를 계측 (biblebot.hooks)
+
+        훅 핸들러가 등록된 경우에만 이벤트에 API 클래스 이름을 태그하고 파싱 시간을 측정함
+        fetch 안의 모든 요청은 timeout(기본값 DEFAULT_REQUEST_TIMEOUT)을 전체 제한 시간으로 공유함 (reqeust.deadline)
+        fetch 안의 모든 요청에 MAX_BODY_SIZE, CONTENT_TYPES 를 적용함 (reqeust.body_limits)
+        """
+        super().__init_subclass__(**kwargs)
+        for name, value in list(vars(cls).items()):
+            if not isinstance(value, classmethod):
+                continue
+            if name == "fetch":
+                setattr(cls, name, classmethod(_instrument_fetch(value.__func__)))
+            elif name == "parse" or (name.startswith("parse_") and name != "parse_async"):
+                setattr(cls, name, classmethod(_instrument_parse(value.__func__)))
+
     @classmethod
     @abstractmethod
     def parse(cls, response: Response) -> APIResponseType:
@@ -67,6 +281,17 @@ class IParser(metaclass=ABCMeta):
         """
         pass
 
+    @classmethod
+    async def parse_async(
+        cls, response: Response, mode: Optional[ParseMode] = None
+    ) -> APIResponseType:
+        """ parse 를 ParseExecutor 의 스레드/프로세스 풀에서 실행
+
+        파싱하는 동안 이벤트 루프는 다른 I/O 를 계속 처리할 수 있음
+        mode 를 생략하면 응답 크기와 클래스 설정에 따라 ParseExecutor.select 로 결정
+        """
+        return await ParseExecutor.run(cls, response, mode)
+
 
 class ILoginFetcher(metaclass=ABCMeta):
     @classmethod
@@ -113,19 +338,33 @@ class ISemesterFetcher(metaclass=ABCMeta):
 
 
 class ParserPrecondition:
+    """ parse 실행 전, baseclass 의 파생 클래스(is_blocking)를 사전조건으로 실행하는 데코레이터
+
+    파생 클래스 목록은 SubclassRegistry 에 캐시되며 우선순위 순서로 실행됨
+    precondition=False 를 전달하면 해당 호출의 사전조건 검사를 생략함
+    훅 핸들러가 등록된 경우 검사 결과(PRECONDITION 이벤트)를 발생시킴
+    """
+
     def __init__(self, baseclass):
         self.baseclass = baseclass
+        self.registry = SubclassRegistry.of(baseclass)
 
     def __call__(self, func):
         @wraps(func)
-        def wrapper(cls, response: Response):
-            for subclass in self.baseclass.__subclasses__():
-                error = subclass.is_blocking(response)
-                if error:
-                    return error
+        def wrapper(cls, response: Response, *, precondition: bool = True):
+            if precondition:
+                for subclass in self.registry:
+                    error = subclass.is_blocking(response)
+                    if error:
+                        if Hooks.handlers:
+                            Hooks.emit(
+                                EventType.PRECONDITION,
+                                blocked=True,
+                                checker=subclass.__name__,
+                            )
+                        return error
+                if Hooks.handlers:
+                    Hooks.emit(EventType.PRECONDITION, blocked=False, checker=None)
             return func(cls, response)
 
         return wrapper
-
-
-HTTPClient.set_auto()
@@ -1,26 +1,41 @@
-import re
-from typing import List, Mapping, Dict, Tuple
+from typing import List, Mapping, Dict, Tuple, Iterable, Optional, Sequence, TYPE_CHECKING
+from functools import lru_cache
+from itertools import zip_longest
 import urllib.parse
 import datetime
 
-from bs4 import BeautifulSoup
-import bs4.element
-
 from ..exceptions import ParsingError
 from ..reqeust import Response
+from ..reqeust._scanner import scan_alerts
 
+if TYPE_CHECKING:
+    # bs4 는 처음 soup 을 생성할 때 가져옴 (import biblebot 시간 단축, Response.soup)
+    from bs4 import BeautifulSoup
+    import bs4.element
 
 __all__ = (
     "httpdate_to_unixtime",
     "extract_alerts",
+    "extract_alerts_from_scripts",
     "extract_hidden_tags",
     "urlencode",
     "remove_unexpected_char",
     "SemesterConverter",
+    "extract_rows",
+    "to_columns",
     "parse_table",
+    "parse_table_columns",
 )
 
-_ALERT_PATTERN = re.compile(r"[^a-zA-Z0-9_]*?alert\s*\((.+?)\)")
+_NESTED_TABLE_TAGS: Tuple[str, ...] = ("table", "tr", "td")
+
+
+@lru_cache(maxsize=None)
+def _element_types() -> Tuple[type, Tuple[type, ...]]:
+    """ (Tag, 텍스트 노드 타입), 셀 순회 중에 bs4 를 다시 찾지 않도록 처음 호출할 때 한 번만 가져옴 """
+    from bs4.element import Tag, NavigableString, CData
+
+    return Tag, (NavigableString, CData)
 
 
 def httpdate_to_unixtime(date: str) -> int:
@@ -32,28 +47,22 @@ def httpdate_to_unixtime(date: str) -> int:
     )
 
 
-def _replace_alert_message(message: str):
-    message = message.strip()
-    f, e = message[0], message[-1]
-    if f == e and (f == "'" or f == '"'):
-        return message.strip(f)
-
-
-def extract_alerts(soup: BeautifulSoup) -> List[str]:
+def extract_alerts(soup: "BeautifulSoup") -> List[str]:
     script_elements = soup.find_all("script")
+    return extract_alerts_from_scripts(
+        each.text if each.text else str(each.string) for each in script_elements
+    )
 
-    result = []
-    for each in script_elements:
-        each = each.text if each.text else str(each.string)
 
-        for message in _ALERT_PATTERN.findall(each):
-            alert = _replace_alert_message(message)
-            if alert:
-                result.append(alert)
-    return result
+def extract_alerts_from_scripts(scripts: Iterable[str]) -> List[str]:
+    """ 미리 추출한 <script> 텍스트(Response.scripts)에서 alert 메시지 추출
 
+    응답 단위로 캐시된 결과가 필요하면 Response.alerts 를 사용
+    """
+    return scan_alerts(scripts)
 
-def extract_hidden_tags(soup: BeautifulSoup) -> Dict[str, str]:
+
+def extract_hidden_tags(soup: "BeautifulSoup") -> Dict[str, str]:
     hidden_tags = soup.find_all("input", type="hidden")
     return {tag.get("name"): tag.get("value", "") for tag in hidden_tags}
 
@@ -102,8 +111,88 @@ class SemesterConverter:
         return year + semester
 
 
+def _cell_text(
+    cell: "bs4.element.Tag", tag_type: type, text_types: Tuple[type, ...]
+) -> Optional[str]:
+    """ cell.get_text(strip=True) 와 같은 결과를 get_text 의 범용 탐색 없이 계산
+
+    셀 안에 다른 테이블 요소(table/tr/td)가 중첩된 경우 None
+    """
+    parts: List[str] = []
+    stack = [iter(cell.contents)]
+    while stack:
+        for child in stack[-1]:
+            cls = child.__class__
+            if cls is tag_type:
+                if child.name in _NESTED_TABLE_TAGS:
+                    return None
+                stack.append(iter(child.contents))
+                break
+            if cls in text_types:
+                text = child.strip()
+                if text:
+                    parts.append(text)
+        else:
+            stack.pop()
+    return "".join(parts)
+
+
+def _extract_nested_rows(container: "bs4.element.Tag") -> List[List[str]]:
+    return [
+        [td.get_text(strip=True) for td in tr.find_all("td")]
+        for tr in container.find_all("tr")
+    ]
+
+
+def extract_rows(container: "bs4.element.Tag") -> List[List[str]]:
+    """ container 하위의 <tr>/<td> 를 한 번만 순회하여 행 단위 셀 텍스트 목록으로 변환
+
+    행마다 td 를 다시 탐색하지 않고, 셀 텍스트도 순회 중에 바로 계산함
+    중첩 테이블이 있으면 바깥 셀이 안쪽 셀도 포함하는 기존 방식(find_all)으로 처리
+    """
+    tag_type, text_types = _element_types()
+    rows: List[List[str]] = []
+    row: Optional[List[str]] = None
+    stack = [iter(container.contents)]
+    while stack:
+        for child in stack[-1]:
+            if child.__class__ is not tag_type:
+                continue
+            name = child.name
+            if name == "td":
+                if row is not None:
+                    text = _cell_text(child, tag_type, text_types)
+                    if text is None:
+                        return _extract_nested_rows(container)
+                    row.append(text)
+            elif name == "table":
+                return _extract_nested_rows(container)
+            else:
+                if name == "tr":
+                    row = []
+                    rows.append(row)
+                stack.append(iter(child.contents))
+                break
+        else:
+            stack.pop()
+    return rows
+
+
+def to_columns(
+    rows: Sequence[Sequence[str]], width: int = 0
+) -> List[Tuple[str, ...]]:
+    """ 행 단위 데이터를 열 단위 튜플 목록으로 변환 (길이가 다른 행은 "" 로 채움)
+
+    width 가 행의 최대 길이보다 크면 빈 열을 추가함
+    """
+    columns = list(zip_longest(*rows, fillvalue=""))
+    n_rows = len(rows)
+    columns.extend(("",) * n_rows for _ in range(width - len(columns)))
+    return columns
+
+
 def parse_table(
-    response: Response, thead: bs4.element.Tag, tbody: bs4.element.Tag,
+    response: Response, thead: "bs4.element.Tag", tbody: "bs4.element.Tag",
 ) -> Tuple[List[str], List[List[str]]]:
     if not thead:
         raise ParsingError("테이블 헤드가 존재하지 않습니다.", response)
@@ -111,8 +200,13 @@ def parse_table(
         raise ParsingError("테이블 바디가 존재하지 않습니다.", response)
 
     head: List[str] = [th.get_text(strip=True) for th in thead.find_all("th")]
-    body: List[List[str]] = [
-        [td.get_text(strip=True) for td in tr.find_all("td")]
-        for tr in tbody.find_all("tr")
-    ]
+    body: List[List[str]] = extract_rows(tbody)
     return head, body
+
+
+def parse_table_columns(
+    response: Response, thead: "bs4.element.Tag", tbody: "bs4.element.Tag",
+) -> Tuple[List[str], List[Tuple[str, ...]]]:
+    """ parse_table 과 같지만 body 를 열 단위(열마다 문자열 튜플)로 반환 """
+    head, body = parse_table(response, thead, tbody)
+    return head, to_columns(body, len(head))
@@ -0,0 +1,151 @@
+""" 메모리를 적게 사용하는 불변(immutable) 결과 타입
+
+ResourceData, ErrorData, SemesterData, NoticeData, Response 는 인스턴스마다 __dict__ 를 갖는 dataclass 이므로
+수천 개의 공지사항이나 학생 정보를 메모리에 보관하면 그 비용이 커진다.
+이 모듈의 타입은 NamedTuple(__slots__ = ())이며, 테이블 데이터(list of lists)는 tuple of tuples 로 보관한다.
+
+compact() 로 기존 타입을 변환하고, expand() 로 기존 타입으로 되돌린다.
+"""
+from typing import NamedTuple, Dict, Any, Optional, Tuple, Union, List
+import datetime
+
+from ..reqeust import Response
+from .base import ResourceData, ErrorData, SemesterData
+from .kbu import NoticeData
+
+__all__ = (
+    "CompactResourceData",
+    "CompactErrorData",
+    "CompactSemesterData",
+    "CompactNoticeData",
+    "CompactResponse",
+    "CompactType",
+    "freeze_rows",
+    "compact",
+    "expand",
+)
+
+
+class CompactResourceData(NamedTuple):
+    data: Dict[str, Any]
+    link: str
+    meta: Optional[Dict[str, Any]] = None
+
+
+class CompactErrorData(NamedTuple):
+    error: Dict[str, Any]
+    link: str
+    meta: Optional[Dict[str, Any]] = None
+
+
+class CompactSemesterData(NamedTuple):
+    selected: str
+    selectable: Tuple[str, ...]
+
+
+class CompactNoticeData(NamedTuple):
+    title: str
+    author: str
+    date: datetime.datetime
+    content: str
+    url: str
+
+
+class CompactResponse(NamedTuple):
+    """ soup, etc 캐시가 없는 응답 스냅샷 """
+
+    status: int
+    url: str
+    reason: str = ""
+    headers: Optional[Dict[str, str]] = None
+    raw: bytes = b""
+    text: str = ""
+    cookies: Optional[Dict[str, str]] = None
+
+
+CompactType = Union[
+    CompactResourceData,
+    CompactErrorData,
+    CompactSemesterData,
+    CompactNoticeData,
+    CompactResponse,
+]
+
+
+def freeze_rows(rows: List[List[Any]]) -> Tuple[Tuple[Any, ...], ...]:
+    """ 테이블 데이터(list of lists)를 tuple of tuples 로 변환 """
+    return tuple(tuple(row) for row in rows)
+
+
+def _is_rows(value: Any) -> bool:
+    return isinstance(value, list) and all(isinstance(row, list) for row in value)
+
+
+def _compact_payload(payload: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        key: freeze_rows(value) if value and _is_rows(value) else value
+        for key, value in payload.items()
+    }
+
+
+def _is_frozen_rows(value: Any) -> bool:
+    return isinstance(value, tuple) and all(isinstance(row, tuple) for row in value)
+
+
+def _expand_payload(payload: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        key: [list(row) for row in value] if value and _is_frozen_rows(value) else value
+        for key, value in payload.items()
+    }
+
+
+def compact(
+    obj: Union[ResourceData, ErrorData, SemesterData, NoticeData, Response]
+) -> CompactType:
+    """ 결과 객체를 대응하는 Compact 타입으로 변환 (테이블 데이터는 tuple of tuples 로 변환) """
+    if isinstance(obj, ResourceData):
+        return CompactResourceData(
+            _compact_payload(obj.data), obj.link, dict(obj.meta) or None
+        )
+    if isinstance(obj, ErrorData):
+        return CompactErrorData(dict(obj.error), obj.link, dict(obj.meta) or None)
+    if isinstance(obj, SemesterData):
+        return CompactSemesterData(obj.selected, tuple(obj.selectable))
+    if isinstance(obj, NoticeData):
+        return CompactNoticeData(obj.title, obj.author, obj.date, obj.content, obj.url)
+    if isinstance(obj, Response):
+        return CompactResponse(
+            obj.status,
+            obj.url,
+            obj.reason,
+            dict(obj.headers),
+            obj.raw,
+            obj.text,
+            dict(obj.cookies),
+        )
+    raise TypeError(f"변환할 수 없는 타입입니다. -> {type(obj).__name__}")
+
+
+def expand(
+    obj: CompactType,
+) -> Union[ResourceData, ErrorData, SemesterData, NoticeData, Response]:
+    """ Compact 타입을 기존 타입(dataclass)으로 변환 """
+    if isinstance(obj, CompactResourceData):
+        return ResourceData(_expand_payload(obj.data), obj.link, dict(obj.meta or {}))
+    if isinstance(obj, CompactErrorData):
+        return ErrorData(dict(obj.error), obj.link, dict(obj.meta or {}))
+    if isinstance(obj, CompactSemesterData):
+        return SemesterData(obj.selected, list(obj.selectable))
+    if isinstance(obj, CompactNoticeData):
+        return NoticeData(*obj)
+    if isinstance(obj, CompactResponse):
+        return Response(
+            obj.status,
+            obj.url,
+            obj.reason,
+            dict(obj.headers or {}),
+            obj.raw,
+            obj.text,
+            dict(obj.cookies or {}),
+        )
+    raise TypeError(f"변환할 수 없는 타입입니다. -> {type(obj).__name__}")
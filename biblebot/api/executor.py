@@ -0,0 +1,121 @@
+""" CPU 바운드 파싱을 이벤트 루프 밖에서 실행하기 위한 모듈
+
+BeautifulSoup 파싱은 이벤트 루프 스레드를 점유하므로, 큰 페이지(인트라넷 테이블, 마일리지 시트 등)를
+파싱하는 동안 다른 요청이 모두 멈춘다. ParseExecutor 는 IParser.parse 를 다음 중 한 곳에서 실행한다.
+
+- INLINE: 이벤트 루프 스레드에서 바로 실행 (로그인 응답처럼 아주 작은 페이지)
+- THREAD: 스레드 풀에서 실행 (pickle 비용이 없으므로 작은 페이지에 유리)
+- PROCESS: 프로세스 풀에서 실행 (Response 를 워커로 전송, 큰 페이지를 여러 코어에서 파싱)
+
+어느 곳에서 실행할지는 API 클래스별 설정(PARSE_SIZE_THRESHOLD, SMALL_PARSE_MODE, LARGE_PARSE_MODE)과
+len(response.raw) 로 결정한다.
+"""
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Optional, Type, Dict, Callable, TYPE_CHECKING
+import asyncio
+import enum
+
+from ..reqeust import Response
+from ..hooks import Hooks, EventType, api_context, api_name
+
+if TYPE_CHECKING:
+    from .base import IParser, APIResponseType
+
+__all__ = (
+    "ParseMode",
+    "ParseExecutor",
+)
+
+
+@enum.unique
+class ParseMode(enum.Enum):
+    INLINE = "inline"
+    THREAD = "thread"
+    PROCESS = "process"
+
+
+def _process_pool(max_workers: Optional[int]) -> Executor:
+    """ multiprocessing 은 프로세스 풀을 처음 생성할 때 가져옴 (import 시간 단축) """
+    from concurrent.futures import ProcessPoolExecutor
+
+    return ProcessPoolExecutor(max_workers=max_workers)
+
+
+def _parse_in_worker(parser: Type["IParser"], response: Response) -> "APIResponseType":
+    """ 워커에서 실행되는 함수 (pickle 가능해야 하므로 모듈 최상위에 위치) """
+    return parser.parse(response)
+
+
+class ParseExecutor:
+    """ IParser.parse_async 가 사용하는 실행기 설정
+
+    실행기를 지정하지 않으면 첫 사용 시 max_workers 개의 워커를 갖는 풀을 생성함
+    """
+
+    executors: Dict[ParseMode, Executor] = {}
+    factories: Dict[ParseMode, Callable[[Optional[int]], Executor]] = {
+        ParseMode.THREAD: lambda n: ThreadPoolExecutor(max_workers=n),
+        ParseMode.PROCESS: _process_pool,
+    }
+    max_workers: Optional[int] = None
+
+    @classmethod
+    def set(cls, executor: Executor, mode: ParseMode = ParseMode.PROCESS):
+        if mode is ParseMode.INLINE:
+            raise ValueError("INLINE 모드에는 실행기를 지정할 수 없습니다.")
+        cls.executors[mode] = executor
+
+    @classmethod
+    def get(cls, mode: ParseMode = ParseMode.PROCESS) -> Optional[Executor]:
+        """ INLINE 모드인 경우 None """
+        if mode is ParseMode.INLINE:
+            return None
+        try:
+            return cls.executors[mode]
+        except KeyError:
+            executor = cls.executors[mode] = cls.factories[mode](cls.max_workers)
+            return executor
+
+    @classmethod
+    def shutdown(cls, wait: bool = True):
+        for executor in cls.executors.values():
+            executor.shutdown(wait=wait)
+        cls.executors.clear()
+
+    @staticmethod
+    def select(parser: Type["IParser"], response: Response) -> ParseMode:
+        if len(response.raw) < parser.PARSE_SIZE_THRESHOLD:
+            return parser.SMALL_PARSE_MODE
+        return parser.LARGE_PARSE_MODE
+
+    @classmethod
+    async def run(
+        cls,
+        parser: Type["IParser"],
+        response: Response,
+        mode: Optional[ParseMode] = None,
+    ) -> "APIResponseType":
+        mode = mode or cls.select(parser, response)
+        if mode is ParseMode.INLINE:
+            return parser.parse(response)
+
+        loop = asyncio.get_event_loop()
+        if mode is ParseMode.THREAD or not Hooks.handlers:
+            return await loop.run_in_executor(
+                cls.get(mode), _parse_in_worker, parser, response
+            )
+
+        # 워커 프로세스의 이벤트는 전달되지 않으므로 전송 시간을 포함한 파싱 시간을 여기서 측정
+        with api_context(api_name(parser)), Hooks.measure(
+            EventType.PARSE,
+            method="parse",
+            mode=mode.value,
+            size=len(response.raw),
+            result=None,
+            error=None,
+        ) as attrs:
+            result = await loop.run_in_executor(
+                cls.get(mode), _parse_in_worker, parser, response
+            )
+            attrs["result"] = type(result).__name__
+        return result
@@ -1,7 +1,6 @@
 from abc import ABCMeta, abstractmethod
 from typing import Optional, Dict, List, Tuple
 from collections import defaultdict
-import re
 
 from .base import (
     HTTPClient,
@@ -14,16 +13,19 @@ from .base import (
     ErrorData,
     ParserPrecondition,
     SemesterData,
+    ParseMode,
 )
 from ..reqeust import Response
-from ..exceptions import ParsingError
+from ..reqeust._scanner import scan_element_text
+from ..registry import Registrable
+from ..exceptions import ParsingError, ServerError
 from .common import (
     httpdate_to_unixtime,
-    extract_alerts,
     extract_hidden_tags,
     urlencode,
     parse_table,
 )
+from ._patterns import DIGITS, KOREAN_NAME, STUDENT_ID, MAJOR_NAME, match_timetable_cell
 
 __all__ = (
     "IParserPrecondition",
@@ -40,7 +42,7 @@ DOMAIN_NAME: str = "https://kbuis.bible.ac.kr"  # with protocol
 _SEMESTER_KEY: str = "ctl00$ContentPlaceHolder1$cbo_YearHg"
 
 
-class IParserPrecondition(metaclass=ABCMeta):
+class IParserPrecondition(Registrable, metaclass=ABCMeta):
     @staticmethod
     @abstractmethod
     def is_blocking(response: Response) -> Optional[ErrorData]:
@@ -54,7 +56,7 @@ _ParserPrecondition = ParserPrecondition(IParserPrecondition)
 class _SessionExpiredChecker(IParserPrecondition):
     @staticmethod
     def is_blocking(response: Response) -> Optional[ErrorData]:
-        alerts = extract_alerts(response.soup)
+        alerts = response.alerts
         for alert in alerts:
             if "세션" in alert or "수업평가" in alert:
                 return ErrorData(
@@ -121,6 +123,7 @@ async def _post_with_semester(
 
 
 class Login(ILoginFetcher, IParser):
+    SMALL_PARSE_MODE: ParseMode = ParseMode.INLINE
     URL: str = DOMAIN_NAME + "/ble_login3.aspx"
 
     @classmethod
@@ -156,15 +159,23 @@ class Login(ILoginFetcher, IParser):
             "__VIEWSTATE": view_state,
             "__EVENTVALIDATION": event_validation
         }
-        return await HTTPClient.connector.post(
-            cls.URL, headers=headers, body=form, timeout=timeout, **kwargs
-        )
+        try:
+            return await HTTPClient.connector.post(
+                cls.URL, headers=headers, body=form, timeout=timeout, **kwargs
+            )
+        except ServerError as e:
+            # 서버 과부하(503) 응답은 parse 에서 ErrorData 로 반환 (ServerError 는 계측에 기록됨)
+            if e.response.status == 503:
+                return e.response
+            raise
 
     @classmethod
     def parse(cls, response: Response) -> APIResponseType:
         """
         로그인 성공: status 302, location header 포함, 리다이렉트 메시지를 body에 포함
         로그인 실패: status 200, location header 미포함, alert 메시지를 body에 포함
+
+        헤더와 텍스트 스캔만으로 판단하며, 스캔으로 해석할 수 없는 경우에만 soup 을 생성함
         """
         # Login 성공
         if response.status == 302:
@@ -174,16 +185,18 @@ class Login(ILoginFetcher, IParser):
             )
         # Login 실패: 인트라넷 서버 과부하
         elif response.status == 503:
+            title = scan_element_text(response.text, "h2")
+            error_message = scan_element_text(response.text, "p")
+            if title is None or error_message is None:
+                title = response.soup.find("h2").get_text()
+                error_message = response.soup.find("p").get_text()
             return ErrorData(
-                error={
-                    "title": response.soup.find("h2").get_text(),
-                    "error_message": response.soup.find("p").get_text()
-                },
+                error={"title": title, "error_message": error_message},
                 link=response.url
             )
         # Login 실패: Common 한 오류
         else:
-            alerts: List[str] = extract_alerts(response.soup)
+            alerts: List[str] = response.alerts
             alert = alerts[0] if alerts else ""
             return ErrorData(
                 error={"title": alert, "alert_messages": alerts}, link=response.url
@@ -192,6 +205,9 @@ class Login(ILoginFetcher, IParser):
 
 class StudentPhoto(IParser):
     URL: str = DOMAIN_NAME + "/SchoolRegMng/SR015.aspx"
+    MAX_BODY_SIZE: Optional[int] = 4 * 1024 * 1024
+    # 사진(image/*) 또는 사진을 불러오지 못한 경우의 html
+    CONTENT_TYPES: Optional[Tuple[str, ...]] = ("image/", "text/html")
 
     @classmethod
     async def fetch(
@@ -254,7 +270,7 @@ class Chapel(ISemesterFetcher, IParser):
             key = th.get_text(strip=True)
             value = td.get_text(strip=True)
 
-            day_count = re.search(r"\d+", value)
+            day_count = DIGITS.search(value)
             summary[key] = str(day_count.group()) if day_count else ""
 
         return summary
@@ -302,12 +318,10 @@ class Timetable(ISemesterFetcher, IParser):
 
     @staticmethod
     def _parse_contents(td: str, response: Response) -> Tuple:
-        matching = re.match(
-            r"(.+)?\(([^(]*)?\)(\d{2}:\d{2})\s*~\s*([0-9:]{,5})", td
-        ) or re.match(r"(.+)?()(\d{2}:\d{2})\s*~\s*([0-9:]{,5})", td)
-        if not matching:
-            ParsingError("시간표 상세정보를 해석할 수 없습니다.", response)
-        return matching.groups()
+        contents = match_timetable_cell(td)
+        if contents is None:
+            raise ParsingError("시간표 상세정보를 해석할 수 없습니다.", response)
+        return contents
 
     @classmethod
     def _parse_main_table(cls, response: Response) -> Tuple[List, List]:
@@ -487,15 +501,15 @@ class Profile(IGeneralFetcher, IParser):
 
     @staticmethod
     def validate_name(name: str) -> bool:
-        return bool(re.search(r"^[가-힣]{2,}$", name))
+        return bool(KOREAN_NAME.search(name))
 
     @staticmethod
     def validate_sid(univ_id: str) -> bool:
-        return bool(re.search(r"^[a-zA-Z]{,1}\d{3,9}$", univ_id))
+        return bool(STUDENT_ID.search(univ_id))
 
     @staticmethod
     def validate_major(major: str) -> bool:
-        return bool(re.search(r"^[가-힣]{3,17}$", major))
+        return bool(MAJOR_NAME.search(major))
 
     @classmethod
     async def fetch(
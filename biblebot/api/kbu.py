@@ -30,7 +30,7 @@ class NoticeData:
     url: str
 
 
-class NoticeArticle:
+class NoticeArticle(IParser):
     @classmethod
     async def fetch(
         cls,
@@ -7,9 +7,9 @@ CheckoutList를 통해
 BookDetail과 BookPhoto를 통해
 ['ISBN', '서지정보', '대출일자', '반납예정일', '대출상태', '연기신청', '도서이미지']의 데이터가 완성된다.
 """
+from abc import ABCMeta, abstractmethod
 from typing import Dict, Optional, List, Tuple
 from base64 import b64encode
-import re
 
 from .base import (
     ILoginFetcher,
@@ -19,16 +19,19 @@ from .base import (
     ResourceData,
     ErrorData,
     ParserPrecondition,
+    ParseMode,
 )
 from ..reqeust.base import Response
-from ..api.intranet import IParserPrecondition
+from ..reqeust._scanner import scan_element_text
+from ..registry import Registrable
 from .common import (
     httpdate_to_unixtime,
-    parse_table,
-    extract_alerts
+    parse_table
 )
+from ._patterns import LIBRARY_ERROR_CODE, HTTP_URL
 
 __all__ = (
+    "IParserPrecondition",
     "Login",
     "CheckoutList",
     "BookDetail",
@@ -37,6 +40,15 @@ __all__ = (
 
 DOMAIN_NAME: str = "https://lib.bible.ac.kr"
 
+
+class IParserPrecondition(Registrable, metaclass=ABCMeta):
+    @staticmethod
+    @abstractmethod
+    def is_blocking(response: Response) -> Optional[ErrorData]:
+        """ 진행할 수 없는 사전조건인 경우 ErrorData, 그렇지 않은 경우 None """
+        pass
+
+
 _ParserPrecondition = ParserPrecondition(IParserPrecondition)
 
 
@@ -51,6 +63,7 @@ class _SessionExpiredChecker(IParserPrecondition):
 
 
 class Login(ILoginFetcher, IParser):
+    SMALL_PARSE_MODE: ParseMode = ParseMode.INLINE
     URL: str = DOMAIN_NAME + "/Account/LogOn"
 
     @classmethod
@@ -79,8 +92,9 @@ class Login(ILoginFetcher, IParser):
             [상황 1] 잘못된 입력값
             [상황 2] 서비스 이용 불가한 졸업예정자
             [상황 3] 인코딩, 잘못된 경로 입력
+
+        헤더와 텍스트 스캔만으로 판단하며, 스캔으로 해석할 수 없는 경우에만 soup 을 생성함
         """
-        soup = response.soup
         # 로그인 성공
         if response.status == 302:
             iat = httpdate_to_unixtime(response.headers["date"])
@@ -89,14 +103,19 @@ class Login(ILoginFetcher, IParser):
             )
         # 로그인 실패: [상황 2] 일시 [상항 1] alert 보다 먼저 알림
         if "location" not in response.headers:
-            alerts: List[str] = extract_alerts(response.soup)
-            alerts.append(soup.select_one(".alert-warning").text.strip())
+            alerts: List[str] = response.alerts
+            warning = scan_element_text(response.text, class_="alert-warning")
+            if warning is None:
+                warning_tag = response.soup.select_one(".alert-warning")
+                warning = warning_tag.text if warning_tag else ""
+            if warning.strip():
+                alerts.append(warning.strip())
             alert = alerts[0] if alerts else ""
             return ErrorData(
                 error={"title": alert, "alert_messages": alerts}, link=response.url
             )
         # 로그인 실패: [상황 3]
-        m = re.search(r"ErrorCode=(\d+)", response.headers["location"])
+        m = LIBRARY_ERROR_CODE.search(response.headers["location"])
         if m:
             error_code = m.group(1)
             return ErrorData(
@@ -146,7 +165,7 @@ class CheckoutList(IParser):
         return ResourceData(data={"head": head, "body": body}, link=response.url)
 
 
-class BookDetail:
+class BookDetail(IParser):
     @classmethod
     async def fetch(
         cls,
@@ -166,12 +185,16 @@ class BookDetail:
         isbn = soup.select("#detailtoprightnew .sponge-book-list-data")[1].text.strip()
         img_url = soup.select_one(".page-detail-title-image a img")["src"]
 
-        if not re.match(r"https?://", img_url):
+        if not HTTP_URL.match(img_url):
             img_url = None
         return [isbn, img_url]
 
 
-class BookPhoto:
+class BookPhoto(IParser):
+    MAX_BODY_SIZE: Optional[int] = 4 * 1024 * 1024
+    # 도서 표지 이미지(image/*) 또는 이미지를 불러오지 못한 경우의 html
+    CONTENT_TYPES: Optional[Tuple[str, ...]] = ("image/", "text/html")
+
     @classmethod
     async def fetch(
         cls,
@@ -1,6 +1,5 @@
 from abc import ABCMeta, abstractmethod
 from typing import Optional, Dict, List, Tuple
-import re
 
 from .base import (
     ILoginFetcher,
@@ -13,16 +12,26 @@ from .base import (
     IGeneralFetcher,
     ISemesterFetcher,
     ParserPrecondition,
+    ParseMode,
 )
 from ..exceptions import ParsingError
 from ..reqeust import Response
+from ..registry import Registrable
 from .common import (
     httpdate_to_unixtime,
-    extract_alerts,
     urlencode,
     SemesterConverter,
     parse_table,
 )
+from ._patterns import (
+    DIGITS,
+    KOREAN_NAME,
+    STUDENT_ID,
+    MAJOR_NAME,
+    LMS_COURSE_ID,
+    BRACKETED,
+    LMS_LOGIN_ERROR_CODE,
+)
 
 __all__ = (
     "IParserPrecondition",
@@ -35,7 +44,7 @@ __all__ = (
 DOMAIN_NAME: str = "https://lms.bible.ac.kr"  # with protocol
 
 
-class IParserPrecondition(metaclass=ABCMeta):
+class IParserPrecondition(Registrable, metaclass=ABCMeta):
     @staticmethod
     @abstractmethod
     def is_blocking(response: Response) -> Optional[ErrorData]:
@@ -91,6 +100,7 @@ def _extract_semester(response: Response) -> SemesterData:
 
 
 class Login(ILoginFetcher, IParser):
+    SMALL_PARSE_MODE: ParseMode = ParseMode.INLINE
     URL: str = DOMAIN_NAME + "/login/index.php"
     LOGIN_ERROR = {
         "1": "현재, 브라우저의 쿠키가 작동하지 않습니다.",
@@ -115,13 +125,15 @@ class Login(ILoginFetcher, IParser):
 
     @classmethod
     def parse(cls, response: Response) -> APIResponseType:
+        """ location 헤더와 alert 스캔(Response.alerts)만으로 판단하므로 soup 을 생성하지 않음 """
         # 로그인 실패
         if "location" not in response.headers:
-            alerts = extract_alerts(response.soup)
+            alerts = response.alerts
+            alert = alerts[0] if alerts else ""
             return ErrorData(
-                error={"title": alerts[0], "alert_messages": alerts}, link=response.url,
+                error={"title": alert, "alert_messages": alerts}, link=response.url,
             )
-        m = re.search(r"errorcode=(\d+)", response.headers["location"])
+        m = LMS_LOGIN_ERROR_CODE.search(response.headers["location"])
         # 로그인 실패
         if m:
             error_code = m.group(1)
@@ -147,15 +159,15 @@ class Profile(IGeneralFetcher, IParser):
 
     @staticmethod
     def validate_name(name: str) -> bool:
-        return bool(re.search(r"^[가-힣]{2,}$", name))
+        return bool(KOREAN_NAME.search(name))
 
     @staticmethod
     def validate_sid(univ_id: str) -> bool:
-        return bool(re.search(r"^[a-zA-Z]{,1}\d{3,9}$", univ_id))
+        return bool(STUDENT_ID.search(univ_id))
 
     @staticmethod
     def validate_major(major: str) -> bool:
-        return bool(re.search(r"^[가-힣]{3,17}$", major))
+        return bool(MAJOR_NAME.search(major))
 
     @classmethod
     async def fetch(
@@ -282,11 +294,11 @@ class CourseList(ISemesterFetcher, IParser):
 
         courses: Dict[str, str] = {}
         for each in soup.find_all("a", attrs={"class": "coursefullname"}):
-            course_code_matching = re.search(r"[?&]id=(\d+)", each["href"])
+            course_code_matching = LMS_COURSE_ID.search(each["href"])
             if not course_code_matching:
                 raise ParsingError("url에서 강좌 코드번호를 추출할 수 없습니다.", response)
             course_code = course_code_matching.group(1)
-            lecture_name = re.sub(r"\[.*?\]", "", each.get_text(strip=True))
+            lecture_name = BRACKETED.sub("", each.get_text(strip=True))
             courses[lecture_name] = course_code
 
         semester: SemesterData = _extract_semester(response)
@@ -344,7 +356,7 @@ class Attendance(IParser):
         result = {}
         for each in tfoot.find_all("span"):
             key = each.contents[0].get_text(strip=True)
-            value = re.search(r"\d+", each.contents[1])
+            value = DIGITS.search(each.contents[1])
             if not value:
                 raise ParsingError("테이블 foot에서 수치를 발견할 수 없습니다.", response)
             result[key] = value.group()
@@ -3,6 +3,7 @@ from abc import ABCMeta, abstractmethod
 from dataclasses import asdict
 
 from ..reqeust import Response
+from ..registry import Registrable
 from ..exceptions import ParsingError
 from .base import (
     HTTPClient,
@@ -12,11 +13,12 @@ from .base import (
     ErrorData,
     ResourceData,
     ParserPrecondition,
+    ParseMode,
 )
-from .common import extract_alerts, httpdate_to_unixtime
+from .common import httpdate_to_unixtime, extract_rows
 from ._mileage import (
     translate_mileage_req,
-    translate_statement_type,
+    translate_statement_types,
     SearchParamData,
     StatementParamData,
 )
@@ -30,7 +32,7 @@ __all__ = (
 DOMAIN_NAME: str = "https://asp.netusys.com"
 
 
-class IParserPrecondition(metaclass=ABCMeta):
+class IParserPrecondition(Registrable, metaclass=ABCMeta):
     @staticmethod
     @abstractmethod
     def is_blocking(response: Response) -> Optional[ErrorData]:
@@ -52,6 +54,7 @@ class _SessionExpiredChecker(IParserPrecondition):
 
 
 class Login(ILoginFetcher, IParser):
+    SMALL_PARSE_MODE: ParseMode = ParseMode.INLINE
     URL: str = DOMAIN_NAME + "/login/login_check.jsp"
     DEFAULT_HEADERS: Dict[str, str] = {
         "referer": "https://asp.netusys.com/mobile/login/login_form.jsp?logoutFg=Y"
@@ -90,8 +93,10 @@ class Login(ILoginFetcher, IParser):
         성 공:          유효한 alert 없음, top.location.replace('/mobile/login/main.jsp?appfg=web&appYndHis=20200223201758');
         비밀번호 틀림:    유효한 alert 존재, top.location.replace('/mobile/login/login_form.jsp?logoutFg=Y');
         아이디가 틀림:    유효한 alert 존재, top.location.replace('/mobile/login/login_form.jsp?logoutFg=Y');
+
+        alert 스캔(Response.alerts)만으로 판단하므로 soup 을 생성하지 않음
         """
-        alerts = extract_alerts(response.soup)
+        alerts = response.alerts
         if alerts:
             return ErrorData(
                 error={"title": alerts[0], "alert_messages": alerts}, link=response.url
@@ -117,10 +122,7 @@ def _parse_xml_data(response: Response) -> ResourceData:
 
     search_param = response.etc["req"]
     head: List[str] = translate_mileage_req(search_param.get_req())
-    body: List[List[str]] = [
-        [td.get_text(strip=True) for td in each.find_all("td")]
-        for each in data_container.find_all("tr")
-    ]
+    body: List[List[str]] = extract_rows(data_container)
     page_num: str = search_param.get_page_num()
 
     if body:
@@ -135,6 +137,7 @@ def _parse_xml_data(response: Response) -> ResourceData:
 
 
 class Search(IParser):
+    PARSE_SIZE_THRESHOLD: int = 32 * 1024
     URL: str = DOMAIN_NAME + "/ddd.sheetAction"
 
     @classmethod
@@ -169,6 +172,7 @@ class Search(IParser):
 
 
 class Statement(IParser):
+    PARSE_SIZE_THRESHOLD: int = 32 * 1024
     URL: str = DOMAIN_NAME + "/ddd.sheetAction"
 
     @classmethod
@@ -205,6 +209,5 @@ class Statement(IParser):
         except ValueError:
             raise ParsingError("헤드에 마일리지변동 구분값이 존재하지 않습니다.", response)
         else:
-            for each in result.data["body"]:
-                each[type_index] = translate_statement_type(each[type_index])
+            translate_statement_types(result.data["body"], type_index)
         return result
@@ -0,0 +1,170 @@
+""" 여러 회원의 마일리지 내역(MileageAPI.Statement)을 한 번에 가져오기
+
+회원번호 목록(또는 Search 결과)을 받아 같은 세션(cookies)으로 여러 회원의 내역을 동시에 요청하고,
+끝난 순서대로 결과를 반환한다. 동시 요청 수(concurrency)와 초당 요청 수(rate)를 제한할 수 있다.
+
+    search = iter_pages(cookies, SearchParamData())
+    async for result in iter_statements(cookies, iter_customer_ids(search), concurrency=8, rate=10):
+        if result.error is None:
+            print(result.customer_id, len(result.body))
+
+- 구분(CHG_FG) 열은 Statement.parse 에서 translate_statement_types 로 변환됨
+- 회원별 요청, 파싱 실패는 결과의 error 로 전달되며, 세션 만료(ErrorData)는 ResponseError 로 전체 작업을 중단함
+"""
+from dataclasses import replace
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Union,
+)
+import asyncio
+
+from ..exceptions import (
+    RootError,
+    RequestError,
+    ParsingError,
+    ResponseTooLargeError,
+    ContentTypeError,
+)
+from ..reqeust.ratelimit import RateLimiter
+from .base import ResourceData
+from ._mileage import translate_mileage_req, StatementParamData
+from .mileage import Statement
+from .mileage_export import iter_pages
+
+__all__ = (
+    "StatementResult",
+    "iter_customer_ids",
+    "fetch_statement",
+    "iter_statements",
+)
+
+# 회원별로 처리하는 예외 (그 외의 예외는 전체 작업을 중단함)
+_CUSTOMER_ERRORS = (RequestError, ParsingError, ResponseTooLargeError, ContentTypeError)
+
+# 작업이 끝났음을 알리는 값
+_DONE = object()
+
+
+class StatementResult(NamedTuple):
+    customer_id: str
+    head: List[str]
+    body: List[List[str]]
+    error: Optional[RootError] = None
+
+
+async def iter_customer_ids(
+    pages: AsyncIterable[ResourceData], column: str = "회원번호"
+) -> AsyncIterator[str]:
+    """ Search 결과(iter_pages)에서 회원번호를 차례로 반환 (S_SAVENAME 에 CST_NO 가 있어야 함) """
+    async for page in pages:
+        index = page.data["head"].index(column)
+        for row in page.data["body"]:
+            yield row[index]
+
+
+async def fetch_statement(
+    cookies: Dict[str, str],
+    customer_id: str,
+    param: Optional[StatementParamData] = None,
+    *,
+    limiter: Optional[RateLimiter] = None,
+    timeout: Optional[float] = None,
+    **kwargs,
+) -> StatementResult:
+    """ 한 회원의 모든 페이지를 합친 내역, 회원별 예외는 error 로 반환 """
+    param = replace(param or StatementParamData()).set_customer_id(customer_id)
+    head = translate_mileage_req(param.get_req())
+    body: List[List[str]] = []
+    try:
+        async for page in iter_pages(
+            cookies, param, parser=Statement, limiter=limiter, timeout=timeout, **kwargs
+        ):
+            head = page.data["head"]
+            body.extend(page.data["body"])
+    except _CUSTOMER_ERRORS as e:
+        return StatementResult(customer_id, head, body, e)
+    return StatementResult(customer_id, head, body)
+
+
+async def iter_statements(
+    cookies: Dict[str, str],
+    customer_ids: Union[Iterable[str], AsyncIterable[str]],
+    param: Optional[StatementParamData] = None,
+    *,
+    concurrency: int = 8,
+    rate: Optional[float] = 10.0,
+    timeout: Optional[float] = None,
+    **kwargs,
+) -> AsyncIterator[StatementResult]:
+    """ 여러 회원의 내역을 동시에 가져와 끝난 순서대로 반환
+
+    concurrency: 동시에 처리하는 회원 수
+    rate: 초당 요청 수 (페이지 요청 기준, None 이면 제한 없음)
+    param: 회원번호 외의 요청 값 (S_SAVENAME, page_size 등)
+    반환을 멈추면(break) 진행 중인 요청은 취소됨
+    """
+    limiter = None if rate is None else RateLimiter(rate)
+    # 회원번호를 읽는 속도와 결과를 소비하는 속도에 맞춰 대기하도록 큐 크기를 제한
+    pending: "asyncio.Queue[Any]" = asyncio.Queue(concurrency)
+    results: "asyncio.Queue[Any]" = asyncio.Queue(concurrency)
+
+    async def feed():
+        if isinstance(customer_ids, AsyncIterable):
+            async for customer_id in customer_ids:
+                await pending.put(customer_id)
+        else:
+            for customer_id in customer_ids:
+                await pending.put(customer_id)
+        for _ in range(concurrency):
+            await pending.put(_DONE)
+
+    async def work():
+        while True:
+            customer_id = await pending.get()
+            if customer_id is _DONE:
+                break
+            result = await fetch_statement(
+                cookies, customer_id, param, limiter=limiter, timeout=timeout, **kwargs
+            )
+            await results.put(result)
+
+    async def run():
+        tasks = [asyncio.ensure_future(feed())]
+        tasks.extend(asyncio.ensure_future(work()) for _ in range(concurrency))
+        # 예외(세션 만료 등)도 결과 큐로 전달하여 반환하는 쪽에서 발생시킴
+        try:
+            await asyncio.gather(*tasks)
+        except asyncio.CancelledError:
+            # Python 3.7 에서는 CancelledError 가 Exception 이므로 먼저 처리
+            # (반환을 멈춘 경우 결과 큐가 가득 차 있으면 put 이 끝나지 않음)
+            raise
+        except Exception as e:
+            await results.put(e)
+        else:
+            await results.put(_DONE)
+        finally:
+            for each in tasks:
+                each.cancel()
+
+    task = asyncio.ensure_future(run())
+    try:
+        while True:
+            result = await results.get()
+            if result is _DONE:
+                break
+            if isinstance(result, Exception):
+                raise result
+            yield result
+    finally:
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
@@ -0,0 +1,445 @@
+""" 마일리지 시트 내보내기
+
+MileageAPI.Search(또는 Statement)의 페이지를 차례로 요청하여 행을 CSV, JSON Lines, Parquet 파일에 바로 기록한다.
+한 번에 한 페이지만 메모리에 유지하므로 전체 행 수와 관계없이 메모리 사용량이 일정하다.
+포인트, 금액, 횟수 열은 int, 날짜 열은 datetime.date 로 변환된다 (COLUMN_TYPES, 빈 값은 None).
+
+    param = SearchParamData().set_req("CST_NO|CST_NM|CST_CARD_NO|AVL_POINT|INS_DT")
+    count = await export(cookies, "members.parquet", param)
+
+- AdaptivePageSize 를 전달하면(export(..., adaptive=AdaptivePageSize(target=5.0))) 응답 시간에 따라 페이지 크기를 조절
+- Parquet 형식은 pyarrow 패키지 필요 (`pip install 'biblebot[parquet]'`), 페이지마다 row group 하나로 기록
+"""
+from abc import ABCMeta, abstractmethod
+from dataclasses import replace
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Sequence, Type, Union
+import csv
+import datetime
+import enum
+import json
+import os
+import time
+
+from ..exceptions import ResponseError, RequestTimeoutError, ResponseTooLargeError
+from ..reqeust.ratelimit import RateLimiter
+from .base import ErrorData, ResourceData
+from ._mileage import translate_mileage_req, SearchParamData, StatementParamData
+from .mileage import Search, Statement
+
+__all__ = (
+    "ColumnType",
+    "COLUMN_TYPES",
+    "ExportFormat",
+    "IExportWriter",
+    "CSVWriter",
+    "JSONLinesWriter",
+    "ParquetWriter",
+    "AdaptivePageSize",
+    "column_types",
+    "iter_pages",
+    "convert_rows",
+    "export",
+)
+
+MileageParamData = Union[SearchParamData, StatementParamData]
+
+
+@enum.unique
+class ColumnType(enum.Enum):
+    STRING = "string"
+    INTEGER = "integer"
+    DATE = "date"
+
+
+# S_SAVENAME 필드 -> 열 타입 (없는 필드는 STRING, 회원번호/카드번호는 앞자리 0 을 유지하도록 STRING)
+COLUMN_TYPES: Dict[str, ColumnType] = {
+    **dict.fromkeys(
+        (
+            "POINT",
+            "ACC_POINT",
+            "USE_POINT",
+            "ADJ_POINT",
+            "AVL_POINT",
+            "CST_USE_POINT",
+            "TERM_ACC_POINT",
+            "TERM_USE_POINT",
+            "TERM_ADJ_POINT",
+            "TERM_AVL_POINT",
+            "USESHOP_ACC_POINT",
+            "USESHOP_USE_POINT",
+            "USESHOP_ADJ_POINT",
+            "SALE_QTY",
+            "TOT_SALE_AMT",
+            "TOT_DC_AMT",
+            "DCM_SALE_AMT",
+            "ACC_SALE_CNT",
+            "ACC_SALE_AMT",
+            "USESHOP_ACC_SALE_CNT",
+            "USESHOP_ACC_SALE_AMT",
+        ),
+        ColumnType.INTEGER,
+    ),
+    **dict.fromkeys(
+        (
+            "CHG_DATE",
+            "SALE_DATE",
+            "INS_DT",
+            "F_SALE_DATE",
+            "L_SALE_DATE",
+            "USESHOP_F_SALE_DATE",
+            "USESHOP_L_SALE_DATE",
+        ),
+        ColumnType.DATE,
+    ),
+}
+
+
+def _to_integer(value: str) -> Optional[int]:
+    value = value.strip().replace(",", "")
+    return int(value) if value else None
+
+
+def _to_date(value: str) -> Optional[datetime.date]:
+    """ 2019-03-14, 2019.03.14, 20190314 형식 """
+    digits = "".join(ch for ch in value if ch.isdigit())
+    if not digits:
+        return None
+    if len(digits) != 8:
+        raise ValueError(value)
+    return datetime.date(int(digits[:4]), int(digits[4:6]), int(digits[6:]))
+
+
+def _to_string(value: str) -> str:
+    return value
+
+
+_CONVERTERS: Dict[ColumnType, Callable[[str], Any]] = {
+    ColumnType.STRING: _to_string,
+    ColumnType.INTEGER: _to_integer,
+    ColumnType.DATE: _to_date,
+}
+
+
+def column_types(param: MileageParamData) -> List[ColumnType]:
+    return [COLUMN_TYPES.get(each, ColumnType.STRING) for each in param.get_req().split("|")]
+
+
+def convert_rows(rows: List[List[str]], types: Sequence[ColumnType]) -> List[List[Any]]:
+    """ 파싱 결과(body)의 문자열을 열 타입으로 변환, 변환할 수 없는 값이 있으면 ValueError """
+    converters = [_CONVERTERS[each] for each in types]
+    try:
+        return [[convert(value) for convert, value in zip(converters, row)] for row in rows]
+    except ValueError as e:
+        raise ValueError(f"값을 변환할 수 없습니다. -> {e}") from e
+
+
+class AdaptivePageSize:
+    """ 응답 시간과 본문 크기로 페이지 크기를 조절 (iter_pages(adaptive=...))
+
+    행당 요청 시간과 행당 본문 크기를 지수 이동 평균으로 추정하여, 요청 시간이 target 초를 넘지 않고
+    본문 크기가 max_body 바이트(기본값: 파서 MAX_BODY_SIZE 의 절반)를 넘지 않는 가장 큰 페이지 크기를 사용
+    - 페이지 크기는 unit 의 2 거듭제곱 배(100, 200, 400, ...)이며 이미 받은 행 수의 약수로 선택 (페이지 경계 유지)
+    - 한 번에 두 배까지만 키움
+    - 요청 시간이 초과되거나(RequestTimeoutError) 본문이 너무 크면(ResponseTooLargeError) 페이지 크기를 절반으로 줄여
+      같은 위치부터 다시 요청하며, unit 보다 줄일 수 없으면 예외를 그대로 발생시킴
+    여러 iter_pages 호출(회원별 내역 등)에서 함께 사용하면 추정값을 공유함
+    """
+
+    def __init__(
+        self,
+        target: float = 5.0,
+        *,
+        unit: int = 100,
+        max_size: int = 51200,
+        max_body: Optional[int] = None,
+        smoothing: float = 0.5,
+    ):
+        self.target = target
+        self.unit = unit
+        self.max_size = max_size
+        self.max_body = max_body
+        self.smoothing = smoothing
+        # 다음 페이지에 사용할 크기, 첫 페이지는 param 의 page_size 에서 결정
+        self.size: Optional[int] = None
+        # 행당 요청 시간(초), 행당 본문 크기(bytes) 추정값
+        self.row_time: Optional[float] = None
+        self.row_bytes: Optional[float] = None
+
+    def _align(self, size: int, offset: int) -> int:
+        """ size 이하이고 offset 의 약수인 unit * 2^k 중 가장 큰 값 (없으면 0) """
+        if size < self.unit:
+            return 0
+        aligned = self.unit
+        while aligned * 2 <= min(size, self.max_size):
+            aligned *= 2
+        while aligned >= self.unit:
+            if offset % aligned == 0:
+                return aligned
+            aligned //= 2
+        return 0
+
+    def page_size(self, offset: int, initial: int) -> int:
+        """ offset 번째 행부터 요청할 페이지 크기 (initial: param 의 page_size)
+
+        정렬할 수 없는 경우(initial 이 unit 보다 작은 첫 페이지 등)에는 initial 을 그대로 사용
+        """
+        if self.size is None:
+            self.size = initial
+        return self._align(self.size, offset) or initial
+
+    def observe(self, rows: int, elapsed: float, body_size: int, max_body: Optional[int]):
+        if rows <= 0:
+            return
+        row_time, row_bytes = elapsed / rows, body_size / rows
+        if self.row_time is None:
+            self.row_time, self.row_bytes = row_time, row_bytes
+        else:
+            alpha = self.smoothing
+            self.row_time += alpha * (row_time - self.row_time)
+            self.row_bytes += alpha * (row_bytes - self.row_bytes)
+
+        size = self.target / self.row_time if self.row_time else self.max_size
+        max_body = self.max_body or max_body
+        if max_body is not None and self.row_bytes:
+            size = min(size, max_body / self.row_bytes)
+        self.size = max(min(int(size), rows * 2, self.max_size), self.unit)
+
+    def shrink(self, size: int, offset: int) -> bool:
+        """ offset 번째 행부터 size 페이지 요청이 실패한 경우 크기를 절반으로 줄임
+
+        offset 에서 더 작은 페이지를 요청할 수 없으면 False
+        """
+        if size <= self.unit:
+            return False
+        self.size = max(size // 2, self.unit)
+        if self.row_time is not None:
+            # 실패한 크기를 다시 선택하지 않도록 추정값을 보정
+            self.row_time = max(self.row_time, self.target / self.size)
+        return self._align(self.size, offset) > 0
+
+
+async def iter_pages(
+    cookies: Dict[str, str],
+    param: MileageParamData,
+    *,
+    parser: Optional[Type[Union[Search, Statement]]] = None,
+    limiter: Optional[RateLimiter] = None,
+    adaptive: Optional[AdaptivePageSize] = None,
+    timeout: Optional[float] = None,
+    **kwargs,
+) -> AsyncIterator[ResourceData]:
+    """ param 의 page_no 부터 마지막 페이지까지 파싱 결과를 차례로 반환 (param 은 변경하지 않음)
+
+    parser 를 생략하면 param 타입에 따라 Search 또는 Statement
+    limiter 를 전달하면 페이지 요청마다 limiter.acquire 로 요청 속도를 제한함
+    adaptive 를 전달하면 페이지마다 크기를 조절함 (반환되는 페이지의 page_n 은 그 페이지 크기 기준)
+    세션 만료 등 ErrorData 가 반환되면 ResponseError
+    """
+    if parser is None:
+        parser = Statement if isinstance(param, StatementParamData) else Search
+    page_size = int(param.get_page_size())
+    # 다음 페이지의 첫 행 위치
+    offset = (int(param.get_page_num()) - 1) * page_size
+    while True:
+        size = page_size if adaptive is None else adaptive.page_size(offset, page_size)
+        if limiter is not None:
+            await limiter.acquire()
+        page_param = replace(param).set_page_num(str(offset // size + 1))
+        page_param.set_page_size(str(size))
+        start = time.perf_counter()
+        try:
+            response = await parser.fetch(cookies, page_param, timeout=timeout, **kwargs)
+        except (RequestTimeoutError, ResponseTooLargeError):
+            if adaptive is None or not adaptive.shrink(size, offset):
+                raise
+            continue
+        elapsed = time.perf_counter() - start
+        result = await parser.parse_async(response)
+        if isinstance(result, ErrorData):
+            raise ResponseError(result.error["title"], response)
+
+        count = result.meta["current_size"]
+        if adaptive is not None:
+            max_body = parser.MAX_BODY_SIZE
+            adaptive.observe(count, elapsed, len(response.raw), max_body and max_body // 2)
+        yield result
+
+        offset += count
+        if count < size or offset >= int(result.meta["total_size"]):
+            return
+
+
+class IExportWriter(metaclass=ABCMeta):
+    """ 내보내기 파일 형식 인터페이스 (write 는 페이지마다 호출됨) """
+
+    def __init__(self, path: str, names: Sequence[str], types: Sequence[ColumnType]):
+        self.path = path
+        self.names = list(names)
+        self.types = list(types)
+
+    @abstractmethod
+    def write(self, rows: List[List[Any]]):
+        pass
+
+    @abstractmethod
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class CSVWriter(IExportWriter):
+    """ 날짜는 ISO 형식(2019-03-14), None 은 빈 값
+
+    엑셀에서 열 경우 encoding="utf-8-sig" 를 사용할 것
+    """
+
+    def __init__(
+        self,
+        path: str,
+        names: Sequence[str],
+        types: Sequence[ColumnType],
+        *,
+        encoding: str = "utf-8",
+    ):
+        super().__init__(path, names, types)
+        self._file = open(path, "w", encoding=encoding, newline="")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(self.names)
+
+    def write(self, rows: List[List[Any]]):
+        self._writer.writerows(rows)
+
+    def close(self):
+        self._file.close()
+
+
+def _json_default(obj: Any) -> str:
+    if isinstance(obj, datetime.date):
+        return obj.isoformat()
+    raise TypeError(f"직렬화할 수 없는 타입입니다. -> {type(obj).__name__}")
+
+
+class JSONLinesWriter(IExportWriter):
+    """ 한 줄에 한 행({"열 이름": 값}), 날짜는 ISO 형식 문자열 """
+
+    def __init__(self, path: str, names: Sequence[str], types: Sequence[ColumnType]):
+        super().__init__(path, names, types)
+        self._file = open(path, "w", encoding="utf-8")
+
+    def write(self, rows: List[List[Any]]):
+        names = self.names
+        self._file.writelines(
+            json.dumps(dict(zip(names, row)), ensure_ascii=False, default=_json_default) + "\n"
+            for row in rows
+        )
+
+    def close(self):
+        self._file.close()
+
+
+class ParquetWriter(IExportWriter):
+    """ 열 타입은 int64, date32, string, 페이지마다 row group 하나 """
+
+    def __init__(
+        self,
+        path: str,
+        names: Sequence[str],
+        types: Sequence[ColumnType],
+        *,
+        compression: str = "snappy",
+    ):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise ImportError(
+                "Parquet 형식은 사용할 수 없습니다. 패키지를 설치해주세요. (pip install 'biblebot[parquet]')"
+            )
+        super().__init__(path, names, types)
+        self._pa = pyarrow
+        arrow_types = {
+            ColumnType.STRING: pyarrow.string(),
+            ColumnType.INTEGER: pyarrow.int64(),
+            ColumnType.DATE: pyarrow.date32(),
+        }
+        self._schema = pyarrow.schema(
+            [(name, arrow_types[each]) for name, each in zip(self.names, self.types)]
+        )
+        self._writer = pyarrow.parquet.ParquetWriter(path, self._schema, compression=compression)
+
+    def write(self, rows: List[List[Any]]):
+        if not rows:
+            return
+        columns = [
+            self._pa.array([row[index] for row in rows], type=field.type)
+            for index, field in enumerate(self._schema)
+        ]
+        self._writer.write_table(self._pa.Table.from_arrays(columns, schema=self._schema))
+
+    def close(self):
+        self._writer.close()
+
+
+@enum.unique
+class ExportFormat(enum.Enum):
+    CSV = "csv"
+    JSONL = "jsonl"
+    PARQUET = "parquet"
+
+    @property
+    def writer(self) -> Type[IExportWriter]:
+        return _WRITERS[self]
+
+    @classmethod
+    def from_path(cls, path: str) -> "ExportFormat":
+        """ 파일 확장자로 형식 결정 (.csv, .jsonl, .parquet) """
+        extension = os.path.splitext(path)[1].lstrip(".").lower()
+        try:
+            return cls(extension)
+        except ValueError:
+            raise ValueError(f"확장자로 파일 형식을 알 수 없습니다. -> {path}")
+
+
+_WRITERS: Dict[ExportFormat, Type[IExportWriter]] = {
+    ExportFormat.CSV: CSVWriter,
+    ExportFormat.JSONL: JSONLinesWriter,
+    ExportFormat.PARQUET: ParquetWriter,
+}
+
+
+async def export(
+    cookies: Dict[str, str],
+    path: str,
+    param: Optional[MileageParamData] = None,
+    *,
+    file_format: Optional[ExportFormat] = None,
+    translate: bool = True,
+    convert: bool = True,
+    timeout: Optional[float] = None,
+    **kwargs,
+) -> int:
+    """ 마일리지 시트의 모든 페이지를 파일로 내보내고 기록한 행 수를 반환
+
+    param: 생략하면 SearchParamData() (S_SAVENAME 으로 열 선택, page_size 로 페이지 크기 결정)
+    file_format: 생략하면 path 의 확장자로 결정
+    translate: 열 이름을 파싱 결과의 head(회원번호 등)로 기록, False 이면 S_SAVENAME 필드(CST_NO 등)
+    convert: False 이면 모든 열을 문자열로 기록
+    """
+    param = param or SearchParamData()
+    file_format = file_format or ExportFormat.from_path(path)
+    fields = param.get_req()
+    names = translate_mileage_req(fields) if translate else fields.split("|")
+    types = column_types(param) if convert else [ColumnType.STRING] * len(names)
+
+    count = 0
+    with file_format.writer(path, names, types) as writer:
+        async for page in iter_pages(cookies, param, timeout=timeout, **kwargs):
+            rows = page.data["body"]
+            writer.write(convert_rows(rows, types) if convert else rows)
+            count += len(rows)
+    return count
@@ -0,0 +1,193 @@
+""" 파싱 결과의 직렬화 (캐시, 프로세스 간 통신용)
+
+ResourceData 등의 결과 타입은 datetime(NoticeData.date), dataclass(SemesterData), bytes(raw_image)를 포함하므로
+json.dumps 로 바로 직렬화할 수 없고, asdict 를 거치면 느리며 원래 타입으로 복원되지 않는다.
+
+이 모듈은 결과 타입의 필드 구성(스키마)을 알고 있는 직렬화기를 제공한다.
+- JSONSerializer: JSON 문자열
+- MsgpackSerializer: msgpack 바이너리 (msgpack 패키지 필요, `pip install 'biblebot[msgpack]'`)
+
+두 직렬화기 모두 tuple, datetime, bytes 와 결과 타입을 그대로 복원한다.
+buffers 리스트를 전달하면 bytes 는 본문에 포함하지 않고 buffers 에 추가되며(out-of-band), 본문에는 인덱스만 기록된다.
+"""
+from dataclasses import fields, is_dataclass
+from typing import Any, Dict, List, Optional, Tuple, Callable
+import base64
+import datetime
+import json
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+from .base import ResourceData, ErrorData, SemesterData
+from .kbu import NoticeData
+from ._mileage import SearchParamData, StatementParamData
+from .compact import (
+    CompactResourceData,
+    CompactErrorData,
+    CompactSemesterData,
+    CompactNoticeData,
+    CompactResponse,
+)
+
+__all__ = (
+    "register_type",
+    "JSONSerializer",
+    "MsgpackSerializer",
+)
+
+_TAG = "__t"
+_VALUE = "v"
+
+# 타입 이름 -> (클래스, 필드 이름)
+_SCHEMAS: Dict[str, Tuple[type, Tuple[str, ...]]] = {}
+_NAMES: Dict[type, str] = {}
+
+
+def register_type(cls: type, name: Optional[str] = None) -> type:
+    """ 직렬화할 dataclass 또는 NamedTuple 등록 (데코레이터로도 사용 가능) """
+    name = name or cls.__name__
+    if is_dataclass(cls):
+        names = tuple(each.name for each in fields(cls))
+    elif issubclass(cls, tuple) and hasattr(cls, "_fields"):
+        names = tuple(cls._fields)
+    else:
+        raise TypeError(
+            f"dataclass 또는 NamedTuple 만 등록할 수 있습니다. -> {cls.__name__}"
+        )
+    _SCHEMAS[name] = (cls, names)
+    _NAMES[cls] = name
+    return cls
+
+
+for _cls in (
+    ResourceData,
+    ErrorData,
+    SemesterData,
+    NoticeData,
+    SearchParamData,
+    StatementParamData,
+    CompactResourceData,
+    CompactErrorData,
+    CompactSemesterData,
+    CompactNoticeData,
+    CompactResponse,
+):
+    register_type(_cls)
+
+
+def _encode(obj: Any, buffers: Optional[List[bytes]], inline_bytes: Callable) -> Any:
+    cls = obj.__class__
+    if cls is str or cls is int or cls is float or cls is bool or obj is None:
+        return obj
+    if cls is list:
+        return [_encode(each, buffers, inline_bytes) for each in obj]
+    if cls is dict:
+        if _TAG in obj or any(key.__class__ is not str for key in obj):
+            pairs = [[key, value] for key, value in obj.items()]
+            return {_TAG: "dict", _VALUE: _encode(pairs, buffers, inline_bytes)}
+        return {
+            key: _encode(value, buffers, inline_bytes) for key, value in obj.items()
+        }
+
+    name = _NAMES.get(cls)
+    if name is not None:
+        _, names = _SCHEMAS[name]
+        values = [getattr(obj, each) for each in names]
+        return {_TAG: name, _VALUE: _encode(values, buffers, inline_bytes)}
+    if cls is tuple:
+        return {_TAG: "tuple", _VALUE: _encode(list(obj), buffers, inline_bytes)}
+    if cls is bytes or cls is bytearray:
+        if buffers is not None:
+            buffers.append(bytes(obj))
+            return {_TAG: "buffer", _VALUE: len(buffers) - 1}
+        return inline_bytes(bytes(obj))
+    if cls is datetime.datetime:
+        return {_TAG: "datetime", _VALUE: obj.isoformat()}
+    if cls is datetime.date:
+        return {_TAG: "date", _VALUE: obj.isoformat()}
+
+    # bs4.NavigableString, OrderedDict 처럼 기본 타입을 상속한 객체는 기본 타입으로 직렬화
+    for base in (str, int, float, list, dict, tuple):
+        if isinstance(obj, base):
+            return _encode(base(obj), buffers, inline_bytes)
+    raise TypeError(f"직렬화할 수 없는 타입입니다. -> {cls.__name__}")
+
+
+def _decode(obj: Any, buffers: Optional[List[bytes]]) -> Any:
+    cls = obj.__class__
+    if cls is list:
+        return [_decode(each, buffers) for each in obj]
+    if cls is not dict:
+        return obj
+
+    tag = obj.get(_TAG)
+    if tag is None:
+        return {key: _decode(value, buffers) for key, value in obj.items()}
+
+    value = obj[_VALUE]
+    schema = _SCHEMAS.get(tag)
+    if schema is not None:
+        return schema[0](*(_decode(each, buffers) for each in value))
+    if tag == "tuple":
+        return tuple(_decode(each, buffers) for each in value)
+    if tag == "dict":
+        return {_decode(k, buffers): _decode(v, buffers) for k, v in value}
+    if tag == "buffer":
+        if buffers is None:
+            raise ValueError(
+                "out-of-band 로 직렬화된 데이터입니다. buffers 를 전달해주세요."
+            )
+        return buffers[value]
+    if tag == "bytes":
+        return value if value.__class__ is bytes else base64.b64decode(value)
+    if tag == "datetime":
+        return datetime.datetime.fromisoformat(value)
+    if tag == "date":
+        return datetime.date.fromisoformat(value)
+    raise ValueError(f"알 수 없는 타입 태그입니다. -> {tag}")
+
+
+def _base64_bytes(data: bytes) -> Dict[str, Any]:
+    return {_TAG: "bytes", _VALUE: base64.b64encode(data).decode("ascii")}
+
+
+def _raw_bytes(data: bytes) -> Dict[str, Any]:
+    return {_TAG: "bytes", _VALUE: data}
+
+
+class JSONSerializer:
+    @staticmethod
+    def dumps(obj: Any, buffers: Optional[List[bytes]] = None) -> str:
+        """ buffers 를 전달하지 않으면 bytes 는 base64 로 본문에 포함됨 """
+        return json.dumps(
+            _encode(obj, buffers, _base64_bytes),
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
+
+    @staticmethod
+    def loads(data: str, buffers: Optional[List[bytes]] = None) -> Any:
+        return _decode(json.loads(data), buffers)
+
+
+class MsgpackSerializer:
+    @staticmethod
+    def _require():
+        if msgpack is None:
+            raise ImportError(
+                "이 직렬화기는 호출할 수 없습니다. msgpack 패키지를 설치해주세요."
+            )
+
+    @classmethod
+    def dumps(cls, obj: Any, buffers: Optional[List[bytes]] = None) -> bytes:
+        """ buffers 를 전달하지 않으면 bytes 는 msgpack bin 타입으로 본문에 포함됨 """
+        cls._require()
+        return msgpack.packb(_encode(obj, buffers, _raw_bytes), use_bin_type=True)
+
+    @classmethod
+    def loads(cls, data: bytes, buffers: Optional[List[bytes]] = None) -> Any:
+        cls._require()
+        return _decode(msgpack.unpackb(data, raw=False), buffers)
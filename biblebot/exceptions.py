@@ -8,9 +8,11 @@
             - ServerError
     - ResponseError (paramter에 response 가 추가됨)
         - ParsingError
+        - ResponseTooLargeError
+        - ContentTypeError
 """
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 if TYPE_CHECKING:
     from .reqeust import Response
@@ -23,6 +25,8 @@ __all__ = (
     "ClientError",
     "ServerError",
     "ParsingError",
+    "ResponseTooLargeError",
+    "ContentTypeError",
 )
 
 
@@ -41,13 +45,21 @@ class ResponseError(RootError):
         super().__init__(message)
         self.response = response
 
+    def __reduce__(self):
+        # 프로세스 풀의 워커에서 발생한 예외도 response 와 함께 전달되도록 함
+        return self.__class__, (*self.args, self.response)
+
 
 class RequestTimeoutError(RequestError):
     """ 요청 타임아웃 """
 
 
 class StatusError(RequestError):
-    """ HTTP 응답 코드가 400 이상인 경우 """
+    """ HTTP 응답 코드가 400 이상인 경우 (두 번째 인자로 response 를 전달) """
+
+    @property
+    def response(self) -> Optional["Response"]:
+        return self.args[1] if len(self.args) > 1 else None
 
 
 class ClientError(StatusError):
@@ -60,3 +72,11 @@ class ServerError(StatusError):
 
 class ParsingError(ResponseError):
     """ 구문 문석 에러 """
+
+
+class ResponseTooLargeError(ResponseError):
+    """ 응답 본문이 최대 크기를 넘어 수신을 중단한 경우 (response.raw 는 비어 있음) """
+
+
+class ContentTypeError(ResponseError):
+    """ 허용하지 않는 content-type 이라 본문을 받지 않은 경우 (response.raw 는 비어 있음) """
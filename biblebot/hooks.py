@@ -0,0 +1,290 @@
+""" 요청/파싱 계측(instrumentation) 훅
+
+HTTP 요청, soup 생성, 사전조건 검사, 파싱 시점에 이벤트를 발생시켜 등록된 핸들러로 전달한다.
+이벤트에는 이를 발생시킨 API 클래스 이름("intranet.Course" 등)이 태그로 붙는다.
+
+    from biblebot.hooks import Hooks, MetricsHandler, LoggingHandler
+
+    metrics = Hooks.add(MetricsHandler())
+    Hooks.add(LoggingHandler())
+
+등록된 핸들러가 없으면(기본값) 각 계측 지점은 Hooks.handlers 의 진리값만 검사하고 바로 원래 코드를 실행한다.
+
+이벤트 종류와 attrs
+    REQUEST_START: method, url
+    REQUEST_END: method, url, status, size, error, dns, connect, ttfb, retries
+        (dns, connect, ttfb 는 커넥터가 측정할 수 있는 경우에만 값이 있고, 그렇지 않으면 None)
+        (error 는 커넥터 또는 사후조건에서 발생한 예외 이름: RequestTimeoutError, ClientError, ServerError 등)
+    SOUP: size, features
+    PRECONDITION: blocked, checker
+    PARSE: method, mode, size, result, error
+        (mode 는 ParseMode.PROCESS 워커에서 파싱한 경우에만 "process", 이 경우 전송 시간이 포함됨)
+"""
+from abc import ABCMeta, abstractmethod
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, ClassVar, Counter, Dict, Iterator, NamedTuple, Optional, Tuple
+import collections
+import enum
+import logging
+import os
+import threading
+import time
+
+__all__ = (
+    "EventType",
+    "Event",
+    "IHookHandler",
+    "Hooks",
+    "NullHandler",
+    "LoggingHandler",
+    "Histogram",
+    "MetricsHandler",
+    "current_api",
+    "api_context",
+    "api_name",
+    "request_timings",
+)
+
+logger = logging.getLogger(__name__)
+
+
+@enum.unique
+class EventType(enum.Enum):
+    REQUEST_START = "request_start"
+    REQUEST_END = "request_end"
+    SOUP = "soup"
+    PRECONDITION = "precondition"
+    PARSE = "parse"
+
+
+class Event(NamedTuple):
+    type: EventType
+    api: Optional[str]
+    duration: Optional[float]
+    attrs: Dict[str, Any]
+
+
+class IHookHandler(metaclass=ABCMeta):
+    @abstractmethod
+    def handle(self, event: Event) -> None:
+        pass
+
+
+_current_api: "ContextVar[Optional[str]]" = ContextVar("biblebot_api", default=None)
+_request_timings: "ContextVar[Optional[Dict[str, Any]]]" = ContextVar(
+    "biblebot_request_timings", default=None
+)
+
+
+def current_api() -> Optional[str]:
+    """ 현재 실행 중인 API 클래스 이름 (계측이 꺼져 있거나 API 클래스 밖이면 None) """
+    return _current_api.get()
+
+
+def api_name(cls: type) -> str:
+    """ 이벤트 태그로 사용하는 API 클래스 이름: "모듈.클래스" (biblebot.api.intranet.Course -> intranet.Course) """
+    return f"{cls.__module__.rpartition('.')[2]}.{cls.__qualname__}"
+
+
+@contextmanager
+def api_context(name: Optional[str]) -> Iterator[None]:
+    """ 블록 안에서 발생하는 이벤트에 name 태그를 붙임 """
+    token = _current_api.set(name)
+    try:
+        yield
+    finally:
+        _current_api.reset(token)
+
+
+def request_timings() -> Optional[Dict[str, Any]]:
+    """ 진행 중인 요청의 세부 시간(dns, connect, ttfb, retries)을 기록할 dict
+
+    계측이 켜져 있을 때만 dict 이며, 커넥터는 측정할 수 있는 값만 채우면 됨
+    """
+    return _request_timings.get()
+
+
+class Hooks:
+    """ 훅 핸들러 설정
+
+    handlers 는 tuple 이므로 이벤트를 전달하는 도중에 핸들러가 추가/삭제되어도 안전함
+    핸들러는 등록한 프로세스에서만 호출됨 (ParseMode.PROCESS 워커로 복사된 핸들러는 호출되지 않음)
+    """
+
+    handlers: ClassVar[Tuple[IHookHandler, ...]] = ()
+    _pid: ClassVar[Optional[int]] = None
+
+    @classmethod
+    def add(cls, handler: IHookHandler) -> IHookHandler:
+        cls.handlers = cls.handlers + (handler,)
+        cls._pid = os.getpid()
+        return handler
+
+    @classmethod
+    def remove(cls, handler: IHookHandler):
+        cls.handlers = tuple(each for each in cls.handlers if each is not handler)
+
+    @classmethod
+    def clear(cls):
+        cls.handlers = ()
+
+    @classmethod
+    def emit(
+        cls,
+        event_type: EventType,
+        duration: Optional[float] = None,
+        *,
+        api: Optional[str] = None,
+        **attrs: Any,
+    ):
+        handlers = cls.handlers
+        if not handlers or cls._pid != os.getpid():
+            return
+        event = Event(event_type, api or _current_api.get(), duration, attrs)
+        for handler in handlers:
+            try:
+                handler.handle(event)
+            except Exception:
+                # 계측 오류가 요청/파싱을 실패시키지 않도록 기록만 함
+                logger.exception("훅 핸들러에서 오류가 발생했습니다. -> %r", handler)
+
+    @classmethod
+    @contextmanager
+    def measure(cls, event_type: EventType, **attrs: Any) -> Iterator[Dict[str, Any]]:
+        """ 블록의 실행 시간을 측정하여 이벤트 발생
+
+        블록 안에서 반환된 attrs 를 수정하면 이벤트에 반영되며, 예외가 발생하면 error 에 예외 이름을 기록함
+        """
+        start = time.perf_counter()
+        try:
+            yield attrs
+        except BaseException as e:
+            # asyncio.CancelledError 도 기록 (취소된 요청)
+            attrs["error"] = type(e).__name__
+            cls.emit(event_type, time.perf_counter() - start, **attrs)
+            raise
+        cls.emit(event_type, time.perf_counter() - start, **attrs)
+
+    @classmethod
+    @contextmanager
+    def timings(cls) -> Iterator[Dict[str, Any]]:
+        """ 요청 하나의 세부 시간을 기록할 dict 를 커넥터에 노출 (request_timings) """
+        timings: Dict[str, Any] = {}
+        token = _request_timings.set(timings)
+        try:
+            yield timings
+        finally:
+            _request_timings.reset(token)
+
+
+class NullHandler(IHookHandler):
+    """ 아무것도 하지 않는 핸들러 (핸들러 자리를 채우거나 계측 비용만 측정할 때 사용) """
+
+    def handle(self, event: Event) -> None:
+        pass
+
+
+class LoggingHandler(IHookHandler):
+    def __init__(self, logger: Optional[logging.Logger] = None, level: int = logging.DEBUG):
+        self.logger = logger or logging.getLogger(__name__)
+        self.level = level
+
+    def handle(self, event: Event) -> None:
+        if not self.logger.isEnabledFor(self.level):
+            return
+        duration = "-" if event.duration is None else f"{event.duration * 1000:.3f}ms"
+        attrs = " ".join(f"{key}={value}" for key, value in event.attrs.items())
+        self.logger.log(
+            self.level, "%s %s %s %s", event.type.value, event.api or "-", duration, attrs
+        )
+
+
+class Histogram:
+    """ 누적 버킷 히스토그램 (Prometheus histogram 과 같은 le 경계) """
+
+    DEFAULT_BUCKETS: ClassVar[Tuple[float, ...]] = (
+        0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+    )
+
+    def __init__(self, buckets: Optional[Tuple[float, ...]] = None):
+        self.buckets: Tuple[float, ...] = tuple(sorted(buckets or self.DEFAULT_BUCKETS))
+        # 마지막 칸은 +Inf 버킷
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self) -> Iterator[Tuple[float, int]]:
+        """ (le, 누적 개수), 마지막 le 는 inf """
+        total = 0
+        for le, count in zip(self.buckets + (float("inf"),), self.counts):
+            total += count
+            yield le, total
+
+    def quantile(self, q: float) -> float:
+        """ q 분위수가 속한 버킷의 상한 (관측값이 없으면 0) """
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        for le, total in self.cumulative():
+            if total >= rank:
+                return le
+        return float("inf")
+
+
+class MetricsHandler(IHookHandler):
+    """ 이벤트를 API 클래스별 카운터와 히스토그램으로 집계
+
+    counters: (이름, API, 구분) -> 값
+        ("requests", api, 상태 코드 또는 예외 이름), ("bytes", api, ""),
+        ("parses", api, 결과 타입 또는 예외 이름), ("preconditions", api, "blocked" | "passed")
+    histograms: (이름, API) -> Histogram
+        이름은 "request", "dns", "connect", "ttfb", "soup", "parse" (단위: 초)
+    """
+
+    def __init__(self, buckets: Optional[Tuple[float, ...]] = None):
+        self.buckets = buckets
+        self.counters: Counter[Tuple[str, str, str]] = collections.Counter()
+        self.histograms: Dict[Tuple[str, str], Histogram] = {}
+        self._lock = threading.Lock()
+
+    def _observe(self, name: str, api: str, value: Optional[float]):
+        if value is None:
+            return
+        try:
+            histogram = self.histograms[(name, api)]
+        except KeyError:
+            histogram = self.histograms[(name, api)] = Histogram(self.buckets)
+        histogram.observe(value)
+
+    def handle(self, event: Event) -> None:
+        api = event.api or ""
+        attrs = event.attrs
+        with self._lock:
+            if event.type is EventType.REQUEST_END:
+                outcome = attrs.get("error") or str(attrs.get("status"))
+                self.counters[("requests", api, outcome)] += 1
+                self.counters[("bytes", api, "")] += attrs.get("size") or 0
+                self._observe("request", api, event.duration)
+                for name in ("dns", "connect", "ttfb"):
+                    self._observe(name, api, attrs.get(name))
+            elif event.type is EventType.SOUP:
+                self._observe("soup", api, event.duration)
+            elif event.type is EventType.PRECONDITION:
+                outcome = "blocked" if attrs.get("blocked") else "passed"
+                self.counters[("preconditions", api, outcome)] += 1
+            elif event.type is EventType.PARSE:
+                outcome = attrs.get("error") or attrs.get("result") or ""
+                self.counters[("parses", api, outcome)] += 1
+                self._observe("parse", api, event.duration)
+
+    def reset(self):
+        with self._lock:
+            self.counters.clear()
+            self.histograms.clear()
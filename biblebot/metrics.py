@@ -0,0 +1,241 @@
+""" Prometheus 텍스트 형식의 스크래퍼 상태 지표 (선택 모듈)
+
+biblebot.hooks 의 이벤트를 사이트, API 클래스별 카운터와 지연 시간 히스토그램으로 집계하고,
+Prometheus 텍스트 노출 형식(text exposition format 0.0.4)으로 내보낸다.
+
+    from biblebot.hooks import Hooks
+    from biblebot.metrics import PrometheusHandler, start_http_server
+
+    metrics = Hooks.add(PrometheusHandler())
+    start_http_server(metrics, port=9464)  # http://localhost:9464/metrics
+
+레이블
+    site: API 클래스의 사이트 ("intranet", "lms", "kbu", "mileage", "library"),
+          API 클래스 밖에서 보낸 요청은 URL 의 호스트
+    api: API 클래스 이름 ("intranet.Course" 등), API 클래스 밖이면 ""
+"""
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from typing import Counter, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlsplit
+import collections
+import threading
+
+from .hooks import Event, EventType, Histogram, IHookHandler
+
+__all__ = (
+    "CONTENT_TYPE",
+    "PrometheusHandler",
+    "MetricsServer",
+    "start_http_server",
+)
+
+CONTENT_TYPE: str = "text/plain; version=0.0.4; charset=utf-8"
+
+# 지표 이름 -> (종류, 설명, 레이블 이름)
+_METRICS: Dict[str, Tuple[str, str, Tuple[str, ...]]] = {
+    "biblebot_requests_total": (
+        "counter",
+        "HTTP requests by response status",
+        ("site", "api", "status"),
+    ),
+    "biblebot_request_errors_total": (
+        "counter",
+        "HTTP requests that raised (RequestTimeoutError, ClientError, ServerError, ...)",
+        ("site", "api", "error"),
+    ),
+    "biblebot_response_bytes_total": (
+        "counter",
+        "Response body bytes received",
+        ("site", "api"),
+    ),
+    "biblebot_request_duration_seconds": (
+        "histogram",
+        "HTTP request latency including post-conditions",
+        ("site", "api"),
+    ),
+    "biblebot_parses_total": (
+        "counter",
+        "Parse calls by result type",
+        ("site", "api", "result"),
+    ),
+    "biblebot_parse_errors_total": (
+        "counter",
+        "Parse calls that raised (ParsingError, ...)",
+        ("site", "api", "error"),
+    ),
+    "biblebot_parse_duration_seconds": (
+        "histogram",
+        "Parse latency including soup build",
+        ("site", "api"),
+    ),
+    "biblebot_session_expired_total": (
+        "counter",
+        "Responses blocked by a session-expired precondition (ErrorData)",
+        ("site", "api"),
+    ),
+    "biblebot_preconditions_total": (
+        "counter",
+        "Precondition checks by outcome",
+        ("site", "api", "outcome"),
+    ),
+}
+
+_SESSION_EXPIRED_CHECKER: str = "_SessionExpiredChecker"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+
+
+def _labels(names: Tuple[str, ...], values: Tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_float(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value))
+
+
+class PrometheusHandler(IHookHandler):
+    """ 훅 이벤트를 Prometheus 지표로 집계하는 핸들러 """
+
+    def __init__(self, buckets: Optional[Tuple[float, ...]] = None):
+        self.buckets = buckets
+        self._counters: Dict[str, Counter[Tuple[str, ...]]] = {
+            name: collections.Counter()
+            for name, (kind, _, _) in _METRICS.items()
+            if kind == "counter"
+        }
+        self._histograms: Dict[str, Dict[Tuple[str, ...], Histogram]] = {
+            name: {} for name, (kind, _, _) in _METRICS.items() if kind == "histogram"
+        }
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _site(event: Event) -> str:
+        if event.api:
+            return event.api.partition(".")[0]
+        return urlsplit(event.attrs.get("url", "")).hostname or ""
+
+    def _observe(self, name: str, labels: Tuple[str, ...], value: float):
+        histograms = self._histograms[name]
+        try:
+            histogram = histograms[labels]
+        except KeyError:
+            histogram = histograms[labels] = Histogram(self.buckets)
+        histogram.observe(value)
+
+    def handle(self, event: Event) -> None:
+        if event.type is EventType.REQUEST_START or event.type is EventType.SOUP:
+            return
+        site, api = self._site(event), event.api or ""
+        attrs = event.attrs
+        counters = self._counters
+        with self._lock:
+            if event.type is EventType.REQUEST_END:
+                if attrs.get("status") is not None:
+                    counters["biblebot_requests_total"][(site, api, str(attrs["status"]))] += 1
+                if attrs.get("error"):
+                    counters["biblebot_request_errors_total"][(site, api, attrs["error"])] += 1
+                counters["biblebot_response_bytes_total"][(site, api)] += attrs.get("size") or 0
+                self._observe("biblebot_request_duration_seconds", (site, api), event.duration)
+            elif event.type is EventType.PARSE:
+                if attrs.get("error"):
+                    counters["biblebot_parse_errors_total"][(site, api, attrs["error"])] += 1
+                else:
+                    counters["biblebot_parses_total"][(site, api, attrs.get("result") or "")] += 1
+                self._observe("biblebot_parse_duration_seconds", (site, api), event.duration)
+            elif event.type is EventType.PRECONDITION:
+                outcome = "blocked" if attrs.get("blocked") else "passed"
+                counters["biblebot_preconditions_total"][(site, api, outcome)] += 1
+                if attrs.get("checker") == _SESSION_EXPIRED_CHECKER:
+                    counters["biblebot_session_expired_total"][(site, api)] += 1
+
+    def reset(self):
+        with self._lock:
+            for counter in self._counters.values():
+                counter.clear()
+            for histograms in self._histograms.values():
+                histograms.clear()
+
+    def _render_metric(self, name: str) -> Iterator[str]:
+        kind, help_text, label_names = _METRICS[name]
+        yield f"# HELP {name} {help_text}"
+        yield f"# TYPE {name} {kind}"
+        if kind == "counter":
+            for values, count in sorted(self._counters[name].items()):
+                yield f"{name}{_labels(label_names, values)} {count}"
+            return
+        for values, histogram in sorted(self._histograms[name].items()):
+            for le, count in histogram.cumulative():
+                le_label = f'le="{_format_float(le)}"'
+                yield f"{name}_bucket{_labels(label_names, values, le_label)} {count}"
+            yield f"{name}_sum{_labels(label_names, values)} {_format_float(histogram.sum)}"
+            yield f"{name}_count{_labels(label_names, values)} {histogram.count}"
+
+    def render(self) -> str:
+        """ Prometheus 텍스트 노출 형식 """
+        with self._lock:
+            lines: List[str] = []
+            for name in _METRICS:
+                lines.extend(self._render_metric(name))
+        return "\n".join(lines) + "\n"
+
+
+class _ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class MetricsServer:
+    """ /metrics 경로로 지표를 제공하는 HTTP 서버 (별도 데몬 스레드에서 실행) """
+
+    def __init__(self, handler: PrometheusHandler, port: int = 9464, addr: str = ""):
+        metrics = handler
+
+        class _RequestHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?", 1)[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = metrics.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = _ThreadingHTTPServer((addr, port), _RequestHandler)
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def port(self) -> int:
+        return self.httpd.server_address[1]
+
+    def start(self) -> "MetricsServer":
+        self._thread = threading.Thread(
+            target=self.httpd.serve_forever, name="biblebot-metrics", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+
+def start_http_server(
+    handler: PrometheusHandler, port: int = 9464, addr: str = ""
+) -> MetricsServer:
+    """ 지표 HTTP 서버를 데몬 스레드에서 시작 (port=0 이면 빈 포트를 사용, MetricsServer.port 로 확인) """
+    return MetricsServer(handler, port, addr).start()
@@ -0,0 +1,345 @@
+""" 느린 응답 수집(프로파일링 모드, opt-in)
+
+fetch 또는 parse 시간이 임계값 이상인 응답을 로컬 디렉터리에 벤치마크 픽스처(benchmarks/fixtures 의 manifest 형식)로
+저장하여, 재현하기 어려운 느린 응답을 오프라인에서 다시 파싱하고 측정할 수 있게 한다.
+
+    from biblebot.profiling import Profiler
+
+    Profiler.enable("slow-responses", parse_threshold=0.5, sample_rate=0.1, redact_values=("홍길동",))
+    # ...
+    $ python benchmarks/bench_parsers.py --directory slow-responses
+
+- 저장 시점은 parse 가 끝난 뒤이며, fetch 만 하고 parse 하지 않은 응답은 저장되지 않음
+- sample_rate 비율의 parse 호출은 cProfile 로 실행하고, 느린 경우 픽스처 옆에 .prof 파일로 저장 (python -m pstats 로 확인)
+- 쿠키 값과 Set-Cookie 헤더는 제거하고, URL/본문/etc 의 학번, 전화번호, 카드번호(redact_patterns)와 redact_values 는
+  같은 길이로 가림 (숫자는 0, 한글은 가, 영문은 x), 이미지 등 텍스트가 아닌 본문은 같은 크기의 0 바이트로 저장
+- 마일리지 시트는 S_SAVENAME 의 회원번호, 이름, 카드번호, 연락처, 생일, 주소 열(redact_fields)과 요청 값을 필드 단위로 가림
+- 그 외 HTML 페이지의 이름, 아이디 등은 기본으로 가리지 않으므로 redact_values 로 전달할 것
+- Profiler.enable 을 호출한 프로세스에서만 동작 (ParseMode.PROCESS 워커에서 파싱한 응답은 저장되지 않음)
+"""
+from dataclasses import fields, is_dataclass, replace
+from typing import Any, Callable, ClassVar, Dict, Iterable, Iterator, Optional, Set, Tuple, Pattern
+import cProfile
+import datetime
+import itertools
+import json
+import logging
+import mimetypes
+import os
+import random
+import re
+import threading
+import time
+
+from .hooks import Hooks, NullHandler
+from .reqeust import Response
+
+__all__ = ("Profiler",)
+
+logger = logging.getLogger(__name__)
+
+# 파싱 결과 타입 이름 -> manifest 의 expect
+_EXPECT: Dict[str, str] = {
+    "ResourceData": "resource",
+    "CompactResourceData": "resource",
+    "ErrorData": "error",
+    "CompactErrorData": "error",
+    "NoticeData": "notice",
+    "CompactNoticeData": "notice",
+    "list": "list",
+}
+
+_MANIFEST: str = "manifest.json"
+
+# 마일리지 시트(ddd.sheetAction) 응답의 행, 셀
+_SHEET_ROW_PATTERN = re.compile(r"(<TR\b[^>]*>)(.*?)(</TR\s*>)", flags=re.IGNORECASE | re.DOTALL)
+_SHEET_CELL_PATTERN = re.compile(r"(<TD\b[^>]*>)(.*?)(</TD\s*>)", flags=re.IGNORECASE | re.DOTALL)
+_CDATA_MARKER_PATTERN = re.compile(r"(<!\[CDATA\[|\]\]>)")
+
+
+def _mask_char(char: str) -> str:
+    if char.isdigit():
+        return "0"
+    if "가" <= char <= "힣":
+        return "가"
+    if char.isalpha():
+        return "x"
+    return char
+
+
+def _mask_text(text: str) -> str:
+    """ 파서의 형식 검사(학번, 이름 등)를 통과하도록 글자 종류와 길이는 유지 """
+    return "".join(_mask_char(char) for char in text)
+
+
+def _mask(match: "re.Match") -> str:
+    return _mask_text(match.group(0))
+
+
+def _redact_sheet(text: str, columns: Set[int]) -> str:
+    """ 마일리지 시트의 columns 번째 셀 값을 가림 (CDATA 표시는 유지) """
+
+    def cell(match: "re.Match", index: Iterator[int]) -> str:
+        if next(index) not in columns:
+            return match.group(0)
+        value = "".join(
+            each if _CDATA_MARKER_PATTERN.fullmatch(each) else _mask_text(each)
+            for each in _CDATA_MARKER_PATTERN.split(match.group(2))
+        )
+        return match.group(1) + value + match.group(3)
+
+    def row(match: "re.Match") -> str:
+        index = itertools.count()
+        cells = _SHEET_CELL_PATTERN.sub(lambda m: cell(m, index), match.group(2))
+        return match.group(1) + cells + match.group(3)
+
+    return _SHEET_ROW_PATTERN.sub(row, text)
+
+
+class Profiler:
+    """ 프로파일링 모드 설정
+
+    directory 가 None 이면(기본값) 꺼져 있음
+    """
+
+    directory: ClassVar[Optional[str]] = None
+    fetch_threshold: ClassVar[float] = 1.0
+    parse_threshold: ClassVar[float] = 0.5
+    sample_rate: ClassVar[float] = 0.0
+    max_fixtures: ClassVar[int] = 100
+    redact_patterns: ClassVar[Tuple[str, ...]] = (
+        # 학번 (9자리 숫자)
+        r"(?<!\d)\d{9}(?!\d)",
+        # 전화번호 (010-1234-5678, 02-123-4567, 01012345678)
+        r"(?<![\d-])0\d{1,2}-\d{3,4}-\d{4}(?![\d-])",
+        r"(?<!\d)01[016789]\d{7,8}(?!\d)",
+        # 카드번호 (16자리, 4자리마다 - 또는 공백으로 구분 가능)
+        r"(?<!\d)\d{4}(?:[- ]?\d{4}){3}(?!\d)",
+    )
+    # 마일리지 시트 열(S_SAVENAME)과 요청 값(etc 의 SearchParamData 등)에서 가릴 필드
+    redact_fields: ClassVar[Tuple[str, ...]] = (
+        "CST_NO",
+        "CST_NM",
+        "CST_CARD_NO",
+        "CST_ID",
+        "BIRTH_DATE",
+        "TEL_NO",
+        "HP_NO",
+        "ADDR",
+        "cst_nos",
+    )
+
+    _redact: ClassVar[Optional[Pattern]] = None
+    _handler: ClassVar[Optional[NullHandler]] = None
+    _pid: ClassVar[Optional[int]] = None
+    _saved: ClassVar[int] = 0
+    _sequence: ClassVar[Iterable[int]] = itertools.count(1)
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+    # cProfile 은 동시에 하나만 실행할 수 있음
+    _profile_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    @classmethod
+    def enable(
+        cls,
+        directory: str,
+        *,
+        fetch_threshold: Optional[float] = None,
+        parse_threshold: Optional[float] = None,
+        sample_rate: Optional[float] = None,
+        max_fixtures: Optional[int] = None,
+        redact_values: Iterable[str] = (),
+    ):
+        """ 프로파일링 모드를 켬
+
+        redact_values: redact_patterns, redact_fields 외에 가릴 문자열 (HTML 페이지의 이름, 아이디 등)
+        """
+        if fetch_threshold is not None:
+            cls.fetch_threshold = fetch_threshold
+        if parse_threshold is not None:
+            cls.parse_threshold = parse_threshold
+        if sample_rate is not None:
+            cls.sample_rate = sample_rate
+        if max_fixtures is not None:
+            cls.max_fixtures = max_fixtures
+        patterns = list(cls.redact_patterns)
+        patterns.extend(re.escape(value) for value in redact_values if value)
+        cls._redact = re.compile("|".join(patterns)) if patterns else None
+
+        os.makedirs(directory, exist_ok=True)
+        cls.directory = directory
+        cls._pid = os.getpid()
+        cls._saved = 0
+        # 계측 경로(IParser 의 fetch, parse 래퍼)를 거치도록 빈 핸들러를 등록
+        if cls._handler is None:
+            cls._handler = Hooks.add(NullHandler())
+
+    @classmethod
+    def disable(cls):
+        cls.directory = None
+        if cls._handler is not None:
+            Hooks.remove(cls._handler)
+            cls._handler = None
+
+    @classmethod
+    def _active(cls) -> bool:
+        return cls.directory is not None and cls._pid == os.getpid()
+
+    @classmethod
+    async def fetch(cls, func: Callable, parser: type, *args: Any, **kwargs: Any) -> Any:
+        """ fetch 시간을 응답에 기록 (parse 할 때 임계값과 비교) """
+        if not cls._active():
+            return await func(parser, *args, **kwargs)
+        start = time.perf_counter()
+        response = await func(parser, *args, **kwargs)
+        if isinstance(response, Response):
+            response._fetch_elapsed = time.perf_counter() - start
+        return response
+
+    @classmethod
+    def parse(
+        cls, func: Callable, parser: type, response: Response, *args: Any, **kwargs: Any
+    ) -> Any:
+        """ parse 를 실행하고, fetch 또는 parse 시간이 임계값 이상이면 응답을 픽스처로 저장 """
+        if not cls._active():
+            return func(parser, response, *args, **kwargs)
+
+        profile: Optional[cProfile.Profile] = None
+        if cls.sample_rate and random.random() < cls.sample_rate:
+            if cls._profile_lock.acquire(blocking=False):
+                profile = cProfile.Profile()
+        start = time.perf_counter()
+        try:
+            if profile is None:
+                result = func(parser, response, *args, **kwargs)
+            else:
+                profile.enable()
+                try:
+                    result = func(parser, response, *args, **kwargs)
+                finally:
+                    profile.disable()
+                    cls._profile_lock.release()
+        finally:
+            elapsed = time.perf_counter() - start
+
+        fetch_elapsed: Optional[float] = getattr(response, "_fetch_elapsed", None)
+        if elapsed >= cls.parse_threshold or (
+            fetch_elapsed is not None and fetch_elapsed >= cls.fetch_threshold
+        ):
+            try:
+                cls._save(
+                    parser, func.__name__, response, result, fetch_elapsed, elapsed, profile
+                )
+            except Exception:
+                # 수집 오류가 파싱을 실패시키지 않도록 기록만 함
+                logger.exception("느린 응답을 저장하지 못했습니다. -> %s", response.url)
+        return result
+
+    @classmethod
+    def redact(cls, value: str) -> str:
+        if cls._redact is None:
+            return value
+        return cls._redact.sub(_mask, value)
+
+    @classmethod
+    def _redact_fields(cls, value: Any) -> Any:
+        """ 데이터 클래스(마일리지 요청 값 등)의 redact_fields 필드를 가린 복사본 """
+        if not is_dataclass(value) or isinstance(value, type):
+            return value
+        changes = {
+            each.name: _mask_text(getattr(value, each.name))
+            for each in fields(value)
+            if each.name in cls.redact_fields and isinstance(getattr(value, each.name), str)
+        }
+        return replace(value, **changes) if changes else value
+
+    @classmethod
+    def _sheet_columns(cls, req: Any) -> Set[int]:
+        """ 요청 값의 S_SAVENAME 중 가릴 열 번호 (마일리지 시트가 아니면 빈 집합) """
+        get_req = getattr(req, "get_req", None)
+        if get_req is None:
+            return set()
+        return {
+            index
+            for index, name in enumerate(get_req().split("|"))
+            if name in cls.redact_fields
+        }
+
+    @classmethod
+    def _save(
+        cls,
+        parser: type,
+        method: str,
+        response: Response,
+        result: Any,
+        fetch_elapsed: Optional[float],
+        parse_elapsed: float,
+        profile: Optional[cProfile.Profile],
+    ):
+        from .api.serialize import JSONSerializer
+
+        expect = _EXPECT.get(type(result).__name__)
+        if expect is None:
+            return
+        directory = cls.directory
+        site = parser.__module__.rpartition(".")[2]
+        content_type = response.headers.get("content-type", "").split(";")[0].strip()
+        extension = mimetypes.guess_extension(content_type) or ".bin"
+        if extension in (".htm", ".jpe"):
+            extension = {".htm": ".html", ".jpe": ".jpg"}[extension]
+
+        if response.text:
+            text = cls.redact(response.text)
+            columns = cls._sheet_columns(response.etc.get("req"))
+            if columns:
+                text = _redact_sheet(text, columns)
+            body = text.encode("utf-8")
+        else:
+            body = bytes(len(response.raw))
+        entry: Dict[str, Any] = {
+            "parser": f"{parser.__module__}.{parser.__qualname__}",
+            "method": method,
+            "expect": expect,
+            "status": response.status,
+            "url": cls.redact(response.url),
+            "headers": {
+                key: cls.redact(value)
+                for key, value in response.headers.items()
+                if key not in ("set-cookie", "cookie")
+            },
+            "timings": {"fetch": fetch_elapsed, "parse": parse_elapsed},
+        }
+        if response.cookies:
+            entry["cookies"] = {key: "redacted" for key in response.cookies}
+        if response.etc:
+            etc = {key: cls._redact_fields(value) for key, value in response.etc.items()}
+            entry["etc"] = json.loads(cls.redact(JSONSerializer.dumps(etc)))
+
+        with cls._lock:
+            if cls._saved >= cls.max_fixtures:
+                return
+            cls._saved += 1
+            stamp = datetime.datetime.now().strftime("%Y%m%dT%H%M%S")
+            stem = f"{parser.__qualname__}-{stamp}-{next(cls._sequence)}"
+            entry = {"name": f"{site}.{stem}", **entry, "body": f"{site}/{stem}{extension}"}
+
+            os.makedirs(os.path.join(directory, site), exist_ok=True)
+            with open(os.path.join(directory, entry["body"]), "wb") as f:
+                f.write(body)
+            if profile is not None:
+                profile.dump_stats(os.path.join(directory, site, f"{stem}.prof"))
+
+            path = os.path.join(directory, _MANIFEST)
+            try:
+                with open(path, encoding="utf-8") as f:
+                    manifest = json.load(f)
+            except FileNotFoundError:
+                manifest = []
+            manifest.append(entry)
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(manifest, f, ensure_ascii=False, indent=1)
+        logger.info(
+            "느린 응답을 저장했습니다. -> %s (fetch %s, parse %.3fs)",
+            entry["name"],
+            "-" if fetch_elapsed is None else f"{fetch_elapsed:.3f}s",
+            parse_elapsed,
+        )
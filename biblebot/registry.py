@@ -0,0 +1,100 @@
+""" 파생 클래스 레지스트리
+
+사전조건(IParserPrecondition), 사후조건(IRequestPostCondition) 등 "기반 클래스의 모든 파생 클래스를 실행"하는
+구조에서 매 호출마다 __subclasses__() 를 탐색하지 않도록, 기반 클래스별로 정렬된 목록을 캐시한다.
+
+- 기반 클래스의 직접 파생 클래스는 자동으로 등록됨 (정의된 순서)
+- register(priority=...) 로 명시적으로 등록하거나 우선순위를 지정할 수 있음 (높을수록 먼저 실행)
+- unregister 로 자동 등록된 파생 클래스를 제외할 수 있음
+- 파생 클래스가 새로 정의되면(Registrable.__init_subclass__) 캐시가 무효화됨
+"""
+from typing import Dict, Set, Tuple, Optional, Iterator, ClassVar
+import inspect
+
+__all__ = (
+    "SubclassRegistry",
+    "Registrable",
+)
+
+
+class SubclassRegistry:
+    _registries: ClassVar[Dict[type, "SubclassRegistry"]] = {}
+
+    def __init__(self, baseclass: type):
+        self.baseclass = baseclass
+        self._priorities: Dict[type, int] = {}
+        self._excluded: Set[type] = set()
+        self._cache: Optional[Tuple[type, ...]] = None
+
+    @classmethod
+    def of(cls, baseclass: type) -> "SubclassRegistry":
+        """ 기반 클래스별 레지스트리 (없으면 생성) """
+        try:
+            return cls._registries[baseclass]
+        except KeyError:
+            registry = cls._registries[baseclass] = cls(baseclass)
+            return registry
+
+    @classmethod
+    def notify(cls, subclass: type):
+        """ 새 파생 클래스가 정의되었을 때 상위 클래스들의 레지스트리 캐시를 무효화 """
+        for base in subclass.__mro__[1:]:
+            registry = cls._registries.get(base)
+            if registry is not None:
+                registry.invalidate()
+
+    def register(self, subclass: Optional[type] = None, *, priority: int = 0):
+        """ 파생 클래스 등록, 데코레이터로도 사용 가능
+
+        @registry.register(priority=10)
+        class _Checker(IParserPrecondition): ...
+        """
+
+        def decorator(klass: type) -> type:
+            self._priorities[klass] = priority
+            self._excluded.discard(klass)
+            self.invalidate()
+            return klass
+
+        return decorator if subclass is None else decorator(subclass)
+
+    def unregister(self, subclass: type):
+        self._priorities.pop(subclass, None)
+        self._excluded.add(subclass)
+        self.invalidate()
+
+    def invalidate(self):
+        self._cache = None
+
+    @property
+    def subclasses(self) -> Tuple[type, ...]:
+        if self._cache is None:
+            discovered = [
+                each
+                for each in self.baseclass.__subclasses__()
+                if each not in self._excluded and not inspect.isabstract(each)
+            ]
+            discovered.extend(
+                each
+                for each in self._priorities
+                if each not in discovered and each not in self._excluded
+            )
+            # sorted 는 안정 정렬이므로 같은 우선순위는 정의(등록) 순서를 유지함
+            self._cache = tuple(
+                sorted(discovered, key=lambda each: -self._priorities.get(each, 0))
+            )
+        return self._cache
+
+    def __iter__(self) -> Iterator[type]:
+        return iter(self.subclasses)
+
+    def __len__(self) -> int:
+        return len(self.subclasses)
+
+
+class Registrable:
+    """ 파생 클래스 정의 시 SubclassRegistry 캐시를 무효화하는 mixin """
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        SubclassRegistry.notify(cls)
@@ -3,21 +3,33 @@ from .base import (
     Response,
     HTTPRequestMethod,
     IRequestPostCondition,
+    deadline,
+    remaining_time,
+    BodyLimits,
+    body_limits,
+    get_body_limits,
 )
 
-try:
-    from .aiohttp_conn import Request
-except ImportError:
-    pass
-
-try:
-    from .requests_conn import Request
-except ImportError:
-    pass
-
 __all__ = (
     "BaseRequest",
     "IRequestPostCondition",
     "Response",
     "HTTPRequestMethod",
+    "deadline",
+    "remaining_time",
+    "BodyLimits",
+    "body_limits",
+    "get_body_limits",
 )
+
+
+def __getattr__(name: str):
+    """ Request 는 처음 사용할 때 가져옴 (requests 가 설치되어 있으면 requests, 아니면 aiohttp 커넥터) """
+    if name != "Request":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        from .requests_conn import Request
+    except ImportError:
+        from .aiohttp_conn import Request
+    globals()["Request"] = Request
+    return Request
@@ -0,0 +1,114 @@
+""" DOM 을 생성하지 않고 응답 본문(text)을 훑는 미리 컴파일된 스캐너
+
+로그인, 세션 만료 검사처럼 <script> 안의 alert 메시지나 요소 하나의 텍스트만 필요한 경우
+BeautifulSoup 생성 비용을 피하기 위해 사용
+"""
+from typing import List, Iterable, Optional, Pattern
+from functools import lru_cache
+import html
+import re
+
+__all__ = (
+    "scan_scripts",
+    "scan_alerts",
+    "scan_element_text",
+)
+
+# 주석, <style> 안의 <script> 는 건너뛰도록 함께 찾음 (스크립트인 경우에만 그룹 1 이 있음)
+_SCRIPT_PATTERN = re.compile(
+    r"<!--.*?(?:-->|\Z)"
+    r"|<style\b[^>]*>.*?(?:</style\s*>|\Z)"
+    r"|<script\b[^>]*>(.*?)</script\s*>",
+    flags=re.IGNORECASE | re.DOTALL,
+)
+_ALERT_PATTERN = re.compile(r"[^a-zA-Z0-9_]*?alert\s*\((.+?)\)")
+_START_TAG_PATTERN = re.compile(r"<([a-zA-Z][a-zA-Z0-9]*)\b([^>]*)>")
+_CLASS_ATTR_PATTERN = re.compile(r"""\bclass\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+))""")
+_TAG_PATTERN = re.compile(r"<[^>]*>")
+# 태그로 해석되지 않는 구간 (주석, <script>/<style> 내용, CDATA), 닫히지 않았으면 본문 끝까지
+_RAW_TEXT_PATTERN = re.compile(
+    r"<!--.*?(?:-->|\Z)"
+    r"|<script\b[^>]*>.*?(?:</script\s*>|\Z)"
+    r"|<style\b[^>]*>.*?(?:</style\s*>|\Z)"
+    r"|<!\[CDATA\[.*?(?:\]\]>|\Z)",
+    flags=re.IGNORECASE | re.DOTALL,
+)
+
+
+def scan_scripts(text: str) -> List[str]:
+    """ html 텍스트에서 <script> 태그의 내용만 추출 (주석, <style> 안의 태그는 제외) """
+    return [m.group(1) for m in _SCRIPT_PATTERN.finditer(text) if m.group(1) is not None]
+
+
+def _unquote_alert(message: str):
+    message = message.strip()
+    if not message:
+        return None
+    f, e = message[0], message[-1]
+    if f == e and (f == "'" or f == '"'):
+        return message.strip(f)
+
+
+def scan_alerts(scripts: Iterable[str]) -> List[str]:
+    """ <script> 텍스트에서 따옴표로 감싼 alert 메시지 추출 """
+    result = []
+    for each in scripts:
+        if "alert" not in each:
+            continue
+        for message in _ALERT_PATTERN.findall(each):
+            alert = _unquote_alert(message)
+            if alert:
+                result.append(alert)
+    return result
+
+
+@lru_cache(maxsize=None)
+def _end_tag_pattern(tag: str) -> Pattern:
+    return re.compile(rf"</{tag}\s*>", flags=re.IGNORECASE)
+
+
+@lru_cache(maxsize=None)
+def _nested_tag_pattern(tag: str) -> Pattern:
+    return re.compile(rf"<{tag}\b", flags=re.IGNORECASE)
+
+
+def _blank_raw_text(text: str) -> str:
+    """ 주석, <script>, <style>, CDATA 구간을 같은 길이의 공백으로 바꿈 (위치는 그대로 유지) """
+    return _RAW_TEXT_PATTERN.sub(lambda m: " " * len(m.group()), text)
+
+
+def _has_class(attrs: str, class_: str) -> bool:
+    m = _CLASS_ATTR_PATTERN.search(attrs)
+    if not m:
+        return False
+    return class_ in next(value for value in m.groups() if value is not None).split()
+
+
+def scan_element_text(
+    text: str, tag: Optional[str] = None, class_: Optional[str] = None
+) -> Optional[str]:
+    """ 조건(태그 이름, class)에 맞는 첫 번째 요소의 텍스트(get_text() 와 같음)를 DOM 없이 추출
+
+    주석, <script>, <style>, CDATA 안의 태그는 요소로 보지 않음 (BeautifulSoup 과 같음)
+    요소를 찾지 못한 경우 빈 문자열
+    같은 태그가 중첩되거나 주석/스크립트가 포함되었거나 닫는 태그가 없어 정확히 추출할 수 없는 경우 None
+    (호출하는 쪽에서 soup 으로 처리할 것)
+    """
+    masked = _blank_raw_text(text)
+    for m in _START_TAG_PATTERN.finditer(masked):
+        name, attrs = m.group(1), m.group(2)
+        if tag is not None and name.lower() != tag:
+            continue
+        if class_ is not None and not _has_class(attrs, class_):
+            continue
+
+        end = _end_tag_pattern(name.lower()).search(masked, m.end())
+        if not end:
+            return None
+        inner = text[m.end() : end.start()]
+        if masked[m.end() : end.start()] != inner:
+            return None
+        if _nested_tag_pattern(name.lower()).search(inner):
+            return None
+        return html.unescape(_TAG_PATTERN.sub("", inner))
+    return ""
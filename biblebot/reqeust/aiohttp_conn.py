@@ -3,9 +3,12 @@ try:
 except ImportError:
     raise ImportError("이 커넥터는 호출할 수 없습니다. 패키지를 설치해주세요.")
 
-from typing import Optional, Dict
+from typing import Optional, Dict, ClassVar
 from http.cookies import SimpleCookie
 from concurrent.futures._base import TimeoutError as _TimeoutError
+import asyncio
+import time
+import weakref
 
 from .base import (
     BaseRequest,
@@ -13,13 +16,93 @@ from .base import (
     HTTPRequestMethod,
     BodyFormatter,
     DEFAULT_REQUEST_TIMEOUT,
+    BodyLimits,
+    get_body_limits,
 )
 from ..exceptions import RequestTimeoutError
+from ..hooks import request_timings
+from .proxy import ProxyPool
+
+# 본문 크기 제한이 있을 때 한 번에 읽는 크기
+_CHUNK_SIZE = 64 * 1024
+
+
+def _mark(name: str):
+    async def on_event(session, context, params):
+        context.trace_request_ctx[name] = time.perf_counter()
+
+    return on_event
+
+
+def _elapsed(name: str, since: str):
+    async def on_event(session, context, params):
+        timings = context.trace_request_ctx
+        if since in timings:
+            timings[name] = time.perf_counter() - timings[since]
+
+    return on_event
+
+
+# 계측이 켜져 있을 때(biblebot.hooks) DNS 조회, 연결, 첫 바이트까지의 시간을 기록
+_TRACE_CONFIG = aiohttp.TraceConfig()
+_TRACE_CONFIG.on_request_start.append(_mark("_start"))
+_TRACE_CONFIG.on_dns_resolvehost_start.append(_mark("_dns"))
+_TRACE_CONFIG.on_dns_resolvehost_end.append(_elapsed("dns", "_dns"))
+_TRACE_CONFIG.on_connection_create_start.append(_mark("_connect"))
+_TRACE_CONFIG.on_connection_create_end.append(_elapsed("connect", "_connect"))
+_TRACE_CONFIG.on_request_end.append(_elapsed("ttfb", "_start"))
 
 
 class Request(BaseRequest):
+    """ aiohttp 커넥터
+
+    프록시 연결(aiohttp_socks.ProxyConnector)은 이벤트 루프, 프록시 URL 별로 하나씩 만들어 재사용함
+    (종료할 때 Request.close() 로 닫을 것)
+    PROXY_POOL 을 지정하면 proxies 를 전달하지 않은 요청은 풀에서 선택한 프록시를 사용함
+    """
+
+    PROXY_POOL: ClassVar[Optional[ProxyPool]] = None
+    # 프록시별 최대 동시 연결 수
+    PROXY_LIMIT: ClassVar[int] = 100
+
+    _proxy_connectors: ClassVar[
+        "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, aiohttp.BaseConnector]]"
+    ] = weakref.WeakKeyDictionary()
+
+    @classmethod
+    def _proxy_connector(cls, url: str) -> aiohttp.BaseConnector:
+        connectors = cls._proxy_connectors.setdefault(asyncio.get_running_loop(), {})
+        connector = connectors.get(url)
+        if connector is None or connector.closed:
+            from aiohttp_socks import ProxyConnector
+
+            connector = connectors[url] = ProxyConnector.from_url(url, limit=cls.PROXY_LIMIT)
+        return connector
+
+    @classmethod
+    async def close(cls):
+        """ 현재 이벤트 루프의 프록시 연결을 모두 닫음 """
+        connectors = cls._proxy_connectors.pop(asyncio.get_running_loop(), {})
+        for connector in connectors.values():
+            await connector.close()
+
     @classmethod
     async def _request(
+        cls,
+        method: HTTPRequestMethod,
+        url: str,
+        *,
+        proxies: Optional[str] = None,
+        **kwargs,
+    ) -> Response:
+        pool = cls.PROXY_POOL
+        if proxies is not None or pool is None:
+            return await cls._send(method, url, proxies=proxies, **kwargs)
+        with pool.lease() as proxies:
+            return await cls._send(method, url, proxies=proxies, **kwargs)
+
+    @classmethod
+    async def _send(
         cls,
         method: HTTPRequestMethod,
         url: str,
@@ -34,11 +117,14 @@ class Request(BaseRequest):
         proxies: Optional[str] = None,
     ) -> Response:
         timeout = timeout or DEFAULT_REQUEST_TIMEOUT
-        if proxies is not None:
-            from aiohttp_socks import ProxyConnector
-
-            proxies = ProxyConnector.from_url(proxies)
-        async with aiohttp.ClientSession(connector=proxies) as session:
+        connector = None if proxies is None else cls._proxy_connector(proxies)
+        timings = request_timings()
+        trace = {} if timings is None else {"trace_request_ctx": timings}
+        async with aiohttp.ClientSession(
+            connector=connector,
+            connector_owner=connector is None,
+            trace_configs=None if timings is None else [_TRACE_CONFIG],
+        ) as session:
             try:
                 async with session.request(
                     method.value,
@@ -49,27 +135,54 @@ class Request(BaseRequest):
                     allow_redirects=allow_redirects,
                     timeout=aiohttp.ClientTimeout(total=timeout),
                     **{body_encoding.value: body},
+                    **trace,
                 ) as response:
-                    cookies = cls._to_cookie_dict(response.cookies)
-                    headers = dict(response.headers)
-                    raw = await response.read()
-                    try:
-                        text = await response.text()
-                    except UnicodeDecodeError:
-                        text = ""
-
-                    return Response(
+                    result = Response(
                         response.status,
                         url,
                         response.reason,
-                        headers,
-                        raw,
-                        text,
-                        cookies,
+                        dict(response.headers),
+                        cookies=cls._to_cookie_dict(response.cookies),
                     )
+                    limits = get_body_limits()
+                    if limits is None:
+                        result.raw = await response.read()
+                    else:
+                        result.raw = await cls._read(response, limits, result)
+                    result.text = cls._decode(response, result.raw)
+                    return result
             except _TimeoutError as e:
                 raise RequestTimeoutError(f"요청시간이 경과하였습니다. -> {timeout}초") from e
 
+    @staticmethod
+    async def _read(
+        response: aiohttp.ClientResponse, limits: BodyLimits, result: Response
+    ) -> bytes:
+        """ 본문을 나누어 받으며 제한을 넘으면 나머지를 받지 않고 예외 발생 (연결은 닫힘) """
+        limits.check_headers(result)
+        if limits.max_size is None:
+            return await response.read()
+        chunks = []
+        size = 0
+        async for chunk in response.content.iter_chunked(_CHUNK_SIZE):
+            size += len(chunk)
+            limits.check_size(size, result)
+            chunks.append(chunk)
+        return b"".join(chunks)
+
+    @staticmethod
+    def _decode(response: aiohttp.ClientResponse, raw: bytes) -> str:
+        """ response.text() 와 같은 인코딩으로 디코딩, 디코딩할 수 없는 본문(이미지)은 빈 문자열 """
+        try:
+            encoding = response.get_encoding()
+        except RuntimeError:
+            # 본문으로 인코딩을 추측하는 aiohttp 버전에서 스트리밍으로 받은 경우
+            encoding = response.charset or "utf-8"
+        try:
+            return raw.decode(encoding)
+        except (LookupError, UnicodeDecodeError):
+            return ""
+
     @staticmethod
     def _to_cookie_obj(cookies: Dict[str, str]) -> SimpleCookie:
         return SimpleCookie(cookies)
@@ -1,13 +1,35 @@
 """ HTTP Request/Response 추상화를 위한 클래스 """
 from abc import ABCMeta, abstractmethod
 from dataclasses import dataclass, field
-from typing import Dict, Optional, Awaitable, Any, Callable, Type
+from typing import (
+    Dict,
+    Optional,
+    Awaitable,
+    Any,
+    Callable,
+    Type,
+    List,
+    ClassVar,
+    Iterator,
+    NamedTuple,
+    Tuple,
+)
+from contextlib import contextmanager
+from contextvars import ContextVar
 from functools import wraps
 import enum
-
-from bs4 import BeautifulSoup
-
-from ..exceptions import ClientError, ServerError
+import time
+
+from ..exceptions import (
+    ClientError,
+    ServerError,
+    RequestTimeoutError,
+    ResponseTooLargeError,
+    ContentTypeError,
+)
+from ..registry import SubclassRegistry, Registrable
+from ..hooks import Hooks, EventType
+from ._scanner import scan_scripts, scan_alerts
 
 __all__ = (
     "Response",
@@ -16,15 +38,104 @@ __all__ = (
     "IRequestPostCondition",
     "BaseRequest",
     "DEFAULT_REQUEST_TIMEOUT",
+    "deadline",
+    "remaining_time",
+    "BodyLimits",
+    "body_limits",
+    "get_body_limits",
 )
 
 DEFAULT_REQUEST_TIMEOUT: float = 30.0
 
+# 현재 컨텍스트의 마감 시각 (time.monotonic 기준)
+_deadline: "ContextVar[Optional[float]]" = ContextVar("biblebot_deadline", default=None)
+
+
+@contextmanager
+def deadline(timeout: float) -> Iterator[float]:
+    """ 블록 안의 모든 요청이 공유하는 마감 시각 (여러 요청으로 이루어진 fetch 의 전체 시간 제한)
+
+    블록 안의 요청은 timeout 과 남은 시간 중 짧은 쪽을 제한 시간으로 사용하며, 마감 시각이 지나면 RequestTimeoutError
+    이미 마감 시각이 있는 경우(중첩) 더 이른 마감 시각을 사용함
+    """
+    at = time.monotonic() + timeout
+    current = _deadline.get()
+    if current is not None and current < at:
+        at = current
+    token = _deadline.set(at)
+    try:
+        yield at
+    finally:
+        _deadline.reset(token)
+
+
+def remaining_time() -> Optional[float]:
+    """ 마감 시각까지 남은 시간(초), 마감 시각이 없으면 None """
+    at = _deadline.get()
+    return None if at is None else at - time.monotonic()
+
+
+class BodyLimits(NamedTuple):
+    """ 응답 본문 제한 (커넥터는 본문을 받기 전 check_headers, 받는 동안 check_size 로 검사) """
+
+    # 최대 본문 크기(bytes, 압축 해제 후), None 이면 제한 없음
+    max_size: Optional[int] = None
+    # 허용하는 content-type 접두사 ("text/", "image/" 등), None 이면 모두 허용
+    # content-type 헤더가 없는 응답은 허용함
+    content_types: Optional[Tuple[str, ...]] = None
+
+    def check_headers(self, response: "Response") -> None:
+        """ 헤더만 받은 응답으로 content-type, content-length 검사 (본문을 디코딩하기 전) """
+        content_type = response.headers.get("content-type")
+        if self.content_types is not None and content_type:
+            mimetype = content_type.split(";", 1)[0].strip().lower()
+            if not mimetype.startswith(self.content_types):
+                raise ContentTypeError(f"허용하지 않는 응답 형식입니다. -> {mimetype}", response)
+        length = response.headers.get("content-length")
+        if length is not None and length.isdigit():
+            self.check_size(int(length), response)
+
+    def check_size(self, size: int, response: "Response") -> None:
+        if self.max_size is not None and size > self.max_size:
+            raise ResponseTooLargeError(
+                f"응답 본문이 최대 크기를 넘었습니다. -> {self.max_size}바이트", response
+            )
+
+    def check(self, response: "Response") -> None:
+        """ 본문까지 받은 응답 검사 (스트리밍하지 않는 커넥터용) """
+        self.check_headers(response)
+        self.check_size(len(response.raw), response)
+
+
+# 현재 컨텍스트의 응답 본문 제한 (API 클래스의 MAX_BODY_SIZE, CONTENT_TYPES)
+_body_limits: "ContextVar[Optional[BodyLimits]]" = ContextVar("biblebot_body_limits", default=None)
+
+
+@contextmanager
+def body_limits(
+    max_size: Optional[int] = None, content_types: Optional[Tuple[str, ...]] = None
+) -> Iterator[BodyLimits]:
+    """ 블록 안의 모든 요청에 적용할 응답 본문 제한 (중첩된 경우 안쪽 블록의 제한을 사용) """
+    limits = BodyLimits(max_size, None if content_types is None else tuple(content_types))
+    token = _body_limits.set(limits)
+    try:
+        yield limits
+    finally:
+        _body_limits.reset(token)
+
+
+def get_body_limits() -> Optional[BodyLimits]:
+    """ 현재 컨텍스트의 응답 본문 제한, 없으면 None """
+    return _body_limits.get()
+
 
 @dataclass
 class Response:
     """ HTTP Response 데이터 클래스 """
 
+    # soup 생성에 사용할 BeautifulSoup 파서 ("html.parser", "lxml", "html5lib" 등)
+    SOUP_FEATURES: ClassVar[str] = "html.parser"
+
     status: int
     url: str
     reason: str = ""
@@ -39,14 +150,56 @@ class Response:
     def __bool__(self):
         return bool(self.status)
 
+    def __getstate__(self):
+        """ 프로세스 간 전송(pickle) 시 캐시된 soup 은 제외 (워커에서 다시 생성) """
+        state = self.__dict__.copy()
+        state.pop("_soup", None)
+        return state
+
     @property
     def soup(self):
         try:
             return self._soup
         except AttributeError:
-            self._soup = BeautifulSoup(self.text, features="html.parser")
+            # bs4 는 처음 soup 을 생성할 때 가져옴 (import biblebot 시간 단축)
+            from bs4 import BeautifulSoup
+
+            if not Hooks.handlers:
+                self._soup = BeautifulSoup(self.text, features=self.SOUP_FEATURES)
+                return self._soup
+            with Hooks.measure(
+                EventType.SOUP, size=len(self.text), features=self.SOUP_FEATURES
+            ):
+                self._soup = BeautifulSoup(self.text, features=self.SOUP_FEATURES)
             return self._soup
 
+    @property
+    def scripts(self) -> List[str]:
+        """ <script> 태그의 텍스트 목록 (응답마다 한 번만 추출하여 사전조건 검사 등에서 재사용)
+
+        soup 이 이미 생성된 경우 soup 에서, 그렇지 않으면 DOM 생성 없이 text 에서 직접 추출
+        """
+        try:
+            return self._scripts
+        except AttributeError:
+            if hasattr(self, "_soup"):
+                self._scripts: List[str] = [
+                    each.text if each.text else str(each.string)
+                    for each in self._soup.find_all("script")
+                ]
+            else:
+                self._scripts: List[str] = scan_scripts(self.text)
+            return self._scripts
+
+    @property
+    def alerts(self) -> List[str]:
+        """ <script> 안의 alert 메시지 목록 (응답마다 한 번만 추출, 반환값은 복사본) """
+        try:
+            return list(self._alerts)
+        except AttributeError:
+            self._alerts: List[str] = scan_alerts(self.scripts)
+            return list(self._alerts)
+
     @property
     def etc(self):
         try:
@@ -68,10 +221,11 @@ class BodyFormatter(enum.Enum):
     JSON: str = "json"
 
 
-class IRequestPostCondition(metaclass=ABCMeta):
+class IRequestPostCondition(Registrable, metaclass=ABCMeta):
     """ HTTP request post-condition interface
 
     이 인터페이스를 상속한 모든 파생 클래스는 HTTP 응답 수신 이후 사후조건으로 실행됨
+    실행 순서와 등록은 IRequestPostCondition.registry 로 관리 (biblebot.registry.SubclassRegistry)
     """
 
     @staticmethod
@@ -91,18 +245,23 @@ class _StatusCheck(IRequestPostCondition):
     @staticmethod
     def check(response: Response) -> None:
         status = response.status
-        n = status % 100
+        n = status // 100
         if n == 4:
             raise ClientError(f"클라이언트 요청 오류입니다. -> 응답코드: {status}", response)
         elif n == 5:
             raise ServerError(f"서버 응답 오입니다. -> 응답코드: {status}", response)
 
 
+IRequestPostCondition.registry = SubclassRegistry.of(IRequestPostCondition)
+
+
 class PostCondition:
     """ HTTP Request 요청의 사전/사후조건 처리를 위한 데코레이터
 
-    사전조건: 타임아웃 설정
-    사후조건: 응답 객체에 대한 사후조건 처리 (heckConditionBase 의 파생 클래스 실행)
+    사전조건: 타임아웃 설정 (deadline 블록 안에서는 남은 시간으로 제한)
+    사후조건: 응답 객체에 대한 사후조건 처리 (IRequestPostCondition 의 파생 클래스 실행)
+        postcondition=False 를 전달하면 해당 요청의 사후조건 검사를 생략함
+    계측: 훅 핸들러가 등록된 경우 요청 시작/종료 이벤트 발생 (biblebot.hooks)
     """
 
     def __init__(self, method: HTTPRequestMethod):
@@ -113,17 +272,65 @@ class PostCondition:
     ) -> Callable[..., Awaitable[Response]]:
         @wraps(request)
         async def check_condition(
-            cls: Type["BaseRequest"], *args: Any, **kwargs: Any
+            cls: Type["BaseRequest"],
+            *args: Any,
+            postcondition: bool = True,
+            **kwargs: Any,
         ) -> Response:
-            response = await cls._request(self.method, *args, **kwargs)
+            if _deadline.get() is not None:
+                kwargs["timeout"] = self._bounded(kwargs.get("timeout"))
+            if Hooks.handlers:
+                return await self._instrumented(cls, postcondition, *args, **kwargs)
 
-            subclass: Type[IRequestPostCondition]
-            for subclass in IRequestPostCondition.__subclasses__():
-                subclass.check(response)
+            response = await cls._request(self.method, *args, **kwargs)
+            if postcondition:
+                self._check(response)
             return response
 
         return check_condition
 
+    @staticmethod
+    def _bounded(timeout: Optional[float]) -> float:
+        remaining = remaining_time()
+        if remaining <= 0:
+            raise RequestTimeoutError("요청 마감 시각이 지났습니다.")
+        # 커넥터의 오류 메시지에 표시되므로 ms 단위로 반올림 (0 은 제한 없음으로 해석될 수 있으므로 최소 1ms)
+        return min(timeout or DEFAULT_REQUEST_TIMEOUT, max(round(remaining, 3), 0.001))
+
+    @staticmethod
+    def _check(response: Response):
+        subclass: Type[IRequestPostCondition]
+        for subclass in IRequestPostCondition.registry:
+            subclass.check(response)
+
+    async def _instrumented(
+        self,
+        cls: Type["BaseRequest"],
+        postcondition: bool,
+        url: str,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Response:
+        """ 사후조건에서 발생한 예외(ClientError, ServerError)도 REQUEST_END 의 error 로 기록 """
+        method = self.method.value
+        Hooks.emit(EventType.REQUEST_START, method=method, url=url)
+        with Hooks.timings() as timings, Hooks.measure(
+            EventType.REQUEST_END, method=method, url=url, status=None, size=0, error=None
+        ) as attrs:
+            try:
+                response = await cls._request(self.method, url, *args, **kwargs)
+                attrs.update(status=response.status, size=len(response.raw))
+                if postcondition:
+                    self._check(response)
+            finally:
+                attrs.update(
+                    dns=timings.get("dns"),
+                    connect=timings.get("connect"),
+                    ttfb=timings.get("ttfb"),
+                    retries=timings.get("retries", 0),
+                )
+        return response
+
 
 class BaseRequest(metaclass=ABCMeta):
     """ HTTP Request abstract class
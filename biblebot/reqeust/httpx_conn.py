@@ -0,0 +1,163 @@
+""" httpx 기반 HTTP/2 커넥터
+
+요청마다 세션을 만드는 aiohttp, requests 커넥터와 달리 이벤트 루프마다 오래 유지되는 httpx.AsyncClient 를 사용한다.
+HTTP/2 를 지원하는 호스트(TLS ALPN)와는 호스트당 연결 하나로 여러 요청을 동시에 주고받고(multiplexing),
+지원하지 않는 호스트와는 HTTP/1.1 keep-alive 연결을 재사용한다.
+
+- 클라이언트는 (이벤트 루프, verify, proxies) 별로 생성되며, 종료할 때 Request.close() 로 닫을 것
+- 클라이언트의 쿠키 저장소는 사용하지 않음 (요청마다 전달한 cookies 만 전송, 응답 쿠키는 Response.cookies 로 반환)
+"""
+try:
+    import httpx
+except ImportError:
+    raise ImportError("이 커넥터는 호출할 수 없습니다. 패키지를 설치해주세요. (pip install 'biblebot[http2]')")
+
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import Any, ClassVar, Dict, Optional, Tuple
+import asyncio
+import time
+import weakref
+
+from .base import (
+    BaseRequest,
+    Response,
+    HTTPRequestMethod,
+    BodyFormatter,
+    DEFAULT_REQUEST_TIMEOUT,
+    BodyLimits,
+    get_body_limits,
+)
+from ..exceptions import RequestTimeoutError
+from ..hooks import request_timings
+
+__all__ = ("Request",)
+
+_ClientKey = Tuple[bool, Optional[str]]
+
+
+def _trace(timings: Dict[str, Any]):
+    """ httpcore trace 이벤트로 연결, 첫 바이트까지의 시간을 기록 (DNS 조회는 연결 시간에 포함됨) """
+    start = time.perf_counter()
+
+    async def on_event(name: str, info: Dict[str, Any]):
+        if name == "connection.connect_tcp.started":
+            timings["_connect"] = time.perf_counter()
+        elif name in ("connection.connect_tcp.complete", "connection.start_tls.complete"):
+            if "_connect" in timings:
+                timings["connect"] = time.perf_counter() - timings["_connect"]
+        elif name.endswith(".receive_response_headers.complete"):
+            timings["ttfb"] = time.perf_counter() - start
+
+    return on_event
+
+
+class Request(BaseRequest):
+    HTTP2: ClassVar[bool] = True
+    # 호스트별이 아닌 클라이언트 전체의 연결 수 제한 (HTTP/2 호스트는 연결 하나만 사용)
+    # 연결 수가 많을수록 httpcore 의 연결 풀 탐색 비용이 커짐 (benchmarks/bench_connectors.py 로 확인)
+    LIMITS: ClassVar[httpx.Limits] = httpx.Limits(
+        max_connections=20, max_keepalive_connections=20, keepalive_expiry=30.0
+    )
+
+    _clients: ClassVar[
+        "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[_ClientKey, httpx.AsyncClient]]"
+    ] = weakref.WeakKeyDictionary()
+
+    @classmethod
+    def _client(cls, verify: bool, proxies: Optional[str]) -> httpx.AsyncClient:
+        clients = cls._clients.setdefault(asyncio.get_running_loop(), {})
+        key = (verify, proxies)
+        try:
+            return clients[key]
+        except KeyError:
+            options: Dict[str, Any] = {
+                "http2": cls.HTTP2,
+                "verify": verify,
+                "limits": cls.LIMITS,
+                # 응답 쿠키가 다른 요청(다른 사용자)에 전송되지 않도록 모든 쿠키를 거부하는 저장소
+                "cookies": CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+            }
+            if proxies is not None:
+                try:
+                    client = httpx.AsyncClient(proxy=proxies, **options)
+                except TypeError:
+                    # httpx < 0.26
+                    client = httpx.AsyncClient(proxies=proxies, **options)
+            else:
+                client = httpx.AsyncClient(**options)
+            clients[key] = client
+            return client
+
+    @classmethod
+    async def close(cls):
+        """ 현재 이벤트 루프의 클라이언트(연결)를 모두 닫음 """
+        clients = cls._clients.pop(asyncio.get_running_loop(), {})
+        for client in clients.values():
+            await client.aclose()
+
+    @classmethod
+    async def _request(
+        cls,
+        method: HTTPRequestMethod,
+        url: str,
+        *,
+        headers: Optional[Dict[str, str]] = None,
+        body: Optional[Dict[str, str]] = None,
+        body_encoding: BodyFormatter = BodyFormatter.URL_ENCODE,
+        cookies: Dict[str, str] = None,
+        verify: bool = True,
+        allow_redirects: bool = False,
+        timeout: Optional[float] = None,
+        proxies: Optional[str] = None,
+    ) -> Response:
+        timeout = timeout or DEFAULT_REQUEST_TIMEOUT
+        headers = dict(headers or {})
+        if cookies:
+            headers["Cookie"] = "; ".join(f"{key}={value}" for key, value in cookies.items())
+        timings = request_timings()
+        extensions = None if timings is None else {"trace": _trace(timings)}
+
+        client = cls._client(verify, proxies)
+        try:
+            async with client.stream(
+                method.value,
+                url,
+                headers=headers,
+                follow_redirects=allow_redirects,
+                timeout=timeout,
+                extensions=extensions,
+                **{body_encoding.value: body},
+            ) as response:
+                result = Response(
+                    response.status_code,
+                    url,
+                    response.reason_phrase,
+                    dict(response.headers),
+                    cookies=dict(response.cookies),
+                )
+                limits = get_body_limits()
+                if limits is None:
+                    result.raw = await response.aread()
+                else:
+                    result.raw = await cls._read(response, limits, result)
+        except httpx.TimeoutException as e:
+            raise RequestTimeoutError(f"요청시간이 경과하였습니다. -> {timeout}초") from e
+
+        try:
+            # aiohttp 커넥터와 같이 디코딩할 수 없는 본문(이미지)은 빈 문자열
+            result.text = result.raw.decode(response.encoding or "utf-8")
+        except (LookupError, UnicodeDecodeError):
+            pass
+        return result
+
+    @staticmethod
+    async def _read(response: httpx.Response, limits: BodyLimits, result: Response) -> bytes:
+        """ 본문을 나누어 받으며 제한을 넘으면 나머지를 받지 않고 예외 발생 (연결은 닫힘) """
+        limits.check_headers(result)
+        chunks = []
+        size = 0
+        async for chunk in response.aiter_bytes():
+            size += len(chunk)
+            limits.check_size(size, result)
+            chunks.append(chunk)
+        return b"".join(chunks)
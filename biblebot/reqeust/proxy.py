@@ -0,0 +1,65 @@
+""" 여러 프록시(egress IP)에 요청을 분산하기 위한 프록시 풀 """
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Sequence
+import enum
+import threading
+
+__all__ = (
+    "ProxySelection",
+    "ProxyPool",
+)
+
+
+@enum.unique
+class ProxySelection(enum.Enum):
+    # 순서대로 돌아가며 선택
+    ROUND_ROBIN = "round_robin"
+    # 진행 중인 요청이 가장 적은 프록시 선택 (같으면 순서대로)
+    LEAST_LOADED = "least_loaded"
+
+
+class ProxyPool:
+    """ 프록시 URL 목록과 선택 방식
+
+    acquire 로 선택한 프록시는 요청이 끝난 뒤 release 해야 함 (lease 컨텍스트 매니저 사용 권장)
+    여러 스레드, 이벤트 루프에서 함께 사용할 수 있음
+    """
+
+    def __init__(
+        self, urls: Sequence[str], selection: ProxySelection = ProxySelection.ROUND_ROBIN
+    ):
+        if not urls:
+            raise ValueError("프록시 URL 이 하나 이상 필요합니다.")
+        self.urls: List[str] = list(urls)
+        self.selection = selection
+        # 프록시 URL -> 진행 중인 요청 수
+        self.in_flight: Dict[str, int] = dict.fromkeys(self.urls, 0)
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> str:
+        with self._lock:
+            count = len(self.urls)
+            start = self._next
+            self._next = (start + 1) % count
+            if self.selection is ProxySelection.ROUND_ROBIN:
+                url = self.urls[start]
+            else:
+                url = min(
+                    (self.urls[(start + offset) % count] for offset in range(count)),
+                    key=self.in_flight.__getitem__,
+                )
+            self.in_flight[url] += 1
+            return url
+
+    def release(self, url: str):
+        with self._lock:
+            self.in_flight[url] -= 1
+
+    @contextmanager
+    def lease(self) -> Iterator[str]:
+        url = self.acquire()
+        try:
+            yield url
+        finally:
+            self.release(url)
@@ -0,0 +1,28 @@
+""" 초당 요청 수 제한 """
+import asyncio
+
+__all__ = ("RateLimiter",)
+
+
+class RateLimiter:
+    """ 요청 시작 간격을 1/rate 초 이상으로 유지 (burst 개까지는 간격 없이 시작)
+
+    한 이벤트 루프 안의 여러 태스크에서 함께 사용할 수 있음 (스레드 간 공유는 지원하지 않음)
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        if rate <= 0:
+            raise ValueError("rate 는 0 보다 커야 합니다.")
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self._interval = 1.0 / rate
+        # 다음 요청을 시작할 수 있는 시각 (loop.time 기준)
+        self._next = 0.0
+
+    async def acquire(self):
+        now = asyncio.get_running_loop().time()
+        # 쉬는 동안 쌓인 여유는 burst 개까지만 인정
+        at = max(self._next, now - self._interval * (self.burst - 1))
+        self._next = at + self._interval
+        if at > now:
+            await asyncio.sleep(at - now)
@@ -0,0 +1,265 @@
+""" 녹화/재생 커넥터
+
+녹화(record_connector): 실제 커넥터로 보낸 요청과 응답(상태 코드, 헤더, 원본 본문, 쿠키, 소요 시간)을 Archive 에 기록
+재생(replay_connector): 네트워크 없이 Archive 에 기록된 응답을 반환 (지연 시간 재현은 선택)
+
+    from biblebot import HTTPClient
+    from biblebot.reqeust.aiohttp_conn import Request
+    from biblebot.reqeust.replay_conn import Archive, record_connector, replay_connector
+
+    archive = Archive()
+    HTTPClient.set(record_connector(Request, archive))
+    # ...
+    archive.save("session.zip")
+
+    HTTPClient.set(replay_connector(Archive.load("session.zip")))
+
+Archive 는 zip 파일로, index.json 과 내용 해시(sha1)로 중복을 제거한 본문(blobs/)으로 구성됨
+요청은 메서드, URL, 요청 본문의 해시로 구분하며, 같은 요청이 여러 번 녹화된 경우 재생할 때 녹화된 순서대로 반복함
+요청 헤더와 쿠키는 구분에 사용하지 않음 (세션마다 값이 다르므로)
+
+Archive 에는 응답 쿠키(세션)가 그대로 저장되므로 외부에 공유하지 말 것
+
+녹화/재생 커넥터는 HTTPClient.registry 에 등록되지 않으므로 set_auto 로 선택되지 않음 (HTTPClient.set, use 로 지정)
+"""
+from typing import Any, ClassVar, Dict, List, Optional, Tuple, Type
+import asyncio
+import hashlib
+import itertools
+import json
+import os
+import threading
+import time
+import zipfile
+
+from .base import (
+    BaseRequest,
+    Response,
+    HTTPRequestMethod,
+    BodyFormatter,
+    DEFAULT_REQUEST_TIMEOUT,
+    get_body_limits,
+)
+from ..exceptions import RequestError, RequestTimeoutError
+
+__all__ = (
+    "Archive",
+    "record_connector",
+    "replay_connector",
+    "ReplayRequest",
+)
+
+_INDEX: str = "index.json"
+_VERSION: int = 1
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.sha1(data).hexdigest()
+
+
+def _request_key(
+    method: HTTPRequestMethod, url: str, body: Optional[Dict[str, Any]]
+) -> str:
+    if not body:
+        return f"{method.value} {url}"
+    encoded = json.dumps(body, sort_keys=True, ensure_ascii=False, default=str)
+    return f"{method.value} {url} {_digest(encoded.encode('utf-8'))}"
+
+
+def _charset(headers: Dict[str, str]) -> Optional[str]:
+    for param in headers.get("content-type", "").split(";")[1:]:
+        name, _, value = param.strip().partition("=")
+        if name.lower() == "charset" and value:
+            return value.strip("\"'")
+    return None
+
+
+class Archive:
+    """ 녹화된 요청/응답 쌍 저장소 (스레드 안전) """
+
+    def __init__(self):
+        # 요청 키 -> 녹화된 응답 목록 (녹화 순서)
+        self.entries: Dict[str, List[Dict[str, Any]]] = {}
+        self.blobs: Dict[str, bytes] = {}
+        self._cursors: Dict[str, "itertools.count[int]"] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return sum(len(each) for each in self.entries.values())
+
+    def _blob(self, data: bytes) -> str:
+        digest = _digest(data)
+        self.blobs.setdefault(digest, data)
+        return digest
+
+    def add(
+        self,
+        method: HTTPRequestMethod,
+        url: str,
+        body: Optional[Dict[str, Any]],
+        response: Response,
+        elapsed: float = 0.0,
+    ):
+        """ 응답 녹화
+
+        text 는 원본 본문을 디코딩한 값과 같으면 인코딩 이름만 기록하고,
+        커넥터가 디코딩하지 못한 경우(빈 문자열)와 그 외의 경우를 구분하여 그대로 복원함
+        """
+        text: Any = None
+        if response.text:
+            for encoding in filter(None, (_charset(response.headers), "utf-8")):
+                try:
+                    if response.raw.decode(encoding) == response.text:
+                        text = encoding
+                        break
+                except (LookupError, UnicodeDecodeError):
+                    continue
+        with self._lock:
+            if response.text and text is None:
+                text = {"blob": self._blob(response.text.encode("utf-8"))}
+            entry = {
+                "status": response.status,
+                "url": response.url,
+                "reason": response.reason,
+                "headers": dict(response.headers),
+                "cookies": dict(response.cookies),
+                "raw": self._blob(response.raw),
+                "text": text,
+                "elapsed": round(elapsed, 6),
+            }
+            self.entries.setdefault(_request_key(method, url, body), []).append(entry)
+
+    def get(
+        self, method: HTTPRequestMethod, url: str, body: Optional[Dict[str, Any]]
+    ) -> Optional[Tuple[Response, float]]:
+        """ 녹화된 (응답, 소요 시간), 녹화된 응답이 여러 개면 호출할 때마다 다음 응답 """
+        key = _request_key(method, url, body)
+        recorded = self.entries.get(key)
+        if not recorded:
+            return None
+        with self._lock:
+            cursor = self._cursors.setdefault(key, itertools.count())
+            entry = recorded[next(cursor) % len(recorded)]
+        raw = self.blobs[entry["raw"]]
+        text = entry["text"]
+        if text is None:
+            text = ""
+        elif isinstance(text, dict):
+            text = self.blobs[text["blob"]].decode("utf-8")
+        else:
+            text = raw.decode(text)
+        response = Response(
+            entry["status"],
+            entry["url"],
+            entry["reason"],
+            dict(entry["headers"]),
+            raw,
+            text,
+            dict(entry["cookies"]),
+        )
+        return response, entry["elapsed"]
+
+    def save(self, path: str):
+        """ zip 파일로 저장 (임시 파일에 기록한 뒤 교체) """
+        with self._lock:
+            index = {"version": _VERSION, "entries": self.entries}
+            blobs = dict(self.blobs)
+        temporary = f"{path}.tmp"
+        with zipfile.ZipFile(temporary, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr(_INDEX, json.dumps(index, ensure_ascii=False, separators=(",", ":")))
+            for digest, data in blobs.items():
+                archive.writestr(f"blobs/{digest}", data)
+        os.replace(temporary, path)
+
+    @classmethod
+    def load(cls, path: str) -> "Archive":
+        archive = cls()
+        with zipfile.ZipFile(path) as f:
+            index = json.loads(f.read(_INDEX).decode("utf-8"))
+            if index.get("version") != _VERSION:
+                raise ValueError(f"지원하지 않는 아카이브 버전입니다. -> {index.get('version')}")
+            archive.entries = index["entries"]
+            for name in f.namelist():
+                if name.startswith("blobs/"):
+                    archive.blobs[name[len("blobs/"):]] = f.read(name)
+        return archive
+
+
+def record_connector(base: Type[BaseRequest], archive: Archive) -> Type[BaseRequest]:
+    """ base 커넥터로 요청을 보내고 응답을 archive 에 녹화하는 커넥터 """
+
+    class RecordConnector(base):
+        @classmethod
+        async def _request(
+            cls,
+            method: HTTPRequestMethod,
+            url: str,
+            *,
+            body: Optional[Dict[str, str]] = None,
+            **kwargs: Any,
+        ) -> Response:
+            start = time.perf_counter()
+            response = await super()._request(method, url, body=body, **kwargs)
+            archive.add(method, url, body, response, time.perf_counter() - start)
+            return response
+
+    RecordConnector.__name__ = RecordConnector.__qualname__ = f"Record{base.__name__}"
+    return RecordConnector
+
+
+class ReplayRequest(BaseRequest):
+    """ archive 에 녹화된 응답을 반환하는 커넥터 (replay_connector 로 생성)
+
+    latency: 응답마다 추가할 지연 시간(초)
+    time_scale: 녹화된 소요 시간에 곱할 배율 (0 이면 녹화된 지연 시간을 재현하지 않음)
+    지연 시간이 timeout 을 넘으면 RequestTimeoutError
+    본문 제한(reqeust.body_limits)은 녹화된 응답 전체를 받은 것으로 보고 검사
+    """
+
+    archive: ClassVar[Optional[Archive]] = None
+    latency: ClassVar[float] = 0.0
+    time_scale: ClassVar[float] = 0.0
+
+    @classmethod
+    async def _request(
+        cls,
+        method: HTTPRequestMethod,
+        url: str,
+        *,
+        headers: Optional[Dict[str, str]] = None,
+        body: Optional[Dict[str, str]] = None,
+        body_encoding: BodyFormatter = BodyFormatter.URL_ENCODE,
+        cookies: Dict[str, str] = None,
+        verify: bool = True,
+        allow_redirects: bool = False,
+        timeout: Optional[float] = None,
+        proxies: Optional[str] = None,
+    ) -> Response:
+        if cls.archive is None:
+            raise RequestError("재생할 아카이브가 없습니다. replay_connector 로 생성해주세요.")
+        recorded = cls.archive.get(method, url, body)
+        if recorded is None:
+            raise RequestError(f"녹화된 응답이 없습니다. -> {method.value} {url}")
+        response, elapsed = recorded
+
+        delay = cls.latency + elapsed * cls.time_scale
+        if delay > 0:
+            timeout = timeout or DEFAULT_REQUEST_TIMEOUT
+            if delay > timeout:
+                await asyncio.sleep(timeout)
+                raise RequestTimeoutError(f"요청시간이 경과하였습니다. -> {timeout}초")
+            await asyncio.sleep(delay)
+        limits = get_body_limits()
+        if limits is not None:
+            limits.check(response)
+        return response
+
+
+def replay_connector(
+    archive: Archive, *, latency: float = 0.0, time_scale: float = 0.0
+) -> Type[ReplayRequest]:
+    return type(
+        "ReplayRequest",
+        (ReplayRequest,),
+        {"archive": archive, "latency": latency, "time_scale": time_scale},
+    )
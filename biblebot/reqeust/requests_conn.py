@@ -3,11 +3,12 @@ try:
 except ImportError:
     raise ImportError("이 커넥터는 호출할 수 없습니다. 패키지를 설치해주세요.")
 
-from typing import Optional, Dict
+from typing import Optional, Dict, Tuple
 from functools import partial
 import asyncio
 
 import urllib3
+from requests.compat import chardet
 
 from .base import (
     BaseRequest,
@@ -15,12 +16,62 @@ from .base import (
     HTTPRequestMethod,
     BodyFormatter,
     DEFAULT_REQUEST_TIMEOUT,
+    BodyLimits,
+    get_body_limits,
 )
 from ..exceptions import RequestTimeoutError
+from ..hooks import request_timings
 
 
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+# 본문 크기 제한이 있을 때 한 번에 읽는 크기
+_CHUNK_SIZE = 64 * 1024
+
+
+def _send(
+    method: str, url: str, limits: Optional[BodyLimits], **kwargs
+) -> Tuple[requests.models.Response, Response]:
+    """ 요청을 보내고 본문까지 받음 (스레드 풀에서 실행)
+
+    본문 제한이 있으면 나누어 받으며 제한을 넘으면 나머지를 받지 않고 예외 발생
+    """
+    response = requests.request(method, url, stream=limits is not None, **kwargs)
+    try:
+        result = Response(
+            response.status_code,
+            url,
+            response.reason,
+            response.headers,
+            cookies=response.cookies.get_dict(),
+        )
+        if limits is None:
+            result.raw, result.text = response.content, response.text
+            return response, result
+        limits.check_headers(result)
+        chunks = []
+        size = 0
+        for chunk in response.iter_content(_CHUNK_SIZE):
+            size += len(chunk)
+            limits.check_size(size, result)
+            chunks.append(chunk)
+        result.raw = b"".join(chunks)
+        result.text = _decode(response, result.raw)
+        return response, result
+    finally:
+        response.close()
+
+
+def _decode(response: requests.models.Response, raw: bytes) -> str:
+    """ requests.Response.text 와 같은 방식으로 디코딩 """
+    if not raw:
+        return ""
+    encoding = response.encoding or chardet.detect(raw)["encoding"]
+    try:
+        return str(raw, encoding, errors="replace")
+    except (LookupError, TypeError):
+        return str(raw, errors="replace")
+
 
 class Request(BaseRequest):
     @classmethod
@@ -41,12 +92,13 @@ class Request(BaseRequest):
         timeout = timeout or DEFAULT_REQUEST_TIMEOUT
         proxies = None if proxies is None else {"http": proxies, "https": proxies}
         try:
-            response: requests.models.Response = await asyncio.get_event_loop().run_in_executor(
+            response, result = await asyncio.get_event_loop().run_in_executor(
                 None,
                 partial(
-                    requests.request,
+                    _send,
                     method.value,
                     url,
+                    get_body_limits(),
                     headers=headers,
                     cookies=cookies,
                     verify=verify,
@@ -56,18 +108,10 @@ class Request(BaseRequest):
                     **{body_encoding.value: body},
                 ),
             )
-        except requests.exceptions.ConnectTimeout as e:
+        except requests.exceptions.Timeout as e:
             raise RequestTimeoutError(f"요청시간이 경과하였습니다. -> {timeout}초") from e
-        try:
-            cookies = response.cookies.get_dict()
-            return Response(
-                response.status_code,
-                url,
-                response.reason,
-                response.headers,
-                response.content,
-                response.text,
-                cookies,
-            )
-        finally:
-            response.close()
+        timings = request_timings()
+        if timings is not None:
+            # 요청을 보낸 뒤 응답 헤더를 받을 때까지의 시간, DNS 조회와 연결 시간은 측정할 수 없음
+            timings["ttfb"] = response.elapsed.total_seconds()
+        return result
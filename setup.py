@@ -26,7 +26,12 @@ setup(
     url=about["__url__"],
     packages=find_packages(),
     install_requires=["beautifulsoup4 >= 4.8.0"],
-    extras_require={"http": ["aiohttp[speedups]>=3.6.2"]},
+    extras_require={
+        "http": ["aiohttp[speedups]>=3.6.2"],
+        "http2": ["httpx[http2]>=0.23.0"],
+        "msgpack": ["msgpack>=1.0.0"],
+        "parquet": ["pyarrow>=1.0.0"],
+    },
     python_requires=">=3.7",
     classifiers=[
         "License :: OSI Approved :: MIT License",
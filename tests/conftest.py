@@ -0,0 +1,81 @@
+""" 네트워크 없이 마일리지 시트(ddd.sheetAction) 응답을 흉내 내는 커넥터 """
+from typing import Dict, List, Optional, Set, Tuple
+import asyncio
+
+import pytest
+
+from biblebot.api.base import HTTPClient
+from biblebot.exceptions import RequestTimeoutError
+from biblebot.reqeust.base import BaseRequest, HTTPRequestMethod, Response
+
+_EXPIRED = (
+    '<?xml version="1.0"?><SHEET><MESSAGE>'
+    "<![CDATA[세션정보가 존재하지 않습니다.]]></MESSAGE></SHEET>"
+)
+
+
+class FakeSheet:
+    """ page_no, page_size 로 total 개의 행을 나누어 응답
+
+    행의 모든 열 값은 "회원번호:행번호" 이며 요청은 (CST_NO, page_no, page_size) 로 기록됨
+    """
+
+    def __init__(self, total: int = 1000):
+        self.total = total
+        self.requests: List[Tuple[str, int, int]] = []
+        # 이 크기 이상의 페이지 요청은 RequestTimeoutError
+        self.timeout_size: Optional[int] = None
+        # 이 회원번호의 요청은 세션 만료 응답
+        self.expired: Set[str] = set()
+        # 요청마다 응답을 보내기 전 대기 시간(초)
+        self.delay = 0.0
+        # 처리 중인 요청 수
+        self.active = 0
+
+    async def respond(self, url: str, body: Dict[str, str]) -> Response:
+        customer_id, page, size = body["CST_NO"], int(body["page_no"]), int(body["page_size"])
+        self.requests.append((customer_id, page, size))
+        self.active += 1
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+        if self.timeout_size is not None and size >= self.timeout_size:
+            raise RequestTimeoutError("요청 시간이 초과되었습니다.")
+        if customer_id in self.expired:
+            text = _EXPIRED
+        else:
+            columns = len(body["S_SAVENAME"].split("|"))
+            start = (page - 1) * size
+            rows = "".join(
+                "<TR>" + f"<TD>{customer_id}:{i}</TD>" * columns + "</TR>"
+                for i in range(start, min(start + size, self.total))
+            )
+            text = (
+                f'<?xml version="1.0" encoding="UTF-8"?><SHEET><DATA TOTAL="{self.total}">{rows}</DATA>'
+                f'<ETC-DATA><ETC KEY="total_rows">{self.total}</ETC></ETC-DATA><MESSAGE></MESSAGE></SHEET>'
+            )
+        return Response(
+            status=200,
+            url=url,
+            headers={"content-type": "text/xml; charset=UTF-8"},
+            raw=text.encode(),
+            text=text,
+        )
+
+
+class FakeSheetRequest(BaseRequest):
+    sheet: FakeSheet
+
+    @classmethod
+    async def _request(
+        cls, method: HTTPRequestMethod, url: str, *, body: Optional[Dict[str, str]] = None, **kwargs
+    ) -> Response:
+        return await cls.sheet.respond(url, body)
+
+
+@pytest.fixture
+def sheet():
+    FakeSheetRequest.sheet = sheet = FakeSheet()
+    with HTTPClient.use(FakeSheetRequest):
+        yield sheet
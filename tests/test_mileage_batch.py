@@ -0,0 +1,91 @@
+import asyncio
+
+import pytest
+
+from biblebot.api._mileage import StatementParamData
+from biblebot.api.mileage_batch import iter_statements
+from biblebot.exceptions import ResponseError, RequestTimeoutError
+
+
+def _customers(n: int):
+    return [str(i) for i in range(n)]
+
+
+def test_statements_for_every_customer(sheet):
+    sheet.total = 30
+
+    async def collect():
+        return [each async for each in iter_statements({}, _customers(20), concurrency=4, rate=None)]
+
+    results = asyncio.run(collect())
+    assert sorted(each.customer_id for each in results) == sorted(_customers(20))
+    for each in results:
+        assert each.error is None
+        assert [row[0] for row in each.body] == [f"{each.customer_id}:{i}" for i in range(30)]
+
+
+def test_break_cancels_in_flight_requests(sheet):
+    sheet.delay = 0.05
+
+    async def consume():
+        statements = iter_statements({}, _customers(100), concurrency=4, rate=None)
+        async for _ in statements:
+            break
+        # break 후 비동기 생성기가 정리될 때(aclose) 진행 중인 요청이 취소됨
+        await statements.aclose()
+        assert sheet.active == 0
+        started = len(sheet.requests)
+        await asyncio.sleep(sheet.delay * 3)
+        # 결과 큐에서 대기하는 워커도 남지 않아야 함
+        assert asyncio.all_tasks() == {asyncio.current_task()}
+        return started
+
+    started = asyncio.run(consume())
+    assert sheet.active == 0
+    assert len(sheet.requests) == started < 100
+
+
+def test_close_while_result_queue_is_full(sheet):
+    sheet.total = 10
+
+    async def consume():
+        statements = iter_statements({}, _customers(100), concurrency=2, rate=None)
+        async for _ in statements:
+            break
+        # 소비하지 않는 동안 워커가 결과 큐를 채우고 대기함
+        await asyncio.sleep(0.1)
+        await asyncio.wait_for(statements.aclose(), 1.0)
+        assert asyncio.all_tasks() == {asyncio.current_task()}
+
+    asyncio.run(consume())
+
+
+def test_error_data_aborts_and_cancels_workers(sheet):
+    sheet.delay = 0.05
+    sheet.expired.add("3")
+
+    async def consume():
+        with pytest.raises(ResponseError):
+            async for _ in iter_statements({}, _customers(100), concurrency=4, rate=None):
+                pass
+        assert sheet.active == 0
+        started = len(sheet.requests)
+        await asyncio.sleep(sheet.delay * 3)
+        # 결과 큐에서 대기하는 워커도 남지 않아야 함
+        assert asyncio.all_tasks() == {asyncio.current_task()}
+        return started
+
+    started = asyncio.run(consume())
+    assert len(sheet.requests) == started < 100
+
+
+def test_customer_errors_are_returned(sheet):
+    sheet.timeout_size = 2000
+    param = StatementParamData()
+
+    async def collect():
+        return [each async for each in iter_statements({}, _customers(3), param, rate=None)]
+
+    results = asyncio.run(collect())
+    assert len(results) == 3
+    assert all(isinstance(each.error, RequestTimeoutError) for each in results)
@@ -0,0 +1,58 @@
+from typing import List, Optional
+import asyncio
+
+import pytest
+
+from biblebot.api._mileage import SearchParamData
+from biblebot.api.mileage_export import AdaptivePageSize, iter_pages
+from biblebot.exceptions import RequestTimeoutError
+
+
+def _rows(param: SearchParamData, adaptive: Optional[AdaptivePageSize] = None) -> List[int]:
+    async def collect():
+        rows = []
+        async for page in iter_pages({}, param, adaptive=adaptive):
+            rows.extend(int(row[0].split(":")[1]) for row in page.data["body"])
+        return rows
+
+    return asyncio.run(collect())
+
+
+@pytest.mark.parametrize("page_no, page_size", [("1", "50"), ("3", "50"), ("1", "300"), ("2", "150")])
+@pytest.mark.parametrize("adaptive", [False, True])
+def test_pages_cover_every_row_once(sheet, page_no, page_size, adaptive):
+    param = SearchParamData(page_no=page_no, page_size=page_size)
+    rows = _rows(param, AdaptivePageSize(max_size=400) if adaptive else None)
+
+    start = (int(page_no) - 1) * int(page_size)
+    assert rows == list(range(start, sheet.total))
+    # 첫 페이지는 param 의 page_size 보다 크게 요청하지 않음
+    _, first_page, first_size = sheet.requests[0]
+    assert first_size <= int(page_size)
+    assert (first_page - 1) * first_size == start
+
+
+def test_adaptive_page_size_grows_on_aligned_boundaries(sheet):
+    rows = _rows(SearchParamData(page_size="100"), AdaptivePageSize(max_size=400))
+
+    assert rows == list(range(sheet.total))
+    assert [size for _, _, size in sheet.requests] == [100, 100, 200, 400, 400]
+
+
+def test_shrink_retries_from_same_offset(sheet):
+    sheet.timeout_size = 400
+    rows = _rows(SearchParamData(page_size="400"), AdaptivePageSize(max_size=800))
+
+    assert rows == list(range(sheet.total))
+    for (_, page, size), (_, next_page, next_size) in zip(sheet.requests, sheet.requests[1:]):
+        if size >= sheet.timeout_size:
+            assert next_size == size // 2
+            assert (next_page - 1) * next_size == (page - 1) * size
+
+
+@pytest.mark.parametrize("page_no, page_size", [("1", "100"), ("2", "150")])
+def test_shrink_gives_up_when_page_cannot_be_split(sheet, page_no, page_size):
+    sheet.timeout_size = 100
+    with pytest.raises(RequestTimeoutError):
+        _rows(SearchParamData(page_no=page_no, page_size=page_size), AdaptivePageSize())
+    assert len(sheet.requests) == 1
@@ -0,0 +1,58 @@
+import json
+import os
+
+import pytest
+
+from biblebot.api._mileage import SearchParamData
+from biblebot.api.mileage import Search
+from biblebot.profiling import Profiler
+from biblebot.reqeust import Response
+
+SHEET = (
+    '<?xml version="1.0" encoding="UTF-8"?><SHEET><DATA TOTAL="2">'
+    "<TR><TD>100000</TD><TD>정우성</TD><TD>201513140</TD><TD>010-1234-5678</TD><TD>64939</TD></TR>"
+    "<TR><TD>100001</TD><TD><![CDATA[홍길동]]></TD><TD>201571479</TD><TD>01098765432</TD><TD>85956</TD></TR>"
+    '</DATA><ETC-DATA><ETC KEY="total_rows">2</ETC></ETC-DATA><MESSAGE></MESSAGE></SHEET>'
+)
+
+
+@pytest.fixture
+def profiler(tmp_path):
+    Profiler.enable(str(tmp_path), parse_threshold=0.0, fetch_threshold=0.0)
+    try:
+        yield tmp_path
+    finally:
+        Profiler.disable()
+
+
+def _saved(directory):
+    with open(os.path.join(directory, "manifest.json"), encoding="utf-8") as f:
+        (entry,) = json.load(f)
+    with open(os.path.join(directory, entry["body"]), encoding="utf-8") as f:
+        return entry, f.read()
+
+
+def test_default_patterns_mask_phone_and_card_numbers(profiler):
+    assert Profiler.redact("학번 201513140 전화 010-1234-5678") == "학번 000000000 전화 000-0000-0000"
+    assert Profiler.redact("카드 1234-5678-9012-3456, 01098765432") == "카드 0000-0000-0000-0000, 00000000000"
+    # 날짜, 금액은 가리지 않음
+    assert Profiler.redact("2019-03-14 1,234,567") == "2019-03-14 1,234,567"
+
+
+def test_mileage_sheet_cells_are_redacted_by_field(profiler):
+    param = SearchParamData(S_SAVENAME="CST_NO|CST_NM|CST_CARD_NO|HP_NO|AVL_POINT")
+    param.set_customer_id("100000")
+    response = Response(200, "https://asp.netusys.com/ddd.sheetAction", "", {}, SHEET.encode(), SHEET)
+    response.etc["req"] = param
+
+    # 프로파일링 모드에서는 계측된 parse 가 응답을 저장함
+    Search.parse(response)
+    entry, body = _saved(profiler)
+
+    for value in ("100000", "정우성", "201513140", "010-1234-5678", "홍길동", "01098765432"):
+        assert value not in body
+    assert "<TD>000000</TD><TD>가가가</TD>" in body
+    assert "<TD><![CDATA[가가가]]></TD>" in body
+    # 가리지 않는 열(포인트)은 그대로
+    assert "<TD>64939</TD>" in body and "<TD>85956</TD>" in body
+    assert "100000" not in json.dumps(entry["etc"])
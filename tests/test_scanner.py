@@ -0,0 +1,91 @@
+""" DOM 없이 훑는 스캐너(reqeust._scanner)와 BeautifulSoup 결과 비교 """
+import glob
+import os
+
+import pytest
+from bs4 import BeautifulSoup
+
+from biblebot.api.common import extract_alerts
+from biblebot.reqeust._scanner import scan_alerts, scan_element_text, scan_scripts
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks", "fixtures")
+FIXTURES = sorted(glob.glob(os.path.join(FIXTURE_DIR, "*", "*.html")))
+
+ALERT_SNIPPETS = (
+    "<script>alert('로그인 실패');</script>",
+    '<SCRIPT type="text/javascript">alert("upper")</SCRIPT >',
+    "<script><!-- alert('old style'); //--></script>",
+    '<!-- <script>alert("commented")</script> --><script>alert("real")</script>',
+    '<style>a{}/*<script>alert("style")</script>*/</style><script>alert("real")</script>',
+    "<!-- <script>alert('unclosed comment')</script>",
+    "<script>alert('unclosed script')",
+    "<script></script><script>alert(x)</script>",
+)
+
+ELEMENT_SNIPPETS = (
+    ("<h2>서버 과부하</h2><p>잠시 후 다시 시도하세요.</p>", "h2", None),
+    ("<h2>서버 과부하</h2><p>잠시 후 다시 시도하세요.</p>", "p", None),
+    ("<H2 id=t>대문자 <b>태그</b></H2>", "h2", None),
+    ("<p>x &amp; &lt;y&gt; &#54620;</p>", "p", None),
+    ("<!-- <p>old</p> --><p>real</p>", "p", None),
+    ('<script>x="<h2>js</h2>"</script><h2>real</h2>', "h2", None),
+    ("<style>p:before{content:'<p>css</p>'}</style><p>real</p>", "p", None),
+    ("<![CDATA[<p>cdata</p>]]><p>real</p>", "p", None),
+    ("<!-- <p>unclosed comment", "p", None),
+    ("<div>no heading</div>", "h2", None),
+    ('<div class="alert alert-warning">\n  비밀번호가 틀렸습니다.\n</div>', None, "alert-warning"),
+    ("<div class='alert-warning-box'>x</div><span class=alert-warning>y</span>", None, "alert-warning"),
+    ('<!-- <div class="alert-warning">old</div> --><p>no warning</p>', None, "alert-warning"),
+)
+
+# 스캐너가 정확히 추출할 수 없어 None(soup 으로 처리)을 반환해야 하는 경우
+UNSCANNABLE_SNIPPETS = (
+    ("<h2>a<!-- c -->b</h2>", "h2"),
+    ("<p>a<script>x</script>b</p>", "p"),
+    ("<p>outer<p>inner</p></p>", "p"),
+    ("<p>unclosed", "p"),
+)
+
+
+def _read(path: str) -> str:
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+def _soup(text: str) -> BeautifulSoup:
+    return BeautifulSoup(text, features="html.parser")
+
+
+@pytest.mark.parametrize("text", ALERT_SNIPPETS)
+def test_alerts_match_soup(text):
+    assert scan_alerts(scan_scripts(text)) == extract_alerts(_soup(text))
+
+
+@pytest.mark.parametrize("path", FIXTURES, ids=os.path.basename)
+def test_fixture_alerts_match_soup(path):
+    text = _read(path)
+    assert scan_alerts(scan_scripts(text)) == extract_alerts(_soup(text))
+
+
+def _soup_element_text(text: str, tag, class_) -> str:
+    element = _soup(text).find(tag, class_=class_)
+    return element.get_text() if element else ""
+
+
+@pytest.mark.parametrize("text, tag, class_", ELEMENT_SNIPPETS)
+def test_element_text_matches_soup(text, tag, class_):
+    assert scan_element_text(text, tag, class_) == _soup_element_text(text, tag, class_)
+
+
+@pytest.mark.parametrize("text, tag", UNSCANNABLE_SNIPPETS)
+def test_element_text_falls_back_to_soup(text, tag):
+    assert scan_element_text(text, tag) is None
+
+
+@pytest.mark.parametrize("path", FIXTURES, ids=os.path.basename)
+@pytest.mark.parametrize("tag, class_", [("h2", None), ("p", None), (None, "alert-warning")])
+def test_fixture_element_text_matches_soup(path, tag, class_):
+    text = _read(path)
+    scanned = scan_element_text(text, tag, class_)
+    if scanned is not None:
+        assert scanned == _soup_element_text(text, tag, class_)
@@ -0,0 +1,47 @@
+""" 한 번에 순회하는 테이블 추출(common.extract_rows)과 셀마다 get_text 하는 방식의 결과 비교 """
+import glob
+import os
+
+import pytest
+from bs4 import BeautifulSoup
+
+from biblebot.api.common import extract_rows, to_columns
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks", "fixtures")
+FIXTURES = sorted(glob.glob(os.path.join(FIXTURE_DIR, "*", "*.html")))
+
+TABLE_SNIPPETS = (
+    "<table><tr><td> a </td><td>b<br/>c</td></tr><tr><td></td></tr></table>",
+    "<table><tbody><tr><td><span> x </span> <b>y</b></td><td>&nbsp;z&amp;</td></tr></tbody></table>",
+    "<table><tr><th>head</th><td>cell</td></tr><tr></tr></table>",
+    "<table><tr><td>a<!-- comment -->b</td><td><script>var x;</script>c</td></tr></table>",
+    "<table><tr><td>outer<table><tr><td>inner</td></tr></table></td><td>next</td></tr></table>",
+    "<table><tr><td>a<td>b</td></td></tr></table>",
+    "<div><tr><td>loose</td></tr></div>",
+)
+
+
+def _soup(text: str) -> BeautifulSoup:
+    return BeautifulSoup(text, features="html.parser")
+
+
+def _rows_by_get_text(container):
+    return [[td.get_text(strip=True) for td in tr.find_all("td")] for tr in container.find_all("tr")]
+
+
+@pytest.mark.parametrize("text", TABLE_SNIPPETS)
+def test_rows_match_get_text(text):
+    soup = _soup(text)
+    assert extract_rows(soup) == _rows_by_get_text(soup)
+
+
+@pytest.mark.parametrize("path", FIXTURES, ids=os.path.basename)
+def test_fixture_rows_match_get_text(path):
+    with open(path, encoding="utf-8") as f:
+        soup = _soup(f.read())
+    for container in soup.find_all(("table", "tbody")):
+        assert extract_rows(container) == _rows_by_get_text(container)
+
+
+def test_columns_pad_short_rows():
+    assert to_columns([["a", "b"], ["c"]], 3) == [("a", "c"), ("b", ""), ("", "")]